@@ -2,12 +2,12 @@
 NPC davranışları için yapay zeka modeli.
 """
 import os
-import random
 import numpy as np
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
 from pathlib import Path
+from verdes.systems.rng import rng
 
 class SimpleBehaviorNet(nn.Module):
     """Basit davranış sinir ağı"""
@@ -140,7 +140,7 @@ class BehaviorModel:
         
         if distance < 100:
             # Oyuncuya yakınsa
-            if random.random() < 0.7:
+            if rng.stream("ai").random() < 0.7:
                 # %70 oyuncuya doğru hareket
                 if abs(dx) > abs(dy):
                     return "right" if dx > 0 else "left"
@@ -148,12 +148,12 @@ class BehaviorModel:
                     return "down" if dy > 0 else "up"
             else:
                 # %30 rastgele hareket
-                return random.choice(["up", "right", "down", "left"])
+                return rng.stream("ai").choice(["up", "right", "down", "left"])
         else:
             # Oyuncudan uzaksa, rastgele dolaş
-            if random.random() < 0.3:
+            if rng.stream("ai").random() < 0.3:
                 # %30 hareket değiştir
-                return random.choice(["up", "right", "down", "left"])
+                return rng.stream("ai").choice(["up", "right", "down", "left"])
             else:
                 # %70 aynı yönde devam et
                 if npc.direction == "up":
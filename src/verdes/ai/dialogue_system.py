@@ -2,10 +2,10 @@
 Hafif NLP tabanlı diyalog sistemi.
 """
 import os
-import random
 import yaml
 import torch
 from pathlib import Path
+from verdes.systems.rng import rng
 
 class DialogueSystem:
     """AI tabanlı diyalog sistemi"""
@@ -139,7 +139,7 @@ class DialogueSystem:
         
         # Seçilen kategoriden rastgele yanıt
         responses = self.dialogue_data.get(category, self.dialogue_data["generic"])
-        return random.choice(responses)
+        return rng.stream("dialogue").choice(responses)
     
     def train_model(self, dialogue_samples):
         """Modeli yeni diyaloglarla eğit (çok basit örnek)"""
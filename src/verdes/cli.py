@@ -1,8 +1,12 @@
 """Console script for verdes."""
+import time
+from typing import Optional
+
 import verdes
 
 import typer
 from rich.console import Console
+from rich.table import Table
 
 app = typer.Typer()
 console = Console()
@@ -14,7 +18,33 @@ def main():
     console.print("Replace this message by putting your code into "
                "verdes.cli.main")
     console.print("See Typer documentation at https://typer.tiangolo.com/")
-    
+
+
+@app.command()
+def simulate(
+    days: int = typer.Option(28, help="Simüle edilecek gün sayısı"),
+    map_name: str = typer.Option("farm", "--map", help="Başlangıç haritası"),
+    dt: float = typer.Option(1 / 30, help="Sabit adım süresi (saniye)"),
+    seed: Optional[int] = typer.Option(None, help="Rastgelelik tohumu (tekrarlanabilir koşular için)"),
+    save: bool = typer.Option(False, help="Simülasyon sonunda haritayı kaydet"),
+):
+    """Oyunu ekransız ve gerçek zamandan bağımsız simüle et, özeti yazdır."""
+    from verdes.simulation import Simulation, load_config
+
+    simulation = Simulation(load_config(), map_name=map_name, dt=dt, seed=seed)
+    started = time.perf_counter()
+    try:
+        summary = simulation.run_days(days)
+    finally:
+        simulation.close(save)
+    elapsed = time.perf_counter() - started
+
+    table = Table(title=f"{days} gün simülasyonu ({elapsed:.2f} sn)")
+    table.add_column("Ölçüm")
+    table.add_column("Değer", justify="right")
+    for key, value in summary.items():
+        table.add_row(key, str(value))
+    console.print(table)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,159 @@
+"""
+Doku atlası - küçük sprite dosyalarını birkaç büyük sayfada toplar.
+
+Atlas ``tools/build_atlas.py`` ile üretilir: ``assets/images`` altındaki
+klasörler sayfalara paketlenir ve JSON dizinine her sprite'ın sayfası ve
+dikdörtgeni yazılır:
+
+    {"sheets": ["atlas_0.png", ...],
+     "sprites": {"tiles/grass_spring.png": [0, x, y, w, h], ...}}
+
+Çalışma anında her sayfa bir kez yüklenip ``convert_alpha`` ile dönüştürülür;
+sprite'lar sayfanın alt yüzeyleridir (piksel kopyası yoktur).
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import pygame
+
+# Atlasa paketlenen varlık klasörleri (assets/images altında)
+ATLAS_DIRECTORIES = ("tiles", "crops", "objects", "items", "characters")
+
+Rect = Tuple[int, int, int, int]
+
+
+def pack_rects(sizes: List[Tuple[int, int]], sheet_size: int = 1024,
+               padding: int = 1) -> List[Tuple[int, int, int]]:
+    """Boyutları raf (shelf) yöntemiyle sayfalara yerleştir
+
+    Her boyut için (sayfa, x, y) döndürür. Uzun sprite'lar önce yerleştirilir;
+    sayfadan büyük sprite'lar kendi sayfalarını alır.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placements: List[Optional[Tuple[int, int, int]]] = [None] * len(sizes)
+    sheet, x, y, shelf_height = 0, 0, 0, 0
+    used = False
+
+    for i in order:
+        width, height = sizes[i]
+        if width > sheet_size or height > sheet_size:
+            # Tek başına sayfa
+            if used:
+                sheet += 1
+            placements[i] = (sheet, 0, 0)
+            sheet, x, y, shelf_height, used = sheet + 1, 0, 0, 0, False
+            continue
+        if x + width > sheet_size:
+            # Yeni raf
+            x, y, shelf_height = 0, y + shelf_height + padding, 0
+        if y + height > sheet_size:
+            # Yeni sayfa
+            sheet, x, y, shelf_height = sheet + 1, 0, 0, 0
+        placements[i] = (sheet, x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+        used = True
+    return placements
+
+
+def build_atlas(source_dir, output_dir, directories: Iterable[str] = ATLAS_DIRECTORIES,
+                sheet_size: int = 1024, padding: int = 1, name: str = "atlas") -> dict:
+    """Klasörlerdeki PNG'leri sayfalara paketle, sayfaları ve JSON dizinini yaz"""
+    source_dir = Path(source_dir)
+    output_dir = Path(output_dir)
+    names, images = [], []
+    for directory in directories:
+        for path in sorted((source_dir / directory).rglob("*.png")):
+            names.append(path.relative_to(source_dir).as_posix())
+            images.append(pygame.image.load(str(path)))
+
+    placements = pack_rects([image.get_size() for image in images], sheet_size, padding)
+    sheet_count = max((sheet for sheet, _, _ in placements), default=-1) + 1
+
+    # Her sayfa yalnızca içeriği kadar büyük olur
+    extents = [[0, 0] for _ in range(sheet_count)]
+    for image, (sheet, x, y) in zip(images, placements):
+        extents[sheet][0] = max(extents[sheet][0], x + image.get_width())
+        extents[sheet][1] = max(extents[sheet][1], y + image.get_height())
+    sheets = [pygame.Surface(extent, pygame.SRCALPHA) for extent in extents]
+
+    sprites = {}
+    for sprite_name, image, (sheet, x, y) in zip(names, images, placements):
+        sheets[sheet].blit(image, (x, y))
+        sprites[sprite_name] = [sheet, x, y, image.get_width(), image.get_height()]
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    sheet_files = []
+    for index, surface in enumerate(sheets):
+        sheet_file = f"{name}_{index}.png"
+        pygame.image.save(surface, str(output_dir / sheet_file))
+        sheet_files.append(sheet_file)
+
+    index = {"sheets": sheet_files, "sprites": sprites}
+    with open(output_dir / f"{name}.json", "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    return index
+
+
+class TextureAtlas:
+    """JSON dizinli atlas sayfalarından sprite alt yüzeyleri
+
+    Sayfalar ilk kullanımda yüklenir. Ekran modu ayarlıysa sayfa bir kez
+    ``convert_alpha`` ile dönüştürülür ve o sayfanın alt yüzeyleri dönüşmüş
+    sayfadan yeniden oluşturulur.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = Path(index_path)
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        self.sheet_paths = [self.index_path.parent / sheet for sheet in index["sheets"]]
+        self.entries: Dict[str, List[int]] = index["sprites"]
+        self._sheets: Dict[int, pygame.Surface] = {}
+        self._converted = set()
+        self._subsurfaces: Dict[str, pygame.Surface] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, index_path) -> Optional["TextureAtlas"]:
+        """Atlas dizini varsa yükle, yoksa None"""
+        if not Path(index_path).exists():
+            return None
+        return cls(index_path)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _sheet(self, index: int) -> pygame.Surface:
+        sheet = self._sheets.get(index)
+        if sheet is None:
+            sheet = self._sheets[index] = pygame.image.load(str(self.sheet_paths[index]))
+        if index not in self._converted and pygame.display.get_surface():
+            sheet = self._sheets[index] = sheet.convert_alpha()
+            self._converted.add(index)
+            # Eski (dönüşmemiş) sayfanın alt yüzeylerini bırak
+            self._subsurfaces = {name: surface for name, surface in self._subsurfaces.items()
+                                 if self.entries[name][0] != index}
+        return sheet
+
+    def get(self, name: str) -> Optional[pygame.Surface]:
+        """Sprite'ın alt yüzeyi (atlasta yoksa None)"""
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+        with self._lock:
+            sheet_index, x, y, width, height = entry
+            sheet = self._sheet(sheet_index)
+            surface = self._subsurfaces.get(name)
+            if surface is None:
+                surface = self._subsurfaces[name] = sheet.subsurface((x, y, width, height))
+            return surface
+
+    def is_converted(self, name: str) -> bool:
+        """Sprite'ın sayfası ekran biçimine dönüştürüldü mü?"""
+        entry = self.entries.get(name)
+        return entry is not None and entry[0] in self._converted
@@ -0,0 +1,63 @@
+"""
+Toplu çizim - katman başına (yüzey, hedef) çiftlerini tek ``Surface.blits`` çağrısıyla çizer.
+"""
+from functools import lru_cache
+from typing import List, Tuple
+import pygame
+
+
+class RenderBatch:
+    """Bir karedeki çizimleri toplayıp tek seferde gönderen katman
+
+    Zemin, bitki, nesne ve karakter katmanları her ilkel için ayrı çizim
+    çağrısı yapmak yerine ``add`` ile çiftleri biriktirir; ``flush`` hepsini
+    tek ``blits`` çağrısıyla hedefe çizer. Liste kareler arasında yeniden
+    kullanılır.
+    """
+
+    def __init__(self):
+        self._items: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, surface: pygame.Surface, dest) -> None:
+        """Yüzeyi sol üst köşesi ``dest`` olacak şekilde ekle"""
+        self._items.append((surface, dest))
+
+    def add_centered(self, surface: pygame.Surface, center_x: float, center_y: float) -> None:
+        """Yüzeyi merkezi (center_x, center_y) olacak şekilde ekle"""
+        width, height = surface.get_size()
+        self._items.append((surface, (int(center_x - width // 2), int(center_y - height // 2))))
+
+    def flush(self, target: pygame.Surface) -> int:
+        """Biriken çizimleri tek çağrıyla hedefe çiz, çizilen sayıyı döndür"""
+        count = len(self._items)
+        if count:
+            target.blits(self._items, doreturn=False)
+            self._items.clear()
+        return count
+
+    def clear(self) -> None:
+        """Biriken çizimleri çizmeden at"""
+        self._items.clear()
+
+
+@lru_cache(maxsize=256)
+def circle_sprite(radius: int, color, width: int = 0) -> pygame.Surface:
+    """Sprite'ı olmayan öğeler için önceden çizilmiş daire (dolu veya ``width`` kalınlıkta)"""
+    surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (radius, radius), radius, width)
+    if pygame.display.get_surface():
+        surface = surface.convert_alpha()
+    return surface
+
+
+@lru_cache(maxsize=64)
+def rect_sprite(width: int, height: int, color) -> pygame.Surface:
+    """Sprite'ı olmayan öğeler için önceden çizilmiş dolu dikdörtgen"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    surface.fill(color)
+    if pygame.display.get_surface():
+        surface = surface.convert_alpha()
+    return surface
@@ -1,6 +1,7 @@
 """
 Kamera sistemi - harita görünümü ve izleme.
 """
+from contextlib import contextmanager
 from typing import Tuple
 
 class Camera:
@@ -16,11 +17,15 @@ class Camera:
         self.smooth = True
         self.smooth_factor = 5.0  # Daha büyük değerler, daha yavaş takip
         self.bounds = None  # (min_x, min_y, max_x, max_y)
+        self.prev_x = 0  # Önceki tıktaki konum (çizimde ara değer için)
+        self.prev_y = 0
     
     def set_position(self, x: int, y: int) -> None:
         """Kamerayı belirtilen konuma taşır"""
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.target_x = x
         self.target_y = y
     
@@ -52,6 +57,22 @@ class Camera:
             self.x = max(min_x + self.width / 2, min(max_x - self.width / 2, self.x))
             self.y = max(min_y + self.height / 2, min(max_y - self.height / 2, self.y))
     
+    def store_previous(self) -> None:
+        """Tık başında konumu sakla"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
+    @contextmanager
+    def interpolated(self, alpha: float):
+        """Blok boyunca kamerayı önceki ve şimdiki tık arasındaki konuma taşır"""
+        x, y = self.x, self.y
+        self.x = self.prev_x + (x - self.prev_x) * alpha
+        self.y = self.prev_y + (y - self.prev_y) * alpha
+        try:
+            yield self
+        finally:
+            self.x, self.y = x, y
+    
     def follow(self, entity, offset_x: int = 0, offset_y: int = 0) -> None:
         """Belirtilen varlığı takip eder"""
         self.set_target(entity.x + offset_x, entity.y + offset_y)
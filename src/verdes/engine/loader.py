@@ -0,0 +1,64 @@
+"""
+Arka plan yükleyici - bağımsız yükleme işlerini iş parçacığı havuzunda çalıştırır.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Loader:
+    """Birbirinden bağımsız yükleme işleri için ilerleme takipli iş havuzu
+
+    İşler ``add`` ile adlandırılarak eklenir ve ``start`` ile havuzda aynı anda
+    çalışmaya başlar; ana döngü bu sırada ``progress`` ile yükleme ekranını
+    çizebilir. Her işin ağırlığı ilerleme çubuğundaki payını belirler. Bir iş
+    hata verirse istisna ``result`` çağrısında ana iş parçacığında yeniden
+    fırlatılır.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._jobs: List[tuple] = []
+        self._futures: Dict[str, Future] = {}
+        self._weights: Dict[str, float] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def add(self, name: str, func: Callable[..., Any], *args, weight: float = 1.0) -> None:
+        """Yükleme işi ekle (``start`` öncesinde)"""
+        if self._executor is not None:
+            raise RuntimeError("Yükleyici zaten başladı")
+        self._jobs.append((name, func, args))
+        self._weights[name] = weight
+
+    def start(self) -> None:
+        """Tüm işleri havuzda başlat"""
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="loader")
+        for name, func, args in self._jobs:
+            self._futures[name] = self._executor.submit(func, *args)
+
+    @property
+    def progress(self) -> float:
+        """Tamamlanan işlerin ağırlıklı oranı (0-1)"""
+        total = sum(self._weights.values())
+        if not total:
+            return 1.0
+        finished = sum(self._weights[name] for name, future in self._futures.items() if future.done())
+        return finished / total
+
+    @property
+    def done(self) -> bool:
+        """Tüm işler bitti mi? (başarılı veya hatalı)"""
+        return self._executor is not None and all(f.done() for f in self._futures.values())
+
+    @property
+    def pending(self) -> List[str]:
+        """Hâlâ süren işlerin adları"""
+        return [name for name, future in self._futures.items() if not future.done()]
+
+    def result(self, name: str) -> Any:
+        """İşin sonucu (bitmesini bekler, hata verdiyse istisnayı fırlatır)"""
+        return self._futures[name].result()
+
+    def close(self) -> None:
+        """Havuzu kapat (süren işlerin bitmesini bekler)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
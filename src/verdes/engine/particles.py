@@ -0,0 +1,156 @@
+"""
+Parçacık sistemi - yağmur ve fırtına efektleri için önceden ayrılmış diziler.
+"""
+from typing import List, Optional, Sequence
+import numpy as np
+import pygame
+
+# Yağmur damlası sprite uzunlukları (piksel) ve rengi
+RAIN_DROP_LENGTHS = (5, 7, 10)
+RAIN_COLOR = (100, 100, 255, 150)  # Açık mavi, yarı saydam
+
+
+def make_rain_sprites(lengths: Sequence[int] = RAIN_DROP_LENGTHS,
+                      color=RAIN_COLOR) -> List[pygame.Surface]:
+    """Farklı uzunluklarda yağmur damlası yüzeylerini bir kez çiz"""
+    sprites = []
+    for length in lengths:
+        surface = pygame.Surface((length // 2 + 1, length + 1), pygame.SRCALPHA)
+        pygame.draw.line(surface, color, (0, 0), (length // 2, length))
+        if pygame.display.get_surface():
+            surface = surface.convert_alpha()
+        sprites.append(surface)
+    return sprites
+
+
+class ParticleSystem:
+    """Konum, hız ve ömürleri sabit boyutlu NumPy dizilerinde tutan parçacıklar
+
+    Diziler ``capacity`` kadar bir kez ayrılır; ``count`` ile etkin parçacık
+    sayısı çalışma anında değiştirilebilir. Güncelleme tüm dizi üzerinde
+    yapılır, ekrandan çıkan veya ömrü biten parçacıklar üstten yeniden doğar.
+    Çizim, önceden çizilmiş sprite'ların tek bir ``Surface.blits`` çağrısıyla
+    yapılır.
+    """
+
+    def __init__(self, capacity: int, width: int, height: int, sprites: List[pygame.Surface],
+                 speed=(350.0, 550.0), lifetime=(0.6, 1.6), direction=(0.5, 1.0),
+                 seed: Optional[int] = None):
+        self.capacity = capacity
+        self.width = width
+        self.height = height
+        self.sprites = sprites
+        self.speed = speed
+        self.lifetime = lifetime
+        norm = float(np.hypot(*direction))
+        self.direction = np.array(direction, dtype=np.float32) / norm
+        self.rng = np.random.default_rng(seed)
+
+        self.positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self.lifetimes = np.zeros(capacity, dtype=np.float32)
+        self.sprite_ids = np.zeros(capacity, dtype=np.uint8)
+        self.count = 0
+
+    def set_count(self, count: int) -> None:
+        """Etkin parçacık sayısını değiştir (yeni parçacıklar ekrana dağılır)"""
+        count = max(0, min(self.capacity, int(count)))
+        if count > self.count:
+            self._spawn(np.arange(self.count, count), anywhere=True)
+        self.count = count
+
+    def _spawn(self, indices: np.ndarray, anywhere: bool = False) -> None:
+        """Verilen parçacıkları yeniden doğur (anywhere: tüm ekrana dağıt)"""
+        n = len(indices)
+        if not n:
+            return
+        rng = self.rng
+
+        # Sağa doğru sürüklendikleri için soldan taşan alanda da doğarlar
+        drift = self.height * self.direction[0] / self.direction[1]
+        self.positions[indices, 0] = rng.uniform(-drift, self.width, n)
+        if anywhere:
+            self.positions[indices, 1] = rng.uniform(0, self.height, n)
+        else:
+            self.positions[indices, 1] = rng.uniform(-20, 0, n)
+
+        speeds = rng.uniform(self.speed[0], self.speed[1], n).astype(np.float32)
+        self.velocities[indices] = speeds[:, None] * self.direction
+        self.lifetimes[indices] = rng.uniform(self.lifetime[0], self.lifetime[1], n)
+        self.sprite_ids[indices] = rng.integers(0, len(self.sprites), n)
+
+    def resize(self, width: int, height: int) -> None:
+        """Ekran boyutu değişti: parçacıkları yeni alana dağıt"""
+        self.width = width
+        self.height = height
+        self._spawn(np.arange(self.count), anywhere=True)
+
+    def update(self, dt: float) -> None:
+        """Tüm etkin parçacıkları ilerlet, ekrandan çıkanları yeniden doğur"""
+        n = self.count
+        if not n:
+            return
+        positions = self.positions[:n]
+        positions += self.velocities[:n] * dt
+        lifetimes = self.lifetimes[:n]
+        lifetimes -= dt
+
+        expired = (lifetimes <= 0) | (positions[:, 1] > self.height) | (positions[:, 0] > self.width)
+        if expired.any():
+            self._spawn(np.flatnonzero(expired))
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Parçacıkları tek toplu blit ile çiz"""
+        n = self.count
+        if not n:
+            return
+        sprites = self.sprites
+        coords = self.positions[:n].astype(np.int32).tolist()
+        surface.blits([(sprites[i], pos) for i, pos in zip(self.sprite_ids[:n].tolist(), coords)],
+                      doreturn=False)
+
+
+class ScreenFlash:
+    """Şimşek gibi tam ekran parlamalar için önceden oluşturulmuş katman
+
+    Yüzey ekran boyutunda bir kez oluşturulur; her karede yalnızca saydamlığı
+    değişir, böylece parlama yeni bir yarı saydam dikdörtgen çizmez.
+    """
+
+    def __init__(self, color=(255, 255, 200), rate: float = 1.2, duration: float = 0.15,
+                 alpha_range=(20, 80), seed: Optional[int] = None):
+        self.color = color
+        self.rate = rate  # Saniyedeki ortalama parlama sayısı
+        self.duration = duration
+        self.alpha_range = alpha_range
+        self.rng = np.random.default_rng(seed)
+        self.alpha = 0.0
+        self._peak = 0.0
+        self._remaining = 0.0
+        self._surface: Optional[pygame.Surface] = None
+
+    def trigger(self, alpha: Optional[float] = None) -> None:
+        """Parlamayı başlat"""
+        if alpha is None:
+            alpha = self.rng.uniform(*self.alpha_range)
+        self._peak = float(alpha)
+        self._remaining = self.duration
+        self.alpha = self._peak
+
+    def update(self, dt: float) -> None:
+        """Rastgele parlamaları başlat ve sönümle"""
+        if self._remaining > 0:
+            self._remaining = max(0.0, self._remaining - dt)
+            self.alpha = self._peak * self._remaining / self.duration
+        elif self.rng.random() < self.rate * dt:
+            self.trigger()
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Parlama varsa katmanı çiz"""
+        if self.alpha < 1:
+            return
+        if self._surface is None or self._surface.get_size() != surface.get_size():
+            self._surface = pygame.Surface(surface.get_size())
+            self._surface.fill(self.color)
+        self._surface.set_alpha(int(self.alpha))
+        surface.blit(self._surface, (0, 0))
@@ -0,0 +1,183 @@
+"""
+Kare profilleyicisi - alt sistem sürelerinin yüzdelikleri, ekran katmanı ve Chrome iz dökümü.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pygame
+
+
+class _Section:
+    """Tek bir bölümün zamanlayıcısı (her bölüm adı için bir kez oluşturulur)"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class _NullSection:
+    """Profilleyici kapalıyken kullanılan boş bölüm"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """Güncelleme ve çizim aşamalarını ölçen araç
+
+    ``section(ad)`` bağlam yöneticisi bölüm süresini ölçer. Her bölümün son
+    ``window`` örneği halka tamponda tutulur; p50/p95/p99 bu pencereden
+    hesaplanır. ``start_trace`` ile kayıt açıkken her ölçüm Chrome iz
+    olayı olarak da saklanır ve ``export_trace`` ile ``chrome://tracing`` veya
+    Perfetto'da açılabilen JSON olarak yazılır.
+    """
+
+    def __init__(self, window: int = 300, enabled: bool = True, max_trace_events: int = 200000):
+        self.window = window
+        self.enabled = enabled
+        self.max_trace_events = max_trace_events
+        self._samples: Dict[str, np.ndarray] = {}  # Bölüm -> son süreler (ms)
+        self._counts: Dict[str, int] = {}
+        self._sections: Dict[str, _Section] = {}
+        self._frame_start: Optional[int] = None
+        self._trace: Optional[List[dict]] = None
+        self._trace_origin = 0
+        self.last_trace: Optional[Path] = None  # Son yazılan iz dosyası (katmanda gösterilir)
+        self._font = None
+
+    # Ölçüm
+
+    def section(self, name: str):
+        """Bölüm süresini ölçen bağlam yöneticisi"""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def record(self, name: str, start_ns: int, end_ns: int) -> None:
+        """Ölçülmüş bir süreyi ekle"""
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = np.zeros(self.window, dtype=np.float32)
+            self._counts[name] = 0
+        count = self._counts[name]
+        samples[count % self.window] = (end_ns - start_ns) / 1e6
+        self._counts[name] = count + 1
+
+        if self._trace is not None and len(self._trace) < self.max_trace_events:
+            self._trace.append({
+                "name": name, "ph": "X", "pid": os.getpid(), "tid": threading.get_ident(),
+                "ts": (start_ns - self._trace_origin) / 1000, "dur": (end_ns - start_ns) / 1000,
+            })
+
+    def begin_frame(self) -> None:
+        """Karenin başlangıcı (``end_frame`` ile ``frame`` bölümü ölçülür)"""
+        if self.enabled:
+            self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self) -> Optional[float]:
+        """Karenin sonu, kare süresini (ms) döndürür (ölçülmediyse None)"""
+        if self.enabled and self._frame_start is not None:
+            end = time.perf_counter_ns()
+            self.record("frame", self._frame_start, end)
+            frame_ms = (end - self._frame_start) / 1e6
+            self._frame_start = None
+            return frame_ms
+        return None
+
+    def reset(self) -> None:
+        """Tüm örnekleri sil"""
+        self._samples.clear()
+        self._counts.clear()
+
+    # İstatistik
+
+    def percentiles(self, name: str) -> Tuple[float, float, float]:
+        """Bölümün penceredeki p50, p95 ve p99 süreleri (ms)"""
+        samples = self._samples.get(name)
+        if samples is None:
+            return 0.0, 0.0, 0.0
+        filled = samples[:min(self._counts[name], self.window)]
+        p50, p95, p99 = np.percentile(filled, (50, 95, 99))
+        return float(p50), float(p95), float(p99)
+
+    def stats(self) -> List[Tuple[str, float, float, float]]:
+        """Tüm bölümler için (ad, p50, p95, p99), p95'e göre azalan sırada"""
+        rows = [(name, *self.percentiles(name)) for name in self._samples]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    # Chrome izi
+
+    @property
+    def tracing(self) -> bool:
+        """İz kaydı açık mı?"""
+        return self._trace is not None
+
+    def start_trace(self) -> None:
+        """İz olaylarını kaydetmeye başla"""
+        self._trace = []
+        self._trace_origin = time.perf_counter_ns()
+
+    def stop_trace(self) -> List[dict]:
+        """Kaydı durdur, toplanan olayları döndür"""
+        events, self._trace = self._trace or [], None
+        return events
+
+    def export_trace(self, path, events: Optional[List[dict]] = None) -> Path:
+        """Olayları (verilmezse süren kaydı durdurup) Chrome iz JSON'u olarak yaz"""
+        if events is None:
+            events = self.stop_trace()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        self.last_trace = path
+        return path
+
+    # Ekran katmanı
+
+    def draw(self, surface: pygame.Surface, x: int = 10, y: int = 30, max_rows: int = 16) -> None:
+        """Bölüm yüzdeliklerini yarı saydam bir tablo olarak çiz"""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 16)
+        font = self._font
+        lines = [f"{'bölüm':<18}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        lines += [f"{name[:18]:<18}{p50:7.2f}{p95:7.2f}{p99:7.2f}"
+                  for name, p50, p95, p99 in self.stats()[:max_rows]]
+        if self.tracing:
+            lines.append(f"iz kaydı: {len(self._trace)} olay")
+        elif self.last_trace is not None:
+            lines.append(f"iz kaydedildi: {self.last_trace.name}")
+
+        line_height = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 8
+        background = pygame.Surface((width, line_height * len(lines) + 8), pygame.SRCALPHA)
+        background.fill((0, 0, 0, 170))
+        surface.blit(background, (x, y))
+        for index, line in enumerate(lines):
+            color = (255, 255, 0) if index == 0 else (230, 230, 230)
+            surface.blit(font.render(line, True, color), (x + 4, y + 4 + index * line_height))
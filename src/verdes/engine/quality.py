@@ -0,0 +1,99 @@
+"""
+Kalite yöneticisi - son kare sürelerine göre efekt seviyesini bütçeye uydurur.
+"""
+from typing import Callable, Dict, List, Optional
+import numpy as np
+
+# Kalite seviyeleri (en yüksekten en düşüğe)
+QUALITY_TIERS: List[Dict] = [
+    {"name": "high", "rain_scale": 1.0, "water_overlay": True, "offscreen_animation": True, "hud_interval": 0.0},
+    {"name": "medium", "rain_scale": 0.6, "water_overlay": True, "offscreen_animation": False, "hud_interval": 0.1},
+    {"name": "low", "rain_scale": 0.3, "water_overlay": False, "offscreen_animation": False, "hud_interval": 0.25},
+    {"name": "minimal", "rain_scale": 0.1, "water_overlay": False, "offscreen_animation": False, "hud_interval": 0.5},
+]
+
+
+class QualityGovernor:
+    """Kare bütçesine göre kalite seviyesini düşürüp yükselten denetleyici
+
+    Son ``window`` karenin iş süreleri (ms) halka tamponda tutulur. Pencere
+    dolunca yüksek yüzdelik (``percentile``) bütçenin ``downgrade_ratio``
+    katını aşarsa bir seviye düşülür; ``upgrade_ratio`` katının altında
+    kalırsa bir seviye çıkılır. Salınımı önlemek için iki eşik arasında
+    boşluk bırakılır, her değişiklikten sonra pencere boşaltılır ve
+    yükseltme için ``upgrade_delay`` saniye beklenir (düşürme için
+    ``downgrade_delay``). Yükseltmeden kısa süre sonra geri düşülürse o
+    seviyeden yükseltme beklemesi iki katına çıkar.
+    """
+
+    def __init__(self, target_fps: float = 60, window: int = 60, percentile: float = 90,
+                 downgrade_ratio: float = 1.0, upgrade_ratio: float = 0.6,
+                 downgrade_delay: float = 1.0, upgrade_delay: float = 5.0,
+                 tiers: List[Dict] = QUALITY_TIERS, level: int = 0, enabled: bool = True):
+        self.budget_ms = 1000.0 / target_fps
+        self.window = window
+        self.percentile = percentile
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.downgrade_delay = downgrade_delay
+        self.upgrade_delay = upgrade_delay
+        self.tiers = tiers
+        self.level = max(0, min(len(tiers) - 1, level))
+        self.enabled = enabled
+        self._samples = np.zeros(window, dtype=np.float32)
+        self._count = 0
+        self._since_change = 0.0
+        self._upgrade_delays = [upgrade_delay] * len(tiers)  # Seviyeden bir üste çıkma beklemesi
+        self._upgraded_from: Optional[int] = None
+        self._listeners: List[Callable[[Dict], None]] = []
+
+    @property
+    def tier(self) -> Dict:
+        """Geçerli seviyenin ayarları"""
+        return self.tiers[self.level]
+
+    def add_listener(self, listener: Callable[[Dict], None]) -> None:
+        """Seviye değişince yeni ayarlarla çağrılacak fonksiyon"""
+        self._listeners.append(listener)
+
+    def set_level(self, level: int) -> None:
+        """Seviyeyi elle ayarla (pencere sıfırlanır)"""
+        level = max(0, min(len(self.tiers) - 1, level))
+        self._count = 0
+        self._since_change = 0.0
+        if level != self.level:
+            self.level = level
+            for listener in self._listeners:
+                listener(self.tier)
+
+    def load(self) -> Optional[float]:
+        """Penceredeki yüzdelik kare süresinin bütçeye oranı (pencere dolmadıysa None)"""
+        if self._count < self.window:
+            return None
+        return float(np.percentile(self._samples, self.percentile)) / self.budget_ms
+
+    def update(self, frame_ms: Optional[float], dt: float) -> bool:
+        """Kare süresini ekle, seviye değiştiyse True döndür"""
+        self._since_change += dt
+        if not self.enabled or frame_ms is None:
+            return False
+        self._samples[self._count % self.window] = frame_ms
+        self._count += 1
+
+        load = self.load()
+        if load is None:
+            return False
+        if load > self.downgrade_ratio and self._since_change >= self.downgrade_delay \
+                and self.level < len(self.tiers) - 1:
+            if self._upgraded_from == self.level + 1 and self._since_change < self.upgrade_delay:
+                # Yükseltme bütçeyi aştı: aynı yükseltmeyi daha geç dene
+                self._upgrade_delays[self.level + 1] *= 2
+            self._upgraded_from = None
+            self.set_level(self.level + 1)
+            return True
+        if load < self.upgrade_ratio and self.level > 0 \
+                and self._since_change >= self._upgrade_delays[self.level]:
+            self._upgraded_from = self.level
+            self.set_level(self.level - 1)
+            return True
+        return False
@@ -0,0 +1,150 @@
+"""
+Sprite kayıt defteri - mantıksal sprite anahtarlarını yüzeylere çözümler.
+"""
+import threading
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Tuple
+import pygame
+from verdes.engine.atlas import TextureAtlas
+
+# Mevsime göre değişmeyen nesneler
+SEASONLESS_OBJECTS = ("rock", "stump")
+
+
+class SpriteRegistry:
+    """Sprite çözümleme önbelleği
+
+    Her mantıksal anahtar (ör. ``("tile", "dirt", "spring")``) aday dosya
+    zincirine çevrilir ve yalnızca bir kez diskte aranır. Bulunamayan sprite'lar
+    da hatırlanır; böylece eksik varlıklar her karede istisna fırlatmaz.
+    Doku atlası varsa dosyalar önce atlasta aranır; atlastaki sprite'lar
+    sayfanın alt yüzeyleridir ve sayfa ile birlikte bir kez dönüştürülür.
+    """
+
+    def __init__(self, base_path: str = "assets/images", atlas_path: str = "assets/atlas/atlas.json"):
+        self.base_path = Path(base_path)
+        self.atlas_path = Path(atlas_path)
+        self._atlas: Optional[TextureAtlas] = None
+        self._atlas_checked = False
+        self._atlas_names: Dict[Hashable, str] = {}  # Atlastan çözülen anahtar -> atlas adı
+        self._cache: Dict[Hashable, Optional[pygame.Surface]] = {}
+        self._converted: Dict[Hashable, bool] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def atlas(self) -> Optional[TextureAtlas]:
+        """Doku atlası (ilk erişimde yüklenir, yoksa None)"""
+        if not self._atlas_checked:
+            with self._lock:
+                if not self._atlas_checked:
+                    self._atlas = TextureAtlas.load(self.atlas_path)
+                    self._atlas_checked = True
+        return self._atlas
+
+    def _atlas_name(self, path: Path) -> Optional[str]:
+        """Dosya yolunun atlastaki adı (atlasta yoksa None)"""
+        atlas = self.atlas
+        if atlas is None:
+            return None
+        try:
+            name = path.relative_to(self.base_path).as_posix()
+        except ValueError:
+            return None
+        return name if name in atlas else None
+
+    def candidates(self, key: Tuple) -> List[Path]:
+        """Anahtar için denenecek dosya yollarını sırasıyla döndür"""
+        kind = key[0]
+        base = self.base_path
+
+        if kind == "tile":
+            _, tile_type, season = key
+            return [base / "tiles" / f"{tile_type}_{season}.png", base / "tiles" / f"{tile_type}.png"]
+        if kind == "crop":
+            _, crop_type, stage = key
+            return [base / "crops" / f"{crop_type}_{stage}.png"]
+        if kind == "object":
+            _, obj_type, season = key
+            paths = [base / "objects" / f"{obj_type}.png"]
+            if obj_type not in SEASONLESS_OBJECTS:
+                paths.insert(0, base / "objects" / f"{obj_type}_{season}.png")
+            return paths
+        if kind == "overlay":
+            return [base / "tiles" / f"{key[1]}.png"]
+        if kind == "character":
+            _, name, direction = key
+            return [base / "characters" / name / f"{direction}.png",
+                    base / "characters" / f"default_{direction}.png"]
+        if kind == "file":
+            return [Path(key[1])]
+        raise KeyError(f"Bilinmeyen sprite türü: {kind}")
+
+    def _load(self, key: Tuple) -> Optional[pygame.Surface]:
+        for path in self.candidates(key):
+            name = self._atlas_name(path)
+            if name is not None:
+                with self._lock:
+                    self._atlas_names[key] = name
+                return self.atlas.get(name)
+            if path.exists():
+                try:
+                    return pygame.image.load(str(path))
+                except pygame.error:
+                    continue
+        return None
+
+    def get(self, key: Tuple) -> Optional[pygame.Surface]:
+        """Anahtarın yüzeyini döndür, sprite yoksa None"""
+        try:
+            surface = self._cache[key]
+        except KeyError:
+            surface = self._load(key)
+            with self._lock:
+                self._cache[key] = surface
+                self._converted[key] = False
+
+        # Ekran modu ayarlandıktan sonra piksel biçimini bir kez dönüştür
+        if surface is not None and not self._converted[key] and pygame.display.get_surface():
+            atlas_name = self._atlas_names.get(key)
+            # Atlas sprite'ı: sayfa bir kez dönüşür, alt yüzey dönüşmüş sayfadan alınır
+            surface = self.atlas.get(atlas_name) if atlas_name else surface.convert_alpha()
+            with self._lock:
+                self._cache[key] = surface
+                self._converted[key] = True
+        return surface
+
+    def preload(self, keys, convert: bool = True) -> int:
+        """Anahtarları önceden çözümle, bulunan sprite sayısını döndür
+
+        ``convert=False`` dosyaları yalnızca çözer (arka plan iş parçacıkları
+        için); piksel biçimi dönüşümü ilk ``get`` çağrısında yapılır.
+        """
+        if convert:
+            return sum(1 for key in keys if self.get(key) is not None)
+        found = 0
+        for key in keys:
+            surface = self._cache.get(key)
+            if key not in self._cache:
+                surface = self._load(key)
+                with self._lock:
+                    surface = self._cache.setdefault(key, surface)
+                    self._converted.setdefault(key, False)
+            found += surface is not None
+        return found
+
+    def is_missing(self, key: Tuple) -> bool:
+        """Anahtar çözümlendi ve sprite bulunamadı mı?"""
+        return key in self._cache and self._cache[key] is None
+
+    def clear(self) -> None:
+        """Önbelleği temizle (ör. varlıklar değiştiğinde)"""
+        with self._lock:
+            self._cache.clear()
+            self._converted.clear()
+            self._atlas_names.clear()
+            self._atlas = None
+            self._atlas_checked = False
+
+
+# Oyun genelinde paylaşılan kayıt defteri
+sprites = SpriteRegistry()
@@ -0,0 +1,46 @@
+"""
+Sabit zaman adımı - simülasyonu kare hızından bağımsız, sabit tık hızında ilerletir.
+"""
+
+
+class FixedTimestep:
+    """Biriktiricili sabit adım zamanlayıcısı
+
+    Her karenin süresi biriktiriciye eklenir; ``advance`` biriken süreden
+    kaç sabit adım (``dt = 1 / tick_rate``) atılacağını döndürür. Bir karede
+    en fazla ``max_steps`` adım atılır: daha uzun takılmalarda fazlası atılır
+    (``dropped``), böylece yavaş kareler giderek büyüyen telafi işine
+    dönüşmez. Artan süre ``alpha`` olarak (0-1) çizimde iki tık arasındaki
+    konumu hesaplamakta kullanılır.
+    """
+
+    def __init__(self, tick_rate: float = 30, max_steps: int = 5):
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped = 0.0  # Yetişilemeyip atılan süre (saniye)
+
+    @property
+    def alpha(self) -> float:
+        """Son tıktan bu yana geçen sürenin tık süresine oranı"""
+        return min(self.accumulator / self.dt, 1.0)
+
+    def advance(self, frame_dt: float) -> int:
+        """Kare süresini ekle, bu karede atılacak adım sayısını döndür"""
+        self.accumulator += max(frame_dt, 0.0)
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # Telafi sınırı: yalnızca son tıkın artığı tutulur
+            excess = (steps - self.max_steps) * self.dt
+            self.dropped += excess
+            self.accumulator -= excess
+            steps = self.max_steps
+        self.accumulator -= steps * self.dt
+        self.ticks += steps
+        return steps
+
+    def reset(self) -> None:
+        """Biriken süreyi at (ör. duraklatma veya harita geçişinden sonra)"""
+        self.accumulator = 0.0
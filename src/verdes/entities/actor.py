@@ -3,46 +3,31 @@ Tüm oyun karakterlerinin temel sınıfı.
 """
 import math
 import pygame
-from pathlib import Path
+from verdes.engine.batch import rect_sprite
+from verdes.engine.sprites import sprites
 
 class Actor:
     """Oyuncu ve NPC'lerin temel sınıfı"""
     
     def __init__(self, name, x, y):
         self.name = name
+        self.sprite_name = name  # Sprite klasörü (isim sonradan değişse de sabit kalır)
         self.x = x
         self.y = y
+        self.prev_x = x  # Önceki tıktaki konum (çizimde ara değer için)
+        self.prev_y = y
         self.width = 32  # Piksel
         self.height = 32  # Piksel
+        self.hitbox_width = 20  # Çarpışma kutusu (piksel, merkeze hizalı)
+        self.hitbox_height = 20
+        self.world = None  # Çarpışma için bulunduğu dünya (setup_game atar)
         self.speed = 100  # Piksel/saniye
         self.direction = "down"  # "up", "down", "left", "right"
         self.moving = False
         self.frame = 0
         self.animation_time = 0
         self.animation_delay = 0.1  # Saniye
-        
-        # Sprite yükleme
-        self.sprites = self._load_sprites()
-    
-    def _load_sprites(self):
-        """Karakterin spritelarını yükle"""
-        sprites = {}
-        base_path = Path(f"assets/images/characters/{self.name}")
-        
-        # Her yön için sprite dosyasını arayalım
-        for direction in ["up", "down", "left", "right"]:
-            sprite_path = base_path / f"{direction}.png"
-            
-            if sprite_path.exists():
-                # Pygame Zero Actor kullanarak sprite yükle
-                sprites[direction] = str(sprite_path)
-            else:
-                # Varsayılan sprite kullan
-                default_path = Path(f"assets/images/characters/default_{direction}.png")
-                if default_path.exists():
-                    sprites[direction] = str(default_path)
-        
-        return sprites
+        self.animate = True  # False ise yürüme animasyonu ilerlemez (ör. ekran dışında)
     
     def move(self, dx, dy, dt):
         """Aktörü belirtilen yönde hareket ettir"""
@@ -55,14 +40,35 @@ class Actor:
         # Hareket durumunu güncelle
         self.moving = dx != 0 or dy != 0
         
-        # Konumu güncelle
-        self.x += dx * self.speed * dt
-        self.y += dy * self.speed * dt
+        # Konumu güncelle (dünya varsa engellere çarparak)
+        step_x = dx * self.speed * dt
+        step_y = dy * self.speed * dt
+        if self.world is None:
+            self.x += step_x
+            self.y += step_y
+            return True
+        
+        self.x, self.y, hit_x, hit_y = self.world.move_box(
+            self.x, self.y, self.hitbox_width / 2, self.hitbox_height / 2, step_x, step_y
+        )
+        
+        # Hareket tamamen engellendiyse False
+        return not ((hit_x or not step_x) and (hit_y or not step_y))
+    
+    def store_previous(self):
+        """Tık başında konumu sakla (ışınlanmadan sonra da çağrılır)"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
+    def render_position(self, alpha=1.0):
+        """Önceki ve şimdiki tık arasındaki çizim konumu"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
     
     def update(self, dt):
         """Aktörü güncelle"""
         # Animasyon güncelleme
-        if self.moving:
+        if self.moving and self.animate:
             self.animation_time += dt
             if self.animation_time >= self.animation_delay:
                 self.animation_time = 0
@@ -70,17 +76,15 @@ class Actor:
         else:
             self.frame = 0
     
-    def draw(self):
-        """Aktörü çiz"""
-        sprite_name = self.sprites.get(self.direction)
+    def draw(self, batch=None, alpha=1.0):
+        """Aktörü çiz (``batch`` verilirse karakter katmanına ekle, ``alpha`` tıklar arası oran)"""
+        # Sprite kayıt defterinden (bir kez çözümlenir), yoksa kırmızı dikdörtgen
+        image = sprites.get(("character", self.sprite_name, self.direction))
+        if image is None:
+            image = rect_sprite(self.width, self.height, (255, 0, 0))
         
-        if sprite_name:
-            # Pygame Zero Actor kullanarak çiz
-            actor = Actor(sprite_name)
-            actor.x = self.x
-            actor.y = self.y
-            actor.draw()
+        x, y = self.render_position(alpha)
+        if batch is not None:
+            batch.add_centered(image, x, y)
         else:
-            # Sprite yoksa basit bir dikdörtgen çiz
-            rect = Rect((self.x - self.width/2, self.y - self.height/2), (self.width, self.height))
-            screen.draw.filled_rect(rect, (255, 0, 0))  # Kırmızı dikdörtgen
\ No newline at end of file
+            screen.surface.blit(image, image.get_rect(center=(x, y)))
@@ -1,9 +1,32 @@
 """
 NPC (non-player character) varlık sınıfı.
 """
-import random
 import math
 from verdes.entities.actor import Actor
+from verdes.systems.rng import rng
+
+# Köyün başlangıç NPC'leri
+DEFAULT_NPCS = [
+    {"name": "farmer", "x": 200, "y": 200, "type": "villager"},
+    {"name": "shopkeeper", "x": 500, "y": 300, "type": "shopkeeper"},
+    {"name": "miner", "x": 350, "y": 250, "type": "villager"},
+    {"name": "fisher", "x": 650, "y": 150, "type": "villager"}
+]
+
+# Köylüler gün içinde dükkana uğrar (hepsi aynı akış alanını kullanır)
+SHOP_POSITION = (500, 300)
+
+def spawn_npcs(world, npc_data=DEFAULT_NPCS):
+    """NPC listesini verilen dünyada oluştur"""
+    npcs = []
+    for data in npc_data:
+        npc = NPC(data["name"], data["x"], data["y"])
+        npc.npc_type = data["type"]
+        npc.world = world
+        if data["type"] == "villager":
+            npc.work_position = SHOP_POSITION
+        npcs.append(npc)
+    return npcs
 
 class NPC(Actor):
     """NPC sınıfı - AI destekli karakterler"""
@@ -19,6 +42,11 @@ class NPC(Actor):
         self.behavior_interval = 1.0  # AI davranış aralığı (saniye)
         self.target_x = None  # Hedef X konumu
         self.target_y = None  # Hedef Y konumu
+        self.path = []  # Hedefe giden ara tile'lar (yol bulma servisinden)
+        self.flow_field = None  # Paylaşılan hedefe giderken izlenen akış alanı
+        self.path_shared = False  # Hedef akış alanıyla mı planlandı
+        self.path_version = None  # Planlama anındaki yol bulma sürümü
+        self.work_position = None  # Çalışma yeri (piksel), ör. dükkan
     
     def update(self, dt):
         """NPC'yi güncelle"""
@@ -39,7 +67,7 @@ class NPC(Actor):
     def _update_behavior(self):
         """AI davranışlarını güncelle"""
         # Basit rastgele davranış
-        behavior = random.choice(["idle", "wander", "work"])
+        behavior = rng.stream("npc").choice(["idle", "wander", "work"])
         
         if behavior == "idle":
             # Hareketsiz dur
@@ -49,33 +77,85 @@ class NPC(Actor):
         
         elif behavior == "wander":
             # Rastgele bir noktaya yürü
-            self.target_x = self.x + random.randint(-100, 100)
-            self.target_y = self.y + random.randint(-100, 100)
+            stream = rng.stream("npc")
+            self.set_destination(self.x + stream.randint(-100, 100), self.y + stream.randint(-100, 100))
         
         elif behavior == "work":
-            # Çalışma animasyonu veya davranışı
-            # Burada gerçek bir oyun için daha kompleks mantık olabilir
-            pass
+            # Çalışma yerine git (aynı yere giden NPC'ler akış alanını paylaşır)
+            if self.work_position:
+                self.set_destination(*self.work_position, shared=True)
+    
+    def set_destination(self, x, y, shared=False):
+        """Hedef belirle ve dünya varsa engellerin etrafından yol bul"""
+        self.target_x = x
+        self.target_y = y
+        self.path = []
+        self.flow_field = None
+        self.path_shared = shared
+        
+        if self.world is None:
+            return True
+        
+        self.path_version = self.world.pathfinder.version
+        goal = self.world.pixel_to_tile(x, y)
+        if shared:
+            self.flow_field = self.world.pathfinder.flow_field(goal)
+            return True
+        
+        path = self.world.pathfinder.find_path(self.world.pixel_to_tile(self.x, self.y), goal)
+        if path is None:
+            # Hedefe ulaşılamıyor
+            self.clear_destination()
+            return False
+        self.path = path
+        return True
+    
+    def clear_destination(self):
+        """Hedefi ve yolu unut"""
+        self.target_x = None
+        self.target_y = None
+        self.path = []
+        self.flow_field = None
+        self.moving = False
     
     def _move_to_target(self, dt):
-        """Hedefe doğru hareket et"""
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
+        """Hedefe doğru (varsa yol üzerindeki ara noktalardan geçerek) hareket et"""
+        # Planlamadan sonra yol önbelleği geçersiz olduysa yeniden planla
+        if self.world is not None and self.path_version != self.world.pathfinder.version:
+            if not self.set_destination(self.target_x, self.target_y, shared=self.path_shared):
+                return
+        
+        # Akış alanı izleniyorsa bir sonraki adımı bulunduğumuz tile'dan al
+        if self.flow_field is not None and not self.path:
+            step = self.flow_field.next_tile(*self.world.pixel_to_tile(self.x, self.y))
+            if step:
+                self.path.append(step)
+        
+        # Sıradaki ara nokta, yol bittiyse asıl hedef
+        if self.path:
+            waypoint_x, waypoint_y = self.world.tile_center(*self.path[0])
+        else:
+            waypoint_x, waypoint_y = self.target_x, self.target_y
+        
+        dx = waypoint_x - self.x
+        dy = waypoint_y - self.y
         distance = math.sqrt(dx*dx + dy*dy)
         
-        # Hedefe vardık mı?
+        # Ara noktaya ya da hedefe vardık mı?
         if distance < 5:
-            self.target_x = None
-            self.target_y = None
-            self.moving = False
+            if self.path:
+                self.path.pop(0)
+            else:
+                self.clear_destination()
             return
         
         # Hareketi normalize et
         dx = dx / distance
         dy = dy / distance
         
-        # Hareket et
-        self.move(dx, dy, dt)
+        # Hareket et (yol tamamen kapalıysa hedeften vazgeç)
+        if not self.move(dx, dy, dt):
+            self.clear_destination()
     
     def talk(self, player, dialogue_system=None):
         """Oyuncu ile konuş"""
@@ -91,7 +171,7 @@ class NPC(Actor):
             "Çiftliğin nasıl gidiyor?",
             "Bugün hava çok güzel."
         ]
-        return random.choice(greetings)
+        return rng.stream("dialogue").choice(greetings)
     
     def receive_gift(self, item):
         """Hediye al ve arkadaşlık puanı güncelle"""
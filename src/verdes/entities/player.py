@@ -2,7 +2,8 @@
 Oyuncu varlık sınıfı.
 """
 from verdes.entities.actor import Actor
-from verdes.systems.inventory import Inventory, ItemDatabase
+from verdes.systems.inventory import Inventory, ItemDatabase, ItemType
+from verdes.world.map import HARVEST_ITEMS
 import math
 
 class Player(Actor):
@@ -34,10 +35,11 @@ class Player(Actor):
     def _add_starter_items(self):
         """Başlangıç eşyalarını ekle"""
         starter_items = {
-            "hoe": 1,
-            "watering_can": 1,
-            "axe": 1,
-            "turnip_seed": 5
+            "tool_hoe": 1,
+            "tool_watering_can": 1,
+            "tool_scythe": 1,
+            "tool_axe": 1,
+            "seed_turnip": 5
         }
         
         for item_id, count in starter_items.items():
@@ -66,41 +68,19 @@ class Player(Actor):
             dx *= 0.7071  # 1/sqrt(2)
             dy *= 0.7071
         
-        # Hareket ettir
+        # Hareket ettir (dünya varsa tile ve nesnelere çarparak)
         if dx != 0 or dy != 0:
-            # Harita ve nesnelerle çarpışma kontrolü yap
-            new_x = self.x + dx * self.speed * dt
-            new_y = self.y + dy * self.speed * dt
-            
-            # Eğer world varsa (bu nesnedeki bir fonksiyonda değil dışarıdan erişilebilir)
-            if 'world' in globals() and world and hasattr(world, 'is_walkable'):
-                # X ekseninde hareket kontrolü
-                if world.is_walkable(new_x, self.y):
-                    self.x = new_x
-                
-                # Y ekseninde hareket kontrolü
-                if world.is_walkable(self.x, new_y):
-                    self.y = new_y
-            else:
-                # World yoksa (test veya dünya oluşturulmadan önce), doğrudan hareket et
-                self.x = new_x
-                self.y = new_y
-            
-            # Hareket durumunu güncelle
-            self.moving = dx != 0 or dy != 0
-            
-            # Yönü güncelle
-            if abs(dx) > abs(dy):
-                self.direction = "right" if dx > 0 else "left"
-            else:
-                self.direction = "down" if dy > 0 else "up"
+            self.move(dx, dy, dt)
             
             # Hareket için enerji tüket (çok az)
             self.use_energy(0.05 * dt)
     
     def use_energy(self, amount):
-        """Enerji tüket"""
-        self.energy = max(0, self.energy - amount)
+        """Enerji tüket, yeterli enerji yoksa tüketmeden False döndür"""
+        if self.energy < amount:
+            return False
+        self.energy -= amount
+        return True
     
     def restore_energy(self, amount):
         """Enerji yenile"""
@@ -116,8 +96,8 @@ class Player(Actor):
             return False
         
         # Aleti envanterde bul
-        selected_slot = self.inventory.slots[self.inventory.selected_slot]
-        if selected_slot.item and selected_slot.item.category == "tool" and selected_slot.item.id == tool_name:
+        selected_slot = self.inventory.get_selected_slot()
+        if selected_slot.item and selected_slot.item.item_type == ItemType.TOOL and selected_slot.item.id == tool_name:
             # Enerji maliyeti
             energy_cost = selected_slot.item.energy_cost
             
@@ -126,41 +106,32 @@ class Player(Actor):
                 # Enerji tüket
                 self.use_energy(energy_cost)
                 
-                # Fareye göre kullanım yönü
-                mouse_x, mouse_y = mouse_pos = (0, 0)  # Gerçek uygulamada pygame.mouse.get_pos() kullanılır
-                
-                # Oyuncudan fareye olan vektör
-                dx = mouse_x - self.x
-                dy = mouse_y - self.y
-                
-                # Yeni yön hesapla (interaksiyon için)
-                if abs(dx) > abs(dy):
-                    self.direction = "right" if dx > 0 else "left"
-                else:
-                    self.direction = "down" if dy > 0 else "up"
-                
-                # Kullanım pozisyonu - oyuncunun önünde
-                tool_x, tool_y = self._get_front_position()
+                # Alet seviyesine göre oyuncunun önündeki (bakış yönündeki) tile alanı
+                width, length = selected_slot.item.get_area()
                 
                 # Alete göre dünya üzerinde farklı etkiler
-                if tool_name == "hoe":
-                    # Çapa - toprağı sür
-                    if 'world' in globals() and world:
-                        # Tile'ın X ve Y'sini hesapla
-                        tile_x = int(tool_x / world.tile_size)
-                        tile_y = int(tool_y / world.tile_size)
-                        
-                        # Eğer bu bir çimen tile'ı ise, toprak yap
-                        if 0 <= tile_x < world.width and 0 <= tile_y < world.height:
-                            if world.tiles[tile_y][tile_x]["type"] == "grass":
-                                world.tiles[tile_y][tile_x]["type"] = "dirt"
+                if tool_name == "tool_hoe":
+                    # Çapa - alandaki çimeni toprağa çevir
+                    if self.world:
+                        self.world.hoe_area(*self._get_tool_area(width, length))
                 
-                elif tool_name == "watering_can":
-                    # Sulama kabı - bitkileri sula
-                    if 'world' in globals() and world:
-                        world.water_crop(tool_x, tool_y, self)
+                elif tool_name == "tool_watering_can":
+                    # Sulama kabı - alandaki bitkileri sula
+                    if self.world:
+                        self.world.water_area(*self._get_tool_area(width, length))
                 
-                elif tool_name == "axe":
+                elif tool_name == "tool_scythe":
+                    # Tırpan - alandaki olgun bitkileri hasat et
+                    if self.world:
+                        harvested = self.world.harvest_area(*self._get_tool_area(width, length))
+                        for crop_type, count in harvested.items():
+                            harvested_item = HARVEST_ITEMS.get(crop_type)
+                            if harvested_item:
+                                self.add_to_inventory(harvested_item, count)
+                        if harvested:
+                            self._gain_skill("farming", sum(harvested.values()))
+                
+                elif tool_name == "tool_axe":
                     # Balta - ağaçları kes
                     # Bu kısım daha sonra eklenecek
                     pass
@@ -173,8 +144,8 @@ class Player(Actor):
         """Tohum ek"""
         # Belirtilmediyse, seçili yuva kontrolü
         if not seed_id:
-            selected_slot = self.inventory.slots[self.inventory.selected_slot]
-            if selected_slot.item and selected_slot.item.category == "seed":
+            selected_slot = self.inventory.get_selected_slot()
+            if selected_slot.item and selected_slot.item.item_type == ItemType.SEED:
                 seed_id = selected_slot.item.id
             else:
                 return False
@@ -183,16 +154,16 @@ class Player(Actor):
         plant_x, plant_y = self._get_front_position()
         
         # Dünya haritasında ekme
-        if 'world' in globals() and world:
+        if self.world:
             seed_item = self.item_db.get_item(seed_id)
-            if seed_item and hasattr(seed_item, 'crop_type'):
+            if seed_item and hasattr(seed_item, 'crop_id'):
                 # Tohumu azalt
                 if self.inventory.remove_item(seed_id, 1) > 0:
-                    # Bitki türünü belirle
-                    crop_type = seed_item.crop_type
+                    # Bitki türünü belirle ("crop_turnip" -> "turnip")
+                    crop_type = seed_item.crop_id.removeprefix("crop_")
                     
                     # Dünyada ekme işlemi
-                    if world.plant_crop(crop_type, plant_x, plant_y, self):
+                    if self.world.plant_crop(crop_type, plant_x, plant_y, self):
                         # Beceri puanı kazanma
                         self._gain_skill("farming", 0.2)
                         return True
@@ -205,8 +176,8 @@ class Player(Actor):
         harvest_x, harvest_y = self._get_front_position()
         
         # Dünya haritasında hasat
-        if 'world' in globals() and world:
-            if world.harvest_crop(harvest_x, harvest_y, self):
+        if self.world:
+            if self.world.harvest_crop(harvest_x, harvest_y, self):
                 # Beceri puanı kazanma
                 self._gain_skill("farming", 1.0)
                 return True
@@ -222,6 +193,24 @@ class Player(Actor):
         # Bu kısım daha sonra eklenecek
         return False
     
+    def _get_tool_area(self, width, length):
+        """Önündeki tile'dan başlayıp bakış yönünde uzanan alan (x1, y1, x2, y2)
+
+        Alan bakış yönüne dik eksende ortalanır; yarı açık tile aralığıdır.
+        """
+        front_x, front_y = self.world.pixel_to_tile(*self._get_front_position())
+        if self.direction in ("up", "down"):
+            x1 = front_x - width // 2
+            x2 = x1 + width
+            y1 = front_y if self.direction == "down" else front_y - length + 1
+            y2 = y1 + length
+        else:
+            y1 = front_y - width // 2
+            y2 = y1 + width
+            x1 = front_x if self.direction == "right" else front_x - length + 1
+            x2 = x1 + length
+        return x1, y1, x2, y2
+    
     def _get_front_position(self):
         """Oyuncunun önündeki pozisyonu hesapla"""
         # Yöne göre x ve y ofsetini hesapla
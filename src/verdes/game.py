@@ -3,20 +3,32 @@ Verde oyunu ana modülü.
 Pygame Zero entegrasyonu ve oyun durumu yönetimi.
 """
 import os
-import random
+import time
 import yaml
 from pathlib import Path
 
 # Oyun bileşenlerini içe aktar
-from verdes.world.map import World
+from verdes.world.world_manager import WorldManager
 from verdes.entities.player import Player
-from verdes.entities.npc import NPC
+from verdes.entities.npc import DEFAULT_NPCS, spawn_npcs
 from verdes.systems.time import TimeSystem
 from verdes.systems.economy import EconomySystem
-from verdes.systems.inventory import ItemDatabase
+from verdes.systems.inventory import ItemDatabase, ItemType
+from verdes.systems.rng import rng
+from verdes.ui.menu_background import MenuBackground
+from verdes.ui.text_cache import text_cache
 from verdes.ui.ui_manager import UIManager, Panel, Button, Label
 from verdes.ai.dialogue_system import DialogueSystem
 from verdes.ai.behavior_model import BehaviorModel
+from verdes.engine.batch import RenderBatch
+from verdes.engine.loader import Loader
+from verdes.engine.profiler import FrameProfiler
+from verdes.engine.quality import QualityGovernor
+from verdes.engine.timestep import FixedTimestep
+from verdes.engine.sprites import sprites
+from verdes.world.crops import MAX_GROWTH_STAGE
+from verdes.world.generator import OBJECT_TYPES
+from verdes.world.tile_grid import DEFAULT_PALETTE
 
 # Pygame Zero global değişkenleri
 # Bunlar pgzrun tarafından otomatik olarak tanınır
@@ -25,8 +37,9 @@ HEIGHT = 600
 TITLE = "Verde - AI Farming Simulator"
 
 # Oyun durumu ve nesneleri
-game_state = "menu"  # "menu", "playing", "paused", "inventory", "shop", "dialogue"
-world = None
+game_state = "loading"  # "loading", "menu", "playing", "paused", "inventory", "shop", "dialogue"
+world = None  # Etkin dünya
+world_manager = None
 player = None
 npcs = []
 time_system = None
@@ -35,6 +48,17 @@ item_db = None
 ui_manager = None
 dialogue_system = None
 behavior_model = None
+loader = None  # Açılış yükleyicisi (yükleme bitince None)
+config = None
+character_batch = RenderBatch()  # NPC ve oyuncu katmanı tek blits çağrısıyla çizilir
+profiler = FrameProfiler()  # F3: bölüm süreleri, F5: Chrome izi kaydı
+timestep = FixedTimestep()  # Simülasyon tık hızı (yapılandırmadan ayarlanır)
+menu_background = None  # İlk menü çiziminde oluşturulur (tohumlamadan sonra)
+quality = QualityGovernor()  # Kare bütçesine göre efekt seviyesi (yapılandırmadan ayarlanır)
+last_frame_ms = None  # Son karenin iş süresi (kalite yöneticisine verilir)
+
+SEASONS = ["spring", "summer", "fall", "winter"]
+DIRECTIONS = ["up", "down", "left", "right"]
 
 # UI durumu
 selected_menu_item = 0
@@ -43,33 +67,74 @@ show_debug = False
 last_fps = 0
 fps_sum = 0
 fps_count = 0
+hud_values = None  # HUD'un son örneklenen değerleri (kalite seviyesine göre yenilenir)
+hud_age = 0.0
+
+def startup_sprite_keys():
+    """Açılışta önceden çözülecek sprite anahtarları"""
+    keys = [("tile", tile_type, season) for tile_type in DEFAULT_PALETTE for season in SEASONS]
+    keys += [("object", obj_type, season) for obj_type in OBJECT_TYPES for season in SEASONS]
+    keys += [("character", name, direction) for name in ["player"] + [npc["name"] for npc in DEFAULT_NPCS]
+             for direction in DIRECTIONS]
+    keys += [("crop", crop_type, stage) for crop_type in ["turnip", "potato", "tomato", "pumpkin"]
+             for stage in range(MAX_GROWTH_STAGE + 1)]
+    keys.append(("overlay", "water_overlay"))
+    return keys
 
 def setup_game():
-    """Oyun öğelerini yükle ve ayarla"""
-    global world, player, npcs, time_system, economy_system, item_db, ui_manager, dialogue_system, behavior_model
+    """Bağımsız yükleme işlerini arka planda başlat (ekranda yükleme çubuğu çizilir)"""
+    global config, world_manager, loader, game_state, timestep, quality
     
     # Gerekli dizinlerin varlığını kontrol et
     ensure_directories_exist()
     
     # Yapılandırmayı yükle
     config = load_config()
+    rng.reseed(config.get("gameplay", {}).get("rng_seed"))  # None: her açılışta farklı
+    world_manager = WorldManager(config)
+    gameplay = config.get("gameplay", {})
+    timestep = FixedTimestep(gameplay.get("tick_rate", 30), gameplay.get("max_steps_per_frame", 5))
+    display = config.get("display", {})
+    quality = QualityGovernor(display.get("target_fps", 60), enabled=display.get("adaptive_quality", True))
+    quality.add_listener(lambda tier: apply_quality())
+    
+    # Eşya kataloğu, dükkanlar, harita, modeller ve sprite'lar birbirinden bağımsız yüklenir
+    loader = Loader()
+    loader.add("items", ItemDatabase)
+    loader.add("shops", EconomySystem)
+    loader.add("world", world_manager.get, config.get("world", {}).get("start_map", "farm"), weight=3)
+    loader.add("dialogue", DialogueSystem, config)
+    loader.add("behavior", BehaviorModel, config, weight=2)
+    loader.add("sprites", sprites.preload, startup_sprite_keys(), False, weight=2)
+    loader.start()
+    game_state = "loading"
+
+def finish_setup():
+    """Yükleme bitince kalan (ana iş parçacığına bağlı) öğeleri kur"""
+    global world, player, npcs, time_system, economy_system, item_db, ui_manager, dialogue_system, behavior_model
+    global loader, game_state
     
-    # Veritabanı ve ekonomi sistemini yükle
-    item_db = ItemDatabase()
-    economy_system = EconomySystem()
-    
-    # Dünya oluştur
-    world = World("farm", config)
+    # Yükleme sonuçları (bir iş hata verdiyse burada fırlatılır)
+    item_db = loader.result("items")
+    economy_system = loader.result("shops")
+    loader.result("world")
+    loader.result("sprites")
+    dialogue_system = loader.result("dialogue")
+    behavior_model = loader.result("behavior")
+    loader.close()
+    loader = None
     
-    # Yapay zeka sistemleri
-    dialogue_system = DialogueSystem(config)
-    behavior_model = BehaviorModel(config)
+    # Dünya zaten bellekte, yalnızca etkin yapılır
+    world = world_manager.set_active(config.get("world", {}).get("start_map", "farm"))
     
     # Oyuncu oluştur
     player = Player(WIDTH // 2, HEIGHT // 2)
+    player.world = world
     
-    # Zaman sistemi oluştur
+    # Zaman sistemi oluştur (gün dönümlerinde bitkiler büyür)
     time_system = TimeSystem()
+    time_system.add_day_listener(world_manager.advance_days)
+    time_system.add_day_listener(lambda days: world_manager.save())  # Gün dönümünde (gece yarısı) otomatik kayıt
     
     # UI yöneticisi
     ui_manager = UIManager()
@@ -77,24 +142,15 @@ def setup_game():
     
     # NPC'ler oluştur
     create_npcs()
+    
+    # Yükleme süresi ilk karede telafi edilmesin
+    timestep.reset()
+    game_state = "menu"
 
 def create_npcs():
     """NPC'leri oluştur"""
     global npcs
-    
-    # Örnek NPC'ler
-    npc_data = [
-        {"name": "farmer", "x": 200, "y": 200, "type": "villager"},
-        {"name": "shopkeeper", "x": 500, "y": 300, "type": "shopkeeper"},
-        {"name": "miner", "x": 350, "y": 250, "type": "villager"},
-        {"name": "fisher", "x": 650, "y": 150, "type": "villager"}
-    ]
-    
-    npcs = []
-    for data in npc_data:
-        npc = NPC(data["name"], data["x"], data["y"])
-        npc.npc_type = data["type"]
-        npcs.append(npc)
+    npcs = spawn_npcs(world)
 
 def setup_ui():
     """UI öğelerini oluştur"""
@@ -220,6 +276,17 @@ def start_new_game():
     game_state = "playing"
     ui_manager.hide_screen("main_menu")
 
+def change_world(warp):
+    """Geçiş noktasından hedef haritaya geç"""
+    global world
+    world = world_manager.set_active(warp["target"])
+    player.world = world
+    player.x, player.y = world.tile_center(warp["target_x"], warp["target_y"])
+    player.store_previous()  # Eski konumdan ara değer alınmasın
+    world.camera.follow(player)
+    apply_quality()
+    timestep.reset()  # Harita yükleme süresi telafi edilmesin
+
 def load_game():
     """Kaydedilmiş oyunu yükle"""
     # TODO: Oyun yükleme işlevi
@@ -227,8 +294,10 @@ def load_game():
 
 def save_game():
     """Oyunu kaydet"""
-    # TODO: Oyun kaydetme işlevi
-    pass
+    # Harita değişiklikleri günlüğe eklenir (harita boyutundan bağımsız)
+    if world_manager:
+        world_manager.save()
+    # TODO: Oyuncu ve zaman durumunu kaydetme
 
 def show_settings():
     """Ayarlar menüsünü göster"""
@@ -237,6 +306,8 @@ def show_settings():
 
 def exit_game():
     """Oyundan çık"""
+    if world_manager:
+        world_manager.close()
     exit()
 
 def resume_game():
@@ -244,6 +315,7 @@ def resume_game():
     global game_state
     game_state = "playing"
     ui_manager.hide_screen("pause_menu")
+    timestep.reset()  # Duraklatma süresi telafi edilmesin
 
 def return_to_menu():
     """Ana menüye dön"""
@@ -305,6 +377,8 @@ def load_config():
             "width": WIDTH,
             "height": HEIGHT,
             "fullscreen": False,
+            "target_fps": 60,  # Kalite yöneticisinin kare bütçesi
+            "adaptive_quality": True,  # Yavaş karelerde efektleri azalt
         },
         "audio": {
             "music_volume": 0.5,
@@ -313,10 +387,25 @@ def load_config():
         "gameplay": {
             "day_length_minutes": 15,  # Gerçek dakika cinsinden 
             "season_days": 28,
+            "rng_seed": None,  # Oyun rastgeleliği tohumu (None: rastgele)
+            "tick_rate": 30,  # Simülasyon adımı/saniye (çizim bundan bağımsız)
+            "max_steps_per_frame": 5,  # Yavaş karelerde telafi sınırı
         },
         "ai": {
             "use_simple_ai": True,  # Basit AI kullan (daha hafif)
             "dialogue_model": "small",  # 'small', 'medium', 'none'
+        },
+        "weather": {
+            "rain_particles": 100,  # Yağmur damlası sayısı
+            "storm_particles": 200,  # Fırtınada damla sayısı
+        },
+        "world": {
+            "seed": None,  # Harita üreteci tohumu (None: rastgele)
+            "width": 40,  # Yeni üretilen haritanın boyutu (tile)
+            "height": 30,
+            "start_map": "farm",  # Oyunun başladığı harita
+            "max_loaded_maps": 3,  # Bellekte tutulan en fazla harita
+            "preload_distance": 8,  # Geçişe bu kadar tile yaklaşınca hedef önceden yüklenir
         }
     }
     
@@ -352,12 +441,15 @@ def ensure_directories_exist():
 
 def draw():
     """Her karede çağrılır - ekran çizimi"""
-    global fps_sum, fps_count, last_fps
+    global fps_sum, fps_count, last_fps, last_frame_ms
     
     # Ekranı temizle
     screen.clear()
     
-    if game_state == "menu":
+    if game_state == "loading":
+        draw_loading_screen()
+    
+    elif game_state == "menu":
         # Menü arka planı
         draw_menu_background()
         
@@ -366,24 +458,33 @@ def draw():
             ui_manager.draw(screen)
     
     elif game_state in ["playing", "inventory", "shop", "dialogue", "paused"]:
+        # Kamera ve karakterler son iki simülasyon tıkı arasındaki konumda çizilir
+        alpha = timestep.alpha
+        
         # Oyun dünyasını çiz
         if world:
-            world.draw()
-        
-        # NPC'leri çiz
-        for npc in npcs:
-            npc.draw()
+            with profiler.section("world.draw"), world.camera.interpolated(alpha):
+                world.draw()
         
-        # Oyuncuyu çiz
-        if player:
-            player.draw()
+        with profiler.section("characters.draw"):
+            # NPC'leri çiz (yalnızca etkin haritadakiler)
+            for npc in npcs:
+                if npc.world is world:
+                    npc.draw(character_batch, alpha)
+            
+            # Oyuncuyu çiz
+            if player:
+                player.draw(character_batch, alpha)
+            character_batch.flush(screen.surface)
         
         # Oyun HUD'unu çiz
-        draw_hud()
+        with profiler.section("hud.draw"):
+            draw_hud()
         
         # UI yöneticisi ile ekranları çiz (envanteri, diyalogları vb.)
         if ui_manager:
-            ui_manager.draw(screen)
+            with profiler.section("ui.draw"):
+                ui_manager.draw(screen)
         
         if game_state == "paused":
             # Yarı saydam karartma (dondurulmuş oyun üzerine)
@@ -402,59 +503,141 @@ def draw():
             fps_count = 0
         
         # FPS değerini göster
-        fps_text = f"FPS: {int(last_fps)}"
+        fps_text = f"FPS: {int(last_fps)}  Kalite: {quality.tier['name']}"
         screen.draw.text(fps_text, (10, 10), color=(255, 255, 0), fontsize=16)
+        
+        # Alt sistem süreleri (ms)
+        profiler.draw(screen.surface, 10, 50)
     
     # Debug bilgileri
     if show_debug and player:
         debug_text = f"X: {int(player.x)}, Y: {int(player.y)}, Dir: {player.direction}"
         screen.draw.text(debug_text, (10, 30), color=(0, 255, 255), fontsize=16)
+    
+    last_frame_ms = profiler.end_frame()
 
 def update(dt):
     """Her karede çağrılır - oyun mantığı güncellemesi"""
+    global hud_age
+    
     # Fare ve klavye durumunu güncelle
     mouse_x, mouse_y = pygame.mouse.get_pos() if 'pygame' in globals() else (0, 0)
     
-    # Dünyayı güncelle
+    # Kare süresi güncellemenin başından çizimin sonuna kadar ölçülür
+    profiler.begin_frame()
+    
+    # Arka plan yüklemesi bittiyse kurulumu tamamla
+    if game_state == "loading":
+        if loader and loader.done:
+            finish_setup()
+        return
+    
+    # Menü arka planının hareketli katmanı
+    if game_state == "menu" and menu_background:
+        menu_background.update(dt)
+    
+    # Simülasyon sabit tık hızında ilerler; artan süre çizimde ara değer olarak kullanılır
     if game_state == "playing":
-        # Zaman sistemi güncelle
-        if time_system:
-            time_system.update(dt)
+        hud_age += dt
+        
+        # Son kare bütçeyi aştıysa efekt seviyesini düşür (yeterince hızlıysa yükselt)
+        quality.update(last_frame_ms, dt)
+        
+        for _ in range(timestep.advance(dt)):
+            simulate_tick(timestep.dt)
         
-        # Dünyayı güncelle
+        # Hava efektleri kare hızında akar
         if world:
+            world.update_effects(dt)
+    
+    # UI güncelle
+    if ui_manager:
+        with profiler.section("ui.update"):
+            ui_manager.update(dt)
+
+def simulate_tick(dt):
+    """Tek sabit simülasyon adımı (zaman, dünya, oyuncu ve NPC'ler)"""
+    # Çizimde önceki ve yeni konum arasında ara değer alınır
+    if player:
+        player.store_previous()
+    for npc in npcs:
+        npc.store_previous()
+    if world:
+        world.camera.store_previous()
+    
+    # Zaman sistemi güncelle
+    if time_system:
+        with profiler.section("time"):
+            time_system.update(dt)
+    
+    # Dünyayı güncelle
+    if world:
+        with profiler.section("world.update"):
             # Kamera oyuncuyu takip etsin
             if player and world.camera:
                 world.camera.follow(player)
             
-            world.update(dt)
-        
-        # Oyuncu güncelle
-        if player:
+            world.update(dt, effects=False)
+    
+    # Oyuncu güncelle
+    if player:
+        with profiler.section("player"):
             player.update(dt)
+            
+            # Yakındaki geçişlerin hedef haritalarını önceden yükle, geçişe basıldıysa haritayı değiştir
+            if world_manager:
+                warp = world_manager.update(*world.pixel_to_tile(player.x, player.y))
+                if warp:
+                    change_world(warp)
+    
+    # NPC'leri güncelle (yalnızca etkin haritadakiler)
+    animate_offscreen = quality.tier["offscreen_animation"]
+    for npc in npcs:
+        if npc.world is not world:
+            continue
+        npc.animate = animate_offscreen or is_on_screen(npc)
         
-        # NPC'leri güncelle
-        for npc in npcs:
-            # NPC davranışlarını yönet
-            if behavior_model:
-                # Dünya durumunu ve oyuncuyu davranış modeline gönder
+        # NPC davranışlarını yönet
+        if behavior_model:
+            # Dünya durumunu ve oyuncuyu davranış modeline gönder
+            with profiler.section(f"npc.{npc.name}.behavior"):
                 action = behavior_model.get_action(npc, world, player)
-                
-                # Eylem uygula
-                if action == "up":
-                    npc.move(0, -1, dt)
-                elif action == "down":
-                    npc.move(0, 1, dt)
-                elif action == "left":
-                    npc.move(-1, 0, dt)
-                elif action == "right":
-                    npc.move(1, 0, dt)
             
+            # Eylem uygula
+            if action == "up":
+                npc.move(0, -1, dt)
+            elif action == "down":
+                npc.move(0, 1, dt)
+            elif action == "left":
+                npc.move(-1, 0, dt)
+            elif action == "right":
+                npc.move(1, 0, dt)
+        
+        with profiler.section(f"npc.{npc.name}.update"):
             npc.update(dt)
-    
-    # UI güncelle
-    if ui_manager:
-        ui_manager.update(dt)
+
+def is_on_screen(actor, margin=32):
+    """Aktör etkin kameranın görüş alanında mı?"""
+    camera = world.camera
+    return (abs(actor.x - camera.x) <= camera.width / 2 + margin
+            and abs(actor.y - camera.y) <= camera.height / 2 + margin)
+
+def apply_quality():
+    """Kalite seviyesinin ayarlarını etkin dünyaya uygula"""
+    tier = quality.tier
+    if world:
+        world.effect_scale = tier["rain_scale"]
+        world.show_water_overlay = tier["water_overlay"]
+
+def toggle_trace():
+    """Chrome iz kaydını başlat; açıksa durdurup data/profiles altına yaz"""
+    global show_fps
+    if profiler.tracing:
+        profiler.export_trace(Path("data/profiles") / f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    else:
+        profiler.start_trace()
+    # Kayıt durumu ve yazılan dosya profil katmanında gösterilir
+    show_fps = True
 
 def on_key_down(key):
     """Tuşa basıldığında çağrılır"""
@@ -469,6 +652,8 @@ def on_key_down(key):
         show_fps = not show_fps
     elif key == keys.F4:
         show_debug = not show_debug
+    elif key == keys.F5:
+        toggle_trace()
     
     # Menüdeyken
     if game_state == "menu":
@@ -482,6 +667,10 @@ def on_key_down(key):
             ui_manager.show_screen("pause_menu")
         elif key == keys.E or key == keys.I:
             show_inventory()
+        elif key == keys.Z:
+            # Uyu ve bir sonraki sabaha geç
+            if time_system:
+                time_system.sleep()
             
         # Etkileşim tuşu
         elif key == keys.SPACE:
@@ -493,11 +682,11 @@ def on_key_down(key):
                 # Eğer NPC yoksa, farming etkileşimi
                 if player:
                     # Seçili öğeye göre eylem yap
-                    selected_slot = player.inventory.slots[player.inventory.selected_slot]
+                    selected_slot = player.inventory.get_selected_slot()
                     if selected_slot.item:
-                        if selected_slot.item.category == "seed":
+                        if selected_slot.item.item_type == ItemType.SEED:
                             player.plant_seed(selected_slot.item.id)
-                        elif selected_slot.item.category == "tool":
+                        elif selected_slot.item.item_type == ItemType.TOOL:
                             player.use_tool(selected_slot.item.id)
                         else:
                             # Hasat denemesi
@@ -506,8 +695,8 @@ def on_key_down(key):
         # Envanter yuva seçimi (1-9 tuşları)
         elif keys.K_1 <= key <= keys.K_9:
             slot_index = key - keys.K_1
-            if player and slot_index < len(player.inventory.slots):
-                player.inventory.selected_slot = slot_index
+            if player:
+                player.inventory.select_slot(slot_index)
     
     # Envanter ekranında
     elif game_state == "inventory":
@@ -537,11 +726,11 @@ def on_mouse_down(pos, button):
             # Oyuncunun aktif aletini veya eğer tohum seçiliyse ekme işlemini yap
             if player:
                 # Seçili öğeye göre eylem yap
-                selected_slot = player.inventory.slots[player.inventory.selected_slot]
+                selected_slot = player.inventory.get_selected_slot()
                 if selected_slot.item:
-                    if selected_slot.item.category == "seed":
+                    if selected_slot.item.item_type == ItemType.SEED:
                         player.plant_seed(selected_slot.item.id)
-                    elif selected_slot.item.category == "tool":
+                    elif selected_slot.item.item_type == ItemType.TOOL:
                         player.use_tool(selected_slot.item.id)
 
 def find_closest_npc():
@@ -564,35 +753,57 @@ def find_closest_npc():
     
     return closest_npc
 
+def draw_loading_screen():
+    """Yükleme ekranı: ilerleme çubuğu ve süren işler"""
+    screen.fill((20, 60, 20))
+    screen.draw.text("Yükleniyor...", center=(WIDTH // 2, HEIGHT // 2 - 40), fontsize=36, color="white")
+    
+    bar_width, bar_height = WIDTH // 2, 20
+    bar_x, bar_y = (WIDTH - bar_width) // 2, HEIGHT // 2
+    progress = loader.progress if loader else 1.0
+    screen.draw.filled_rect(Rect(bar_x, bar_y, bar_width, bar_height), (40, 40, 40))
+    screen.draw.filled_rect(Rect(bar_x, bar_y, int(bar_width * progress), bar_height), (100, 200, 100))
+    screen.draw.rect(Rect(bar_x, bar_y, bar_width, bar_height), (200, 200, 200))
+    
+    if loader and loader.pending:
+        screen.draw.text(", ".join(loader.pending), center=(WIDTH // 2, bar_y + 40), fontsize=18,
+                         color=(200, 200, 200))
+
 def draw_menu_background():
-    """Menü arka planını çiz"""
-    # Basit bir gradient arka plan
-    for y in range(0, HEIGHT, 2):
-        # Üstten alta doğru renk geçişi
-        color_value = int(180 * (1 - y / HEIGHT))
-        color = (20, color_value, 20)
-        screen.draw.line((0, y), (WIDTH, y), color)
-    
-    # Rastgele "yıldızlar" (çiftçilik teması için küçük bitkiler gibi)
-    for _ in range(50):
-        x = random.randint(0, WIDTH)
-        y = random.randint(0, HEIGHT)
-        size = random.randint(1, 3)
-        color = (100 + random.randint(0, 155), 200 + random.randint(0, 55), 100 + random.randint(0, 55))
-        screen.draw.filled_circle((x, y), size, color)
+    """Menü arka planını çiz (durağan katman önbellekten, ekran boyutu değişince yeniden)"""
+    global menu_background
+    if menu_background is None:
+        menu_background = MenuBackground()
+    menu_background.draw(screen.surface)
 
-def draw_hud():
-    """Oyun içi HUD'u çiz"""
+def sample_hud():
+    """HUD'da gösterilecek değerleri oku"""
+    values = {}
     if time_system:
+        values["time"] = f"Gün {time_system.day}, {time_system.hour:02d}:{time_system.minute:02d}"
+        values["season"] = f"Mevsim: {time_system.seasons[time_system.season]}"
+    if player:
+        values["energy"] = player.energy / player.max_energy
+        values["energy_text"] = f"Enerji: {int(player.energy)}/{player.max_energy}"
+        values["money"] = f"Para: ${player.money}"
+    return values
+
+def draw_hud():
+    """Oyun içi HUD'u çiz (değerler kalite seviyesinin aralığıyla yenilenir)"""
+    global hud_values, hud_age
+    if hud_values is None or hud_age >= quality.tier["hud_interval"]:
+        hud_values = sample_hud()
+        hud_age = 0.0
+    values = hud_values
+    
+    if "time" in values:
         # Zaman bilgisi
-        time_text = f"Gün {time_system.day}, {time_system.hour:02d}:{time_system.minute:02d}"
-        screen.draw.text(time_text, topright=(WIDTH-10, 10), fontsize=20, color="white", shadow=(1, 1))
+        text_cache.draw(screen.surface, values["time"], 20, "white", shadow=(1, 1), topright=(WIDTH-10, 10))
         
         # Mevsim
-        season_text = f"Mevsim: {time_system.seasons[time_system.season]}"
-        screen.draw.text(season_text, topright=(WIDTH-10, 35), fontsize=16, color="white", shadow=(1, 1))
+        text_cache.draw(screen.surface, values["season"], 16, "white", shadow=(1, 1), topright=(WIDTH-10, 35))
     
-    if player:
+    if player and "energy" in values:
         # Enerji çubuğu
         energy_width = 150
         energy_height = 15
@@ -603,16 +814,14 @@ def draw_hud():
         screen.draw.filled_rect(Rect((energy_x, energy_y), (energy_width, energy_height)), (50, 50, 50))
         
         # Enerji seviyesi
-        energy_level = int((player.energy / player.max_energy) * energy_width)
+        energy_level = int(values["energy"] * energy_width)
         screen.draw.filled_rect(Rect((energy_x, energy_y), (energy_level, energy_height)), (50, 200, 50))
         
         # Metin
-        energy_text = f"Enerji: {int(player.energy)}/{player.max_energy}"
-        screen.draw.text(energy_text, (energy_x + 5, energy_y + 2), fontsize=12, color="white")
+        text_cache.draw(screen.surface, values["energy_text"], 12, "white", topleft=(energy_x + 5, energy_y + 2))
         
         # Para
-        money_text = f"Para: ${player.money}"
-        screen.draw.text(money_text, (energy_x, energy_y + 25), fontsize=16, color="white", shadow=(1, 1))
+        text_cache.draw(screen.surface, values["money"], 16, "white", shadow=(1, 1), topleft=(energy_x, energy_y + 25))
         
         # Seçili envanter yuvası
         draw_inventory_bar()
@@ -640,42 +849,39 @@ def draw_inventory_bar():
         y = start_y
         
         # Yuva arka planı
-        slot_color = (60, 60, 60) if i == player.inventory.selected_slot else (40, 40, 40)
+        slot_color = (60, 60, 60) if i == player.inventory.selected_slot_index else (40, 40, 40)
         screen.draw.filled_rect(Rect((x, y), (slot_size, slot_size)), slot_color)
         
         # Yuva sınırı
-        border_color = (200, 200, 100) if i == player.inventory.selected_slot else (100, 100, 100)
+        border_color = (200, 200, 100) if i == player.inventory.selected_slot_index else (100, 100, 100)
         screen.draw.rect(Rect((x, y), (slot_size, slot_size)), border_color)
         
         # Eğer yuvada eşya varsa, çiz
         slot = player.inventory.slots[i]
         if slot.item:
-            # Eşya sprite'ı
-            item_image = f"assets/images/items/{slot.item.icon}"
-            try:
-                item_actor = Actor(item_image)
-                item_actor.x = x + slot_size // 2
-                item_actor.y = y + slot_size // 2
-                item_actor.draw()
-            except:
+            # Eşya sprite'ı (kayıt defterinden, bir kez çözümlenir)
+            item_image = sprites.get(("file", slot.item.icon_path)) if slot.item.icon_path else None
+            if item_image:
+                screen.surface.blit(item_image, item_image.get_rect(center=(x + slot_size // 2, y + slot_size // 2)))
+            else:
                 # Sprite yoksa, basit bir şekil çiz
-                color = (200, 100, 100) if slot.item.category == "tool" else (100, 200, 100)
+                color = (200, 100, 100) if slot.item.item_type == ItemType.TOOL else (100, 200, 100)
                 screen.draw.filled_circle((x + slot_size // 2, y + slot_size // 2), slot_size // 3, color)
                 
                 # Eşya adının ilk harfi
                 item_initial = slot.item.name[0].upper()
-                screen.draw.text(item_initial, center=(x + slot_size // 2, y + slot_size // 2), 
-                                fontsize=14, color="white")
+                text_cache.draw(screen.surface, item_initial, 14, "white",
+                                center=(x + slot_size // 2, y + slot_size // 2))
             
             # Eğer yığınlanabilir bir eşyaysa ve birden fazla varsa, sayıyı göster
-            if slot.item.stackable and slot.count > 1:
-                count_text = str(slot.count)
-                screen.draw.text(count_text, bottomright=(x + slot_size - 2, y + slot_size - 2), 
-                               fontsize=12, color="white", shadow=(1, 1))
+            if slot.item.stack_size > 1 and slot.quantity > 1:
+                count_text = str(slot.quantity)
+                text_cache.draw(screen.surface, count_text, 12, "white", shadow=(1, 1),
+                                bottomright=(x + slot_size - 2, y + slot_size - 2))
         
         # Kısayol numarası
         key_text = str(i + 1)
-        screen.draw.text(key_text, topleft=(x + 2, y + 2), fontsize=10, color=(200, 200, 200))
+        text_cache.draw(screen.surface, key_text, 10, (200, 200, 200), topleft=(x + 2, y + 2))
 
 # Ana modül ise oyunu başlat
 if __name__ == "__main__":
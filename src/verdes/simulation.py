@@ -0,0 +1,96 @@
+"""
+Ekransız simülasyon - dünya, zaman, NPC'ler ve ekonomi için çizimsiz oyun döngüsü.
+"""
+from pathlib import Path
+from typing import Optional
+import yaml
+from verdes.entities.npc import spawn_npcs
+from verdes.systems.economy import EconomySystem
+from verdes.systems.rng import rng
+from verdes.systems.time import TimeSystem
+from verdes.world.world_manager import WorldManager
+
+# TimeSystem mevsim sırası -> dünya mevsim adları
+SEASON_NAMES = ["spring", "summer", "fall", "winter"]
+
+# Yapılandırma dosyası yoksa dünyanın ihtiyaç duyduğu en az ayar
+DEFAULT_DISPLAY = {"width": 800, "height": 600}
+
+
+def load_config(path="data/config/game_config.yaml"):
+    """Oyun yapılandırmasını oku (dosya yoksa varsayılanlar)"""
+    config = {}
+    path = Path(path)
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+    config.setdefault("display", dict(DEFAULT_DISPLAY))
+    return config
+
+
+class Simulation:
+    """Pygame Zero ve ekran olmadan sabit adımlı oyun döngüsü
+
+    ``game.update`` döngüsünün çizimsiz karşılığıdır: zaman sistemi, NPC'ler
+    ve dükkanlar sabit ``dt`` ile CPU'nun izin verdiği hızda ilerler; gün
+    dönümleri bitkileri büyütür. Kamera, hava efektleri ve çizim hiç
+    çalıştırılmaz, bu yüzden ekran, ``keyboard`` veya ``clock`` gerekmez.
+    """
+
+    def __init__(self, config, map_name: str = "farm", dt: float = 1 / 30,
+                 seed: Optional[int] = None, economy: bool = True):
+        # Aynı tohumla koşular birebir tekrarlanır (verilmezse yapılandırmadaki tohum)
+        rng.reseed(seed if seed is not None else config.get("gameplay", {}).get("rng_seed"))
+        self.config = config
+        self.dt = dt
+        self.world_manager = WorldManager(config)
+        self.world = self.world_manager.set_active(map_name)
+        self.npcs = spawn_npcs(self.world)
+        self.economy = EconomySystem() if economy else None
+
+        self.time_system = TimeSystem()
+        self.time_system.add_day_listener(self._on_new_day)
+        self.steps = 0
+        self.days = 0
+
+    def _on_new_day(self, days: int) -> None:
+        self.world.set_season(SEASON_NAMES[self.time_system.season])
+        self.world_manager.advance_days(days)
+        if self.economy:
+            self.economy.update_all_shops()
+        self.days += days
+
+    def step(self) -> None:
+        """Tek sabit adım"""
+        dt = self.dt
+        self.time_system.update(dt)
+        for npc in self.npcs:
+            if npc.world is self.world:
+                npc.update(dt)
+        self.steps += 1
+
+    def run_days(self, days: int) -> dict:
+        """``days`` gün dönümü olana kadar adım at, özeti döndür"""
+        target = self.days + days
+        while self.days < target:
+            self.step()
+        return self.summary()
+
+    def summary(self) -> dict:
+        """Simülasyonun anlık özeti (denge ve regresyon karşılaştırmaları için)"""
+        store = self.world.crop_store
+        alive = store.alive_mask
+        return {
+            "steps": self.steps,
+            "days": self.days,
+            "date": self.time_system.get_date(),
+            "season": self.world.current_season,
+            "crops": int(alive.sum()),
+            "mature_crops": int(store.mature_mask().sum()),
+            "withered_crops": int((alive & store.data["withered"]).sum()),
+            "pathfinder_searches": self.world.pathfinder.stats["searches"],
+        }
+
+    def close(self, save: bool = False) -> None:
+        """Dünyaları kapat (``save`` ise değişiklikleri haritaya yaz)"""
+        self.world_manager.close(save)
@@ -7,7 +7,7 @@ import random
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class ItemType(Enum):
@@ -22,6 +22,15 @@ class ItemType(Enum):
     GIFT = 7
 
 
+# Area covered by a tool at each level as (width across, length forward) in tiles
+TOOL_AREAS = {
+    1: (1, 1),
+    2: (1, 3),
+    3: (3, 3),
+    4: (5, 5),
+}
+
+
 class ItemQuality(Enum):
     """Quality levels for items"""
     NORMAL = 0
@@ -92,6 +101,11 @@ class Tool(Item):
     def __post_init__(self):
         if not self.item_type == ItemType.TOOL:
             self.item_type = ItemType.TOOL
+    
+    def get_area(self) -> Tuple[int, int]:
+        """Get the (width, length) in tiles this tool affects in one use"""
+        level = min(max(self.tool_level, min(TOOL_AREAS)), max(TOOL_AREAS))
+        return TOOL_AREAS[level]
 
 
 @dataclass
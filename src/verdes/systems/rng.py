@@ -0,0 +1,95 @@
+"""
+Rastgelelik servisi - her alt sistem için bağımsız ve tohumlanabilir akışlar.
+"""
+import zlib
+from typing import Dict, List, Optional, Sequence, TypeVar
+import numpy as np
+
+T = TypeVar("T")
+
+
+class RandomStream:
+    """Tek bir alt sistemin rastgele sayı akışı
+
+    NumPy ``Generator`` üzerine kuruludur. Tekil değerler (``random``,
+    ``randint``, ``choice``) ``batch_size`` büyüklüğünde önceden üretilmiş bir
+    tampondan verilir, böylece her çağrı NumPy'ye inmez; toplu değerler için
+    ``generator`` doğrudan kullanılabilir.
+    """
+
+    def __init__(self, seed_sequence: np.random.SeedSequence, batch_size: int = 256):
+        self.batch_size = batch_size
+        self.generator = np.random.Generator(np.random.PCG64(seed_sequence))
+        self._buffer: List[float] = []
+
+    def reset(self, seed_sequence: np.random.SeedSequence) -> None:
+        """Akışı verilen tohum dizisiyle baştan başlat
+
+        Üreteç nesnesi yerinde yeniden tohumlanır; ``generator`` referansını
+        tutan sistemler (ör. parçacıklar) yeni akışı kullanmaya devam eder.
+        """
+        self.generator.bit_generator.state = np.random.PCG64(seed_sequence).state
+        self._buffer = []
+
+    def random(self) -> float:
+        """[0, 1) aralığında sayı"""
+        if not self._buffer:
+            # Sondan alındığı için ters sırada sakla
+            self._buffer = self.generator.random(self.batch_size).tolist()[::-1]
+        return self._buffer.pop()
+
+    def uniform(self, low: float, high: float) -> float:
+        """[low, high) aralığında sayı"""
+        return low + (high - low) * self.random()
+
+    def randint(self, low: int, high: int) -> int:
+        """[low, high] (dahil) aralığında tamsayı"""
+        return low + min(int(self.random() * (high - low + 1)), high - low)
+
+    def randrange(self, stop: int) -> int:
+        """[0, stop) aralığında tamsayı (büyük aralıklar için doğrudan üreteçten)"""
+        return int(self.generator.integers(stop))
+
+    def choice(self, options: Sequence[T]) -> T:
+        """Diziden rastgele bir öğe"""
+        return options[min(int(self.random() * len(options)), len(options) - 1)]
+
+
+class RNGService:
+    """Alt sistem adlarına göre bağımsız rastgele akışlar
+
+    Her akış ana tohumdan ve alt sistemin adından türetilir. Bu yüzden bir alt
+    sistemin ne kadar rastgele sayı tükettiği diğerlerini etkilemez (ör.
+    yağmur çizimi NPC davranışlarını değiştirmez) ve aynı tohumla yapılan
+    koşular birebir tekrarlanır. Tohum verilmezse işletim sisteminden alınır.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self._streams: Dict[str, RandomStream] = {}
+        self.reseed(seed)
+
+    def _sequence(self, name: str) -> np.random.SeedSequence:
+        return np.random.SeedSequence(self.seed, spawn_key=(zlib.crc32(name.encode("utf-8")),))
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        """Ana tohumu değiştir; var olan akışlar da yerinde yeniden başlar"""
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+        self.seed = seed
+        for name, stream in self._streams.items():
+            stream.reset(self._sequence(name))
+
+    def stream(self, name: str) -> RandomStream:
+        """Alt sistemin akışı (ilk istekte oluşturulur)"""
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = RandomStream(self._sequence(name))
+        return stream
+
+    def generator(self, name: str) -> np.random.Generator:
+        """Alt sistemin NumPy üreteci (toplu değerler için)"""
+        return self.stream(name).generator
+
+
+# Oyun genelinde paylaşılan servis
+rng = RNGService()
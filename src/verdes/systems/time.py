@@ -15,6 +15,7 @@ class TimeSystem:
         self.day_length = 15 * 60  # Gerçek saniyeler (15 dakika = 1 oyun günü)
         self.time_scale = 1.0  # Zaman akış hızı çarpanı
         self.paused = False
+        self._day_listeners = []  # Gün dönümünde çağrılır: callback(geçen_gün_sayısı)
     
     def update(self, dt):
         """Zamanı güncelle"""
@@ -37,22 +38,54 @@ class TimeSystem:
             
             # Saat gün değişimi
             if self.hour >= 24:
-                self.day += 1
+                days = self.hour // 24
+                self.day += days
                 self.hour %= 24
                 
                 # Yeni gün olayları
-                self._on_new_day()
+                self._on_new_day(days)
     
-    def _on_new_day(self):
-        """Yeni gün başladığında çağrılır"""
+    def add_day_listener(self, callback):
+        """Gün dönümünde çağrılacak fonksiyonu kaydet (callback(days))"""
+        self._day_listeners.append(callback)
+    
+    def remove_day_listener(self, callback):
+        """Kayıtlı gün dinleyicisini kaldır"""
+        if callback in self._day_listeners:
+            self._day_listeners.remove(callback)
+    
+    def _on_new_day(self, days=1):
+        """Yeni gün başladığında çağrılır (days: aynı anda geçen gün sayısı)"""
         # 28 gün sonra sezon değişimi
-        if self.day > 28:
-            self.day = 1
+        while self.day > 28:
+            self.day -= 28
             self.season = (self.season + 1) % 4
             
             # Yeni sezon
             if self.season == 0:
                 self.year += 1
+        
+        # Günlük işlemler (bitki büyümesi vb.) tek çağrıda tüm günleri işler
+        for callback in self._day_listeners:
+            callback(days)
+    
+    def skip_days(self, days=1):
+        """Belirtilen gün sayısı kadar ileri sar ve sabah 6:00'dan başla"""
+        if days <= 0:
+            return
+        self.day += days
+        self.hour = 6
+        self.minute = 0
+        self._on_new_day(days)
+    
+    def sleep(self):
+        """Uyu: bir sonraki sabaha geç"""
+        if self.hour < 6:
+            # Gece yarısından sonra yatıldıysa gün zaten değişmiştir
+            self.hour = 6
+            self.minute = 0
+        else:
+            self.skip_days(1)
     
     def get_time_of_day(self):
         """Günün zamanını insan tarafından okunabilir biçimde döndür"""
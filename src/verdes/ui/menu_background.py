@@ -0,0 +1,84 @@
+"""
+Menü arka planı - durağan katman bir kez çizilir, üstünde ucuz bir hareketli katman döner.
+"""
+import math
+from typing import List, Optional, Tuple
+import pygame
+from verdes.engine.batch import RenderBatch, circle_sprite
+from verdes.systems.rng import RandomStream, rng
+
+
+class MenuBackground:
+    """Önbelleğe alınmış menü arka planı
+
+    Renk geçişi ve küçük bitkiler çözünürlük başına bir kez ayrı bir yüzeye
+    çizilir; her karede yalnızca bu yüzey kopyalanır. Bitki konumları
+    oransal tutulur, bu yüzden ekran boyutu değişince aynı düzen yeni
+    boyutta yeniden çizilir. ``particles`` sıfırdan büyükse üstte yavaşça
+    süzülen birkaç ışık parçacığı (önceden çizilmiş sprite'lar) dolaşır.
+    """
+
+    def __init__(self, plants: int = 50, particles: int = 12,
+                 stream: Optional[RandomStream] = None):
+        stream = stream or rng.stream("menu")
+        # (oransal x, oransal y, yarıçap, renk)
+        self.plants: List[Tuple[float, float, int, Tuple[int, int, int]]] = [
+            (stream.random(), stream.random(), stream.randint(1, 3),
+             (100 + stream.randint(0, 155), 200 + stream.randint(0, 55), 100 + stream.randint(0, 55)))
+            for _ in range(plants)
+        ]
+        # (oransal x, başlangıç evresi, hız, salınım genliği)
+        self.particles = [
+            (stream.random(), stream.random(), stream.uniform(0.02, 0.06), stream.uniform(4, 12))
+            for _ in range(particles)
+        ]
+        self.time = 0.0
+        self._surface: Optional[pygame.Surface] = None
+        self._batch = RenderBatch()
+
+    @property
+    def size(self) -> Optional[Tuple[int, int]]:
+        """Önbellekteki yüzeyin boyutu (henüz çizilmediyse None)"""
+        return self._surface.get_size() if self._surface else None
+
+    def _build(self, size: Tuple[int, int]) -> pygame.Surface:
+        width, height = size
+        # Üstten alta renk geçişi: 1 piksel genişliğinde şerit yatayda büyütülür
+        strip = pygame.Surface((1, height))
+        for y in range(height):
+            strip.set_at((0, y), (20, int(180 * (1 - y / height)), 20))
+        surface = pygame.transform.scale(strip, (width, height))
+
+        # Küçük bitkiler ("yıldızlar")
+        for fx, fy, radius, color in self.plants:
+            pygame.draw.circle(surface, color, (int(fx * width), int(fy * height)), radius)
+
+        if pygame.display.get_surface():
+            surface = surface.convert()
+        return surface
+
+    def invalidate(self) -> None:
+        """Durağan katmanı bir sonraki çizimde yeniden oluştur"""
+        self._surface = None
+
+    def update(self, dt: float) -> None:
+        """Hareketli katmanın zamanını ilerlet"""
+        self.time += dt
+
+    def draw(self, target: pygame.Surface) -> None:
+        """Arka planı hedefe çiz (boyut değiştiyse önce yeniden oluştur)"""
+        size = target.get_size()
+        if self._surface is None or self._surface.get_size() != size:
+            self._surface = self._build(size)
+        target.blit(self._surface, (0, 0))
+
+        if not self.particles:
+            return
+        width, height = size
+        sprite = circle_sprite(2, (220, 255, 180, 160))
+        for fx, phase, speed, sway in self.particles:
+            # Aşağıdan yukarı süzülür, ekranı aşınca alttan yeniden girer
+            progress = (phase + self.time * speed) % 1.0
+            x = fx * width + math.sin((progress + phase) * 2 * math.pi * 3) * sway
+            self._batch.add_centered(sprite, x, height * (1 - progress))
+        self._batch.flush(target)
@@ -0,0 +1,94 @@
+"""
+Metin önbelleği - işlenmiş yazı yüzeylerini (yazı tipi, boyut, renk, metin) anahtarıyla saklar.
+"""
+import os
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import pygame
+
+# Yazı tipi dosyalarının aranacağı klasör
+FONT_DIRECTORY = "assets/fonts"
+
+
+class TextCache:
+    """Etiket, düğme ve HUD metinleri için paylaşılan, sınırlı yüzey önbelleği
+
+    ``font.render`` her karede çağrılmaz: aynı (yazı tipi, boyut, renk, metin,
+    gölge) için yüzey bir kez işlenip saklanır. Önbellek ``max_entries``
+    girdiyi aşınca en uzun süredir kullanılmayan girdi atılır; böylece sürekli
+    değişen metinler (saat, enerji) belleği büyütmez. Yazı tipi nesneleri de
+    (ad, boyut) başına bir kez oluşturulur.
+    """
+
+    def __init__(self, max_entries: int = 512, font_dir: str = FONT_DIRECTORY):
+        self.max_entries = max_entries
+        self.font_dir = font_dir
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        """Yazı tipi nesnesi (dosya yoksa Pygame'in varsayılan yazı tipi)"""
+        font = self._fonts.get((name, size))
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            path = os.path.join(self.font_dir, name) if name else None
+            if path and not os.path.exists(path):
+                path = None
+            font = self._fonts[(name, size)] = pygame.font.Font(path, size)
+        return font
+
+    def render(self, text: str, size: int = 24, color=(255, 255, 255),
+               name: Optional[str] = None, shadow: Optional[Tuple[int, int]] = None,
+               shadow_color=(0, 0, 0), antialias: bool = True) -> pygame.Surface:
+        """Metnin işlenmiş yüzeyi (önbellekte yoksa işlenip eklenir)"""
+        color = tuple(pygame.Color(color))
+        key = (name, size, color, text, antialias, shadow, tuple(pygame.Color(shadow_color)) if shadow else None)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        font = self.font(size, name)
+        surface = font.render(text, antialias, color)
+        if shadow:
+            # Gölge, metnin altına kaydırılmış olarak aynı yüzeye çizilir
+            dx, dy = shadow
+            shadow_surf = font.render(text, antialias, shadow_color)
+            width, height = surface.get_size()
+            combined = pygame.Surface((width + abs(dx), height + abs(dy)), pygame.SRCALPHA)
+            combined.blit(shadow_surf, (max(dx, 0), max(dy, 0)))
+            combined.blit(surface, (max(-dx, 0), max(-dy, 0)))
+            surface = combined
+        if pygame.display.get_surface():
+            surface = surface.convert_alpha()
+
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def draw(self, surface: pygame.Surface, text: str, size: int = 24, color=(255, 255, 255),
+             name: Optional[str] = None, shadow: Optional[Tuple[int, int]] = None,
+             **anchor) -> pygame.Rect:
+        """Metni hedefe çiz; konum ``topleft=``, ``center=``, ``topright=`` gibi verilir"""
+        text_surf = self.render(text, size, color, name, shadow)
+        rect = text_surf.get_rect(**anchor)
+        surface.blit(text_surf, rect)
+        return rect
+
+    def clear(self) -> None:
+        """Tüm yüzeyleri ve yazı tiplerini at (ör. ekran modu değişince)"""
+        self._surfaces.clear()
+        self._fonts.clear()
+
+
+# Oyun genelinde paylaşılan önbellek
+text_cache = TextCache()
@@ -5,6 +5,7 @@ from typing import Dict, List, Callable, Optional, Any, Tuple
 import pygame
 import os
 from pathlib import Path
+from verdes.ui.text_cache import text_cache
 
 class UIElement:
     """UI öğesi temel sınıfı"""
@@ -70,7 +71,7 @@ class Button(UIElement):
     def _init_font(self) -> None:
         """Yazı tipini başlat"""
         try:
-            self.font = pygame.font.Font(None, 24)  # Pygame'in varsayılan yazı tipi, 24pt
+            self.font = text_cache.font(24)  # Pygame'in varsayılan yazı tipi, 24pt
         except:
             pass
     
@@ -98,9 +99,8 @@ class Button(UIElement):
         
         # Düğme metni
         if self.text and self.font:
-            text_surf = self.font.render(self.text, True, self.text_color)
-            text_rect = text_surf.get_rect(center=(self.x + self.width/2, self.y + self.height/2))
-            surface.blit(text_surf, text_rect)
+            text_cache.draw(surface, self.text, 24, self.text_color,
+                            center=(self.x + self.width/2, self.y + self.height/2))
     
     def handle_event(self, event) -> bool:
         """Fare olaylarını işle"""
@@ -219,21 +219,25 @@ class Label(UIElement):
     def _init_font(self) -> None:
         """Yazı tipini başlat"""
         try:
-            if self.font_name and os.path.exists(f"assets/fonts/{self.font_name}"):
-                self.font = pygame.font.Font(f"assets/fonts/{self.font_name}", self.font_size)
-            else:
-                self.font = pygame.font.Font(None, self.font_size)  # Pygame'in varsayılan yazı tipi
+            # Dosya yoksa Pygame'in varsayılan yazı tipi
+            self.font = text_cache.font(self.font_size, self.font_name)
         except:
             pass
     
     def _update_size(self) -> None:
         """Metin boyutuna göre öğe boyutunu güncelle"""
         if self.font and self.text:
-            text_surf = self.font.render(self.text, True, self.text_color)
-            self.width, self.height = text_surf.get_size()
+            # Aynı yüzey çizimde önbellekten tekrar kullanılır
+            self.width, self.height = self._render().get_size()
+    
+    def _render(self):
+        """Metnin önbellekteki yüzeyi"""
+        return text_cache.render(self.text, self.font_size, self.text_color, self.font_name)
     
     def set_text(self, text: str) -> None:
         """Etiketteki metni değiştir"""
+        if text == self.text:
+            return
         self.text = text
         self._update_size()
     
@@ -242,7 +246,7 @@ class Label(UIElement):
         if not self.visible or not self.text or not self.font:
             return
         
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = self._render()
         
         if self.align == "center":
             text_rect = text_surf.get_rect(center=(self.x + self.width/2, self.y + self.height/2))
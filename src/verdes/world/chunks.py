@@ -0,0 +1,413 @@
+"""
+Parçalı (chunk) dünya akışı - çok büyük haritaları parça parça bellekte tutar.
+"""
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+import numpy as np
+from verdes.world.spatial_index import SpatialIndex, TileKey
+from verdes.world.tile_grid import TileGrid, TileRow
+
+# (x1, y1, x2, y2) -> (türler, yürünebilirlik)
+ChunkSource = Callable[[int, int, int, int], Tuple[np.ndarray, np.ndarray]]
+# (x1, y1, x2, y2) -> aralıktaki kayıtlar (``x``/``y`` alanlı sözlükler)
+EntrySource = Callable[[int, int, int, int], list]
+
+
+class _Chunk:
+    """Bellekteki tek bir parça"""
+
+    __slots__ = ("types", "walkable", "dirty")
+
+    def __init__(self, types: np.ndarray, walkable: np.ndarray):
+        self.types = types
+        self.walkable = walkable
+        self.dirty = False
+
+
+class ChunkedTileGrid:
+    """TileGrid ile aynı arayüzü sunan, parçalara bölünmüş tile ızgarası
+
+    Harita ``chunk_size`` x ``chunk_size`` tile'lık parçalara bölünür. Parçalar
+    ilk erişimde ``source`` fonksiyonundan (ör. mmap'li .vmap dosyası veya
+    harita üreteci) yüklenir, en fazla ``max_chunks`` tanesi bellekte tutulur ve
+    en uzun süredir kullanılmayan parça atılır. Değiştirilmiş bir parça atılırken
+    geçici bir takas dizinine yazılır, böylece düzenlemeler kaybolmaz. Parça
+    dinleyicileri parça yüklenip atıldıkça haber alır (ör. parçanın nesneleri).
+    """
+
+    def __init__(self, width: int, height: int, palette: List[str], source: ChunkSource,
+                 chunk_size: int = 64, max_chunks: int = 256):
+        self.width = width
+        self.height = height
+        self.palette: List[str] = list(palette)
+        self._palette_ids = {name: i for i, name in enumerate(self.palette)}
+        self.source = source
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self._chunks: "OrderedDict[Tuple[int, int], _Chunk]" = OrderedDict()
+        self._swap_dir: Optional[Path] = None
+        self._swapped = set()
+        self._listeners: List[Callable[[int, int], None]] = []
+        self._chunk_listeners: List[Callable[[int, int, bool], None]] = []
+
+    # Değişiklik dinleyicileri (TileGrid ile aynı)
+
+    def add_listener(self, callback: Callable[[int, int], None]) -> None:
+        """Tile değiştiğinde çağrılacak fonksiyonu kaydet (callback(x, y))"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[int, int], None]) -> None:
+        """Kayıtlı değişiklik dinleyicisini kaldır"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, x: int, y: int) -> None:
+        for callback in self._listeners:
+            callback(x, y)
+
+    def add_chunk_listener(self, callback: Callable[[int, int, bool], None]) -> None:
+        """Parça yüklenince ``callback(cx, cy, True)``, atılınca ``callback(cx, cy, False)``"""
+        self._chunk_listeners.append(callback)
+
+    def remove_chunk_listener(self, callback: Callable[[int, int, bool], None]) -> None:
+        """Kayıtlı parça dinleyicisini kaldır"""
+        if callback in self._chunk_listeners:
+            self._chunk_listeners.remove(callback)
+
+    def _notify_chunk(self, cx: int, cy: int, loaded: bool) -> None:
+        for callback in self._chunk_listeners:
+            callback(cx, cy, loaded)
+
+    # Parça yönetimi
+
+    def _chunk_bounds(self, cx: int, cy: int) -> Tuple[int, int, int, int]:
+        x1, y1 = cx * self.chunk_size, cy * self.chunk_size
+        return x1, y1, min(self.width, x1 + self.chunk_size), min(self.height, y1 + self.chunk_size)
+
+    def _swap_path(self, cx: int, cy: int) -> Path:
+        if self._swap_dir is None:
+            self._swap_dir = Path(tempfile.mkdtemp(prefix="verdes_chunks_"))
+        return self._swap_dir / f"{cx}_{cy}.npz"
+
+    def _load_chunk(self, cx: int, cy: int) -> _Chunk:
+        if (cx, cy) in self._swapped:
+            # Daha önce değiştirilip takasa yazılmış parça
+            with np.load(self._swap_path(cx, cy)) as data:
+                chunk = _Chunk(data["types"], data["walkable"])
+            chunk.dirty = True
+            return chunk
+        types, walkable = self.source(*self._chunk_bounds(cx, cy))
+        return _Chunk(np.ascontiguousarray(types, dtype=np.uint8),
+                      np.ascontiguousarray(walkable, dtype=bool))
+
+    def _evict_one(self) -> None:
+        (cx, cy), chunk = self._chunks.popitem(last=False)
+        if chunk.dirty:
+            np.savez(self._swap_path(cx, cy), types=chunk.types, walkable=chunk.walkable)
+            self._swapped.add((cx, cy))
+        self._notify_chunk(cx, cy, False)
+
+    def _chunk(self, cx: int, cy: int) -> _Chunk:
+        key = (cx, cy)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = self._load_chunk(cx, cy)
+            self._chunks[key] = chunk
+            self._notify_chunk(cx, cy, True)
+            while len(self._chunks) > self.max_chunks:
+                self._evict_one()
+        else:
+            self._chunks.move_to_end(key)
+        return chunk
+
+    def load_chunk(self, cx: int, cy: int) -> None:
+        """Parçayı yükle (yüklüyse en son kullanılan yap)"""
+        self._chunk(cx, cy)
+
+    def chunks_in(self, x1: int, y1: int, x2: int, y2: int) -> Iterator[Tuple[int, int, int, int, int, int]]:
+        """[x1, x2) x [y1, y2) aralığına (harita içine kırpılmış) değen parçalar: (cx, cy, x1, y1, x2, y2)"""
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(self.width, x2), min(self.height, y2)
+        if x1 >= x2 or y1 >= y2:
+            return
+        cs = self.chunk_size
+        for cy in range(y1 // cs, (y2 - 1) // cs + 1):
+            for cx in range(x1 // cs, (x2 - 1) // cs + 1):
+                yield (cx, cy) + self._chunk_bounds(cx, cy)
+
+    def update_working_set(self, x1: int, y1: int, x2: int, y2: int, margin: int = 1) -> None:
+        """[x1, x2) x [y1, y2) tile aralığını ve çevresindeki parçaları yüklü tut"""
+        cs = self.chunk_size
+        max_cx = (self.width - 1) // cs
+        max_cy = (self.height - 1) // cs
+        for cy in range(max(0, y1 // cs - margin), min(max_cy, (y2 - 1) // cs + margin) + 1):
+            for cx in range(max(0, x1 // cs - margin), min(max_cx, (x2 - 1) // cs + margin) + 1):
+                self._chunk(cx, cy)
+
+    @property
+    def resident_chunks(self) -> int:
+        """Bellekteki parça sayısı"""
+        return len(self._chunks)
+
+    @property
+    def nbytes(self) -> int:
+        """Bellekteki parçaların kapladığı bayt sayısı"""
+        return sum(c.types.nbytes + c.walkable.nbytes for c in self._chunks.values())
+
+    def close(self) -> None:
+        """Bellekteki parçaları ve takas dizinini temizle"""
+        self._chunks.clear()
+        self._swapped.clear()
+        if self._swap_dir is not None:
+            shutil.rmtree(self._swap_dir, ignore_errors=True)
+            self._swap_dir = None
+
+    # TileGrid arayüzü
+
+    def type_id(self, name: str) -> int:
+        """Tür adının palet kimliğini döndür, yoksa palete ekle"""
+        type_id = self._palette_ids.get(name)
+        if type_id is None:
+            if len(self.palette) >= 256:
+                raise ValueError("Tile paleti dolu (en fazla 256 tür)")
+            type_id = len(self.palette)
+            self.palette.append(name)
+            self._palette_ids[name] = type_id
+        return type_id
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Tile koordinatı harita içinde mi?"""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def type_at(self, x: int, y: int) -> str:
+        """Belirtilen tile'ın türünü döndür"""
+        cs = self.chunk_size
+        return self.palette[self._chunk(x // cs, y // cs).types[y % cs, x % cs]]
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Belirtilen tile yürünebilir mi?"""
+        cs = self.chunk_size
+        return bool(self._chunk(x // cs, y // cs).walkable[y % cs, x % cs])
+
+    def set_type(self, x: int, y: int, name: str) -> None:
+        """Belirtilen tile'ın türünü değiştir"""
+        cs = self.chunk_size
+        type_id = self.type_id(name)
+        chunk = self._chunk(x // cs, y // cs)
+        if chunk.types[y % cs, x % cs] != type_id:
+            chunk.types[y % cs, x % cs] = type_id
+            chunk.dirty = True
+            self._notify(x, y)
+
+    def set_walkable(self, x: int, y: int, walkable: bool) -> None:
+        """Belirtilen tile'ın yürünebilirliğini değiştir"""
+        cs = self.chunk_size
+        walkable = bool(walkable)
+        chunk = self._chunk(x // cs, y // cs)
+        if chunk.walkable[y % cs, x % cs] != walkable:
+            chunk.walkable[y % cs, x % cs] = walkable
+            chunk.dirty = True
+            self._notify(x, y)
+
+    def fill_type(self, x1: int, y1: int, x2: int, y2: int, name: str,
+                  mask: Optional[np.ndarray] = None) -> int:
+        """[x1, x2) x [y1, y2) aralığını (maske varsa yalnızca seçili tile'ları) türe boya"""
+        type_id = self.type_id(name)
+        types, _ = self.region(x1, y1, x2, y2)
+        changed = types != type_id
+        if mask is not None:
+            changed &= mask
+        for y, x in zip(*np.nonzero(changed)):
+            self.set_type(x1 + int(x), y1 + int(y), name)
+        return int(np.count_nonzero(changed))
+
+    def region(self, x1: int, y1: int, x2: int, y2: int) -> Tuple[np.ndarray, np.ndarray]:
+        """[x1, x2) x [y1, y2) aralığındaki tür ve yürünebilirlik kopyalarını döndür"""
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(self.width, x2), min(self.height, y2)
+        types = np.empty((max(0, y2 - y1), max(0, x2 - x1)), dtype=np.uint8)
+        walkable = np.empty(types.shape, dtype=bool)
+        if types.size == 0:
+            return types, walkable
+        cs = self.chunk_size
+        for cy in range(y1 // cs, (y2 - 1) // cs + 1):
+            for cx in range(x1 // cs, (x2 - 1) // cs + 1):
+                chunk = self._chunk(cx, cy)
+                cx1, cy1, cx2, cy2 = self._chunk_bounds(cx, cy)
+                ox1, oy1 = max(x1, cx1), max(y1, cy1)
+                ox2, oy2 = min(x2, cx2), min(y2, cy2)
+                types[oy1 - y1:oy2 - y1, ox1 - x1:ox2 - x1] = \
+                    chunk.types[oy1 - cy1:oy2 - cy1, ox1 - cx1:ox2 - cx1]
+                walkable[oy1 - y1:oy2 - y1, ox1 - x1:ox2 - x1] = \
+                    chunk.walkable[oy1 - cy1:oy2 - cy1, ox1 - cx1:ox2 - cx1]
+        return types, walkable
+
+    def materialize(self) -> TileGrid:
+        """Tüm haritayı tek bir TileGrid'e kopyala (kayıt için)"""
+        grid = TileGrid(self.width, self.height, palette=self.palette)
+        cs = self.chunk_size
+        for cy in range((self.height + cs - 1) // cs):
+            y1 = cy * cs
+            y2 = min(self.height, y1 + cs)
+            grid.types[y1:y2], grid.walkable[y1:y2] = self.region(0, y1, self.width, y2)
+        return grid
+
+    def to_rows(self) -> list:
+        """Izgarayı eski liste-sözlük biçimine çevir"""
+        return self.materialize().to_rows()
+
+    def __getitem__(self, y: int) -> TileRow:
+        if y < 0 or y >= self.height:
+            raise IndexError(y)
+        return TileRow(self, y)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __iter__(self) -> Iterator[TileRow]:
+        for y in range(self.height):
+            yield TileRow(self, y)
+
+
+class ChunkedObjectIndex:
+    """SpatialIndex ile aynı arayüzü sunan, kayıtları parça parça tutan indeks
+
+    Kayıtlar bağlı ``ChunkedTileGrid`` bir parçayı yüklediğinde ``source``
+    fonksiyonundan (ör. harita üreteci veya mmap'li .vmap dosyası) alınır ve
+    parça bellekten atılınca bırakılır; böylece büyük haritalarda yalnızca
+    yerleşik parçaların nesneleri bellekte durur. Kaydı eklenmiş veya silinmiş
+    (düzenlenmiş) parçaların kayıtları atılırken bellekte saklanır; bunların
+    sayısı oyuncunun düzenlemeleriyle sınırlıdır. ``values`` tüm haritayı
+    dolaşır (yerleşik olmayan parçalar geçici olarak okunur) ve yalnızca
+    kayıt için kullanılmalıdır.
+    """
+
+    def __init__(self, grid: ChunkedTileGrid, source: EntrySource, cell_size: int = 16):
+        self.grid = grid
+        self.source = source
+        self._index = SpatialIndex(cell_size)  # Yerleşik parçaların kayıtları
+        self._resident: Dict[Tuple[int, int], Set[TileKey]] = {}  # Parça -> kayıt anahtarları
+        self._edited: Set[Tuple[int, int]] = set()
+        self._kept: Dict[Tuple[int, int], Dict[TileKey, Any]] = {}  # Atılmış düzenlenmiş parçalar
+        grid.add_chunk_listener(self._on_chunk)
+        for cx, cy in list(grid._chunks):
+            self._on_chunk(cx, cy, True)
+
+    def close(self) -> None:
+        """Parça olaylarını dinlemeyi bırak ve kayıtları unut"""
+        self.grid.remove_chunk_listener(self._on_chunk)
+        self.clear()
+
+    def _chunk_of(self, x: int, y: int) -> Tuple[int, int]:
+        return x // self.grid.chunk_size, y // self.grid.chunk_size
+
+    def _read_chunk(self, cx: int, cy: int) -> Dict[TileKey, Any]:
+        """Parçanın kayıtları (düzenlenmişse saklanan, yoksa kaynaktan)"""
+        if (cx, cy) in self._kept:
+            return self._kept[(cx, cy)]
+        return {(entry["x"], entry["y"]): entry for entry in self.source(*self.grid._chunk_bounds(cx, cy))}
+
+    def _on_chunk(self, cx: int, cy: int, loaded: bool) -> None:
+        key = (cx, cy)
+        if loaded:
+            entries = self._read_chunk(cx, cy)
+            self._kept.pop(key, None)
+            for (x, y), entry in entries.items():
+                self._index.insert(x, y, entry)
+            self._resident[key] = set(entries)
+        else:
+            entries = {tile: self._index.remove(*tile) for tile in self._resident.pop(key, ())}
+            if key in self._edited:
+                self._kept[key] = entries
+
+    def _load(self, x: int, y: int) -> bool:
+        """Tile'ın parçasını yükle (harita dışıysa False)"""
+        if not self.grid.in_bounds(x, y):
+            return False
+        self.grid.load_chunk(*self._chunk_of(x, y))
+        return True
+
+    def insert(self, x: int, y: int, value: Any) -> None:
+        """Tile'a kayıt ekle (varsa eskisinin yerine geçer)"""
+        if not self._load(x, y):
+            raise IndexError(f"Harita dışı tile: {(x, y)}")
+        chunk = self._chunk_of(x, y)
+        self._index.insert(x, y, value)
+        self._resident[chunk].add((x, y))
+        self._edited.add(chunk)
+
+    def remove(self, x: int, y: int) -> Optional[Any]:
+        """Tile'daki kaydı sil ve döndür"""
+        if not self._load(x, y):
+            return None
+        value = self._index.remove(x, y)
+        if value is not None:
+            chunk = self._chunk_of(x, y)
+            self._resident[chunk].discard((x, y))
+            self._edited.add(chunk)
+        return value
+
+    def get(self, x: int, y: int, default: Any = None) -> Any:
+        """Tile'daki kaydı döndür"""
+        if not self._load(x, y):
+            return default
+        return self._index.get(x, y, default)
+
+    def clear(self) -> None:
+        """Tüm kayıtları sil"""
+        self._index.clear()
+        self._resident.clear()
+        self._edited.clear()
+        self._kept.clear()
+
+    def rebuild(self, entries: list) -> None:
+        """İndeksi ``x``/``y`` alanları olan kayıt listesinden yeniden kur"""
+        self.clear()
+        for entry in entries:
+            self.insert(entry["x"], entry["y"], entry)
+
+    def values(self) -> List[Any]:
+        """Haritanın tüm kayıtları (yerleşik olmayan parçalar yüklenmeden okunur)"""
+        values = []
+        for cx, cy, *_ in self.grid.chunks_in(0, 0, self.grid.width, self.grid.height):
+            tiles = self._resident.get((cx, cy))
+            if tiles is not None:
+                values.extend(self._index.get(x, y) for x, y in tiles)
+            else:
+                values.extend(self._read_chunk(cx, cy).values())
+        return values
+
+    def query_rect(self, x1: int, y1: int, x2: int, y2: int) -> List[Any]:
+        """[x1, x2] x [y1, y2] (dahil) dikdörtgenindeki kayıtları döndür (parçalar yüklenir)"""
+        values = []
+        for cx, cy, bx1, by1, bx2, by2 in self.grid.chunks_in(x1, y1, x2 + 1, y2 + 1):
+            self.grid.load_chunk(cx, cy)
+            values.extend(self._index.query_rect(max(x1, bx1), max(y1, by1),
+                                                 min(x2, bx2 - 1), min(y2, by2 - 1)))
+        return values
+
+    def query_radius(self, cx: int, cy: int, radius: float) -> List[Any]:
+        """(cx, cy) merkezli ``radius`` tile yarıçapındaki kayıtları döndür"""
+        r = int(radius)
+        limit = radius * radius
+        return [
+            value for value in self.query_rect(cx - r, cy - r, cx + r, cy + r)
+            if (value["x"] - cx) ** 2 + (value["y"] - cy) ** 2 <= limit
+        ]
+
+    @property
+    def resident_entries(self) -> int:
+        """Bellekteki (yerleşik parçalardaki) kayıt sayısı"""
+        return len(self._index)
+
+    def __contains__(self, key: TileKey) -> bool:
+        return self.get(*key) is not None
+
+    def __len__(self) -> int:
+        return len(self.values())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.values())
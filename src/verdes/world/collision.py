@@ -0,0 +1,95 @@
+"""
+Çarpışma sistemi - yürünebilirlik haritası üzerinde süpürülmüş AABB hareketi.
+"""
+import math
+from typing import Tuple
+import numpy as np
+
+# Kayan nokta hatalarında kutunun bir sonraki tile'a taşmasını önler
+_EPS = 1e-6
+
+
+class CollisionGrid:
+    """Tile ızgarasının yürünebilirlik haritasına karşı kutu hareketi
+
+    Dünya nesneleri yerleştirilirken tile'ları zaten yürünemez yaptığından
+    ızgaranın ``walkable`` haritası hem zemini hem statik nesneleri kapsar.
+    Hareket eksen eksen süpürülür: kutunun ön kenarının geçeceği tüm tile
+    sütunları (veya satırları) tek dizi dilimiyle kontrol edilir, böylece hızlı
+    hareketler ince duvarların içinden geçemez. Harita dışı engel sayılır.
+    """
+
+    def __init__(self, tiles, tile_size: int = 32):
+        self.tiles = tiles
+        self.tile_size = tile_size
+
+    def blocked_region(self, x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
+        """[x1, x2) x [y1, y2) tile aralığının engel haritası (harita dışı engel)"""
+        if x1 >= 0 and y1 >= 0 and x2 <= self.tiles.width and y2 <= self.tiles.height:
+            _, walkable = self.tiles.region(x1, y1, x2, y2)
+            return ~walkable
+        blocked = np.ones((max(0, y2 - y1), max(0, x2 - x1)), dtype=bool)
+        cx1, cy1 = max(0, x1), max(0, y1)
+        cx2, cy2 = min(self.tiles.width, x2), min(self.tiles.height, y2)
+        if cx1 < cx2 and cy1 < cy2:
+            _, walkable = self.tiles.region(cx1, cy1, cx2, cy2)
+            blocked[cy1 - y1:cy2 - y1, cx1 - x1:cx2 - x1] = ~walkable
+        return blocked
+
+    def _span(self, low: float, high: float) -> Tuple[int, int]:
+        """[low, high) piksel aralığının kapladığı tile aralığı (yarı açık)"""
+        ts = self.tile_size
+        return math.floor(low / ts + _EPS), math.ceil(high / ts - _EPS)
+
+    def is_box_free(self, x: float, y: float, half_w: float, half_h: float) -> bool:
+        """(x, y) merkezli kutu yalnızca yürünebilir tile'lara mı değiyor?"""
+        x1, x2 = self._span(x - half_w, x + half_w)
+        y1, y2 = self._span(y - half_h, y + half_h)
+        return not self.blocked_region(x1, y1, x2, y2).any()
+
+    def _sweep(self, pos: float, half: float, delta: float,
+               cross_low: float, cross_high: float, horizontal: bool) -> Tuple[float, bool]:
+        """Tek eksende süpür, (yeni konum, engele çarptı mı) döndür"""
+        ts = self.tile_size
+        c1, c2 = self._span(cross_low, cross_high)
+
+        if delta > 0:
+            # Ön kenarın yeni girdiği tile'lar
+            first = math.ceil((pos + half) / ts - _EPS)
+            last = math.ceil((pos + half + delta) / ts - _EPS) - 1
+            if last < first:
+                return pos + delta, False
+            lines = self._blocked_lines(first, last + 1, c1, c2, horizontal)
+            if lines.any():
+                return (first + int(lines.argmax())) * ts - half, True
+        else:
+            first = math.floor((pos - half) / ts + _EPS) - 1
+            last = math.floor((pos - half + delta) / ts + _EPS)
+            if last > first:
+                return pos + delta, False
+            lines = self._blocked_lines(last, first + 1, c1, c2, horizontal)
+            if lines.any():
+                # En yakın engel, aralığın sonundaki
+                return (first + 1 - int(lines[::-1].argmax())) * ts + half, True
+        return pos + delta, False
+
+    def _blocked_lines(self, a1: int, a2: int, c1: int, c2: int, horizontal: bool) -> np.ndarray:
+        """Hareket eksenindeki her tile çizgisi için engel var mı?"""
+        if horizontal:
+            return self.blocked_region(a1, c1, a2, c2).any(axis=0)
+        return self.blocked_region(c1, a1, c2, a2).any(axis=1)
+
+    def move(self, x: float, y: float, half_w: float, half_h: float,
+             dx: float, dy: float) -> Tuple[float, float, bool, bool]:
+        """Kutuyu (dx, dy) kadar hareket ettir
+
+        Önce X, sonra Y ekseninde süpürür; engele çarpan eksende kutu engelin
+        kenarında durur, diğer eksende kaymaya devam eder. (yeni x, yeni y,
+        X'te çarptı mı, Y'de çarptı mı) döndürür.
+        """
+        hit_x = hit_y = False
+        if dx:
+            x, hit_x = self._sweep(x, half_w, dx, y - half_h, y + half_h, True)
+        if dy:
+            y, hit_y = self._sweep(y, half_h, dy, x - half_w, x + half_w, False)
+        return x, y, hit_x, hit_y
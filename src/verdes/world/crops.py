@@ -0,0 +1,250 @@
+"""
+Dizi tabanlı bitki deposu - ekili bitkilerin vektörel simülasyonu.
+"""
+from typing import Iterator, List, Optional
+import numpy as np
+
+# Olgunluk aşaması (0'dan başlar)
+MAX_GROWTH_STAGE = 5
+# Bu kadar gün sulanmayan olgunlaşmamış bitki kurur
+WITHER_DAYS = 3
+
+CROP_STORE_DTYPE = np.dtype([
+    ("type", "<u2"),  # Bitki paleti kimliği
+    ("x", "<i4"),
+    ("y", "<i4"),
+    ("growth_stage", "<f4"),
+    ("watered", "?"),
+    ("days_since_watered", "<u2"),
+    ("days_growing", "<u2"),
+    ("withered", "?"),
+    ("alive", "?"),  # Satır kullanımda mı?
+])
+
+# Sözlük benzeri erişimde tür dönüşümleri
+_FIELD_TYPES = {
+    "x": int,
+    "y": int,
+    "growth_stage": float,
+    "watered": bool,
+    "days_since_watered": int,
+    "days_growing": int,
+    "withered": bool,
+}
+
+
+def _saturate(values, dtype):
+    """Değerleri tamsayı türünün üst sınırında kes"""
+    return np.minimum(values, np.iinfo(dtype).max)
+
+
+class CropView:
+    """Depodaki tek bir bitkiye sözlük benzeri erişim (crop["growth_stage"] uyumluluğu için)"""
+
+    __slots__ = ("store", "row")
+
+    def __init__(self, store: "CropStore", row: int):
+        self.store = store
+        self.row = row
+
+    def __getitem__(self, key: str):
+        if key == "type":
+            return self.store.palette[self.store.data["type"][self.row]]
+        convert = _FIELD_TYPES.get(key)
+        if convert is None:
+            raise KeyError(key)
+        return convert(self.store.data[key][self.row])
+
+    def __setitem__(self, key: str, value) -> None:
+        if key == "type":
+            self.store.data["type"][self.row] = self.store.type_id(value)
+        elif key in _FIELD_TYPES:
+            self.store.data[key][self.row] = value
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key == "type" or key in _FIELD_TYPES
+
+    def get(self, key: str, default=None):
+        """dict.get benzeri erişim"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict:
+        """Bitkiyi eski sözlük biçimine çevir"""
+        result = {"type": self["type"]}
+        for key in _FIELD_TYPES:
+            result[key] = self[key]
+        return result
+
+    def __repr__(self) -> str:
+        return f"CropView({self.to_dict()!r})"
+
+
+class CropStore:
+    """Bitkileri tek bir yapılandırılmış NumPy dizisinde saklar
+
+    Her bitki bir satırdır; satır numarası bitki kaldırılana kadar değişmez ve
+    boşalan satırlar yeniden kullanılır. Büyüme, kuruma ve olgunlaşma gün
+    dönümlerinde tüm dizi üzerinde tek seferde uygulanır, böylece maliyet bitki
+    sayısıyla Python döngüsü olarak artmaz.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.data = np.zeros(capacity, dtype=CROP_STORE_DTYPE)
+        self.palette: List[str] = []
+        self._palette_ids = {}
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self._count = 0
+
+    def type_id(self, name: str) -> int:
+        """Bitki türünün palet kimliğini döndür, yoksa palete ekle"""
+        type_id = self._palette_ids.get(name)
+        if type_id is None:
+            type_id = len(self.palette)
+            self.palette.append(name)
+            self._palette_ids[name] = type_id
+        return type_id
+
+    def _grow(self) -> None:
+        """Kapasiteyi iki katına çıkar"""
+        old = len(self.data)
+        new = max(1, old * 2)
+        data = np.zeros(new, dtype=CROP_STORE_DTYPE)
+        data[:old] = self.data
+        self.data = data
+        self._free.extend(range(new - 1, old - 1, -1))
+
+    def add(self, crop_type: str, x: int, y: int, growth_stage: float = 0, watered: bool = False,
+            days_since_watered: int = 0, days_growing: int = 0, withered: bool = False) -> CropView:
+        """Yeni bitki ekle ve görünümünü döndür"""
+        if not self._free:
+            self._grow()
+        row = self._free.pop()
+        self.data[row] = (self.type_id(crop_type), x, y, growth_stage, watered,
+                          days_since_watered, days_growing, withered, True)
+        self._count += 1
+        return CropView(self, row)
+
+    def add_dict(self, crop: dict) -> CropView:
+        """Eski sözlük biçimindeki bitkiyi ekle"""
+        return self.add(crop["type"], crop["x"], crop["y"],
+                        growth_stage=crop.get("growth_stage", 0),
+                        watered=crop.get("watered", False),
+                        days_since_watered=crop.get("days_since_watered", 0),
+                        days_growing=crop.get("days_growing", 0),
+                        withered=crop.get("withered", False))
+
+    def add_many(self, crop_type: str, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Aynı türden birçok bitkiyi tek seferde ekle, satır numaralarını döndür"""
+        n = len(xs)
+        while len(self._free) < n:
+            self._grow()
+        rows = np.array(self._free[len(self._free) - n:][::-1], dtype=np.int64)
+        del self._free[len(self._free) - n:]
+        self.data[rows] = 0
+        self.data["type"][rows] = self.type_id(crop_type)
+        self.data["x"][rows] = xs
+        self.data["y"][rows] = ys
+        self.data["alive"][rows] = True
+        self._count += n
+        return rows
+
+    def remove_rows(self, rows: np.ndarray) -> None:
+        """Satırlardaki bitkileri tek seferde kaldır"""
+        rows = rows[self.data["alive"][rows]]
+        self.data["alive"][rows] = False
+        self._free.extend(rows.tolist())
+        self._count -= len(rows)
+
+    def water_rows(self, rows: np.ndarray) -> None:
+        """Satırlardaki bitkileri tek seferde sula"""
+        self.data["watered"][rows] = True
+        self.data["days_since_watered"][rows] = 0
+
+    def remove(self, view: CropView) -> None:
+        """Bitkiyi depodan kaldır (satır yeniden kullanılabilir olur)"""
+        if self.data["alive"][view.row]:
+            self.data["alive"][view.row] = False
+            self._free.append(view.row)
+            self._count -= 1
+
+    def clear(self) -> None:
+        """Tüm bitkileri sil"""
+        self.data[:] = 0
+        self._free = list(range(len(self.data) - 1, -1, -1))
+        self._count = 0
+
+    def load(self, crops: list) -> List[CropView]:
+        """Depoyu sözlük listesinden yeniden kur, görünümleri döndür"""
+        self.clear()
+        return [self.add_dict(crop) for crop in crops]
+
+    def view(self, row: int) -> Optional[CropView]:
+        """Satırdaki bitkinin görünümü (satır boşsa None)"""
+        if 0 <= row < len(self.data) and self.data["alive"][row]:
+            return CropView(self, row)
+        return None
+
+    @property
+    def alive_mask(self) -> np.ndarray:
+        """Kullanımdaki satırların maskesi"""
+        return self.data["alive"]
+
+    def mature_mask(self) -> np.ndarray:
+        """Hasada hazır bitkilerin maskesi"""
+        data = self.data
+        return data["alive"] & ~data["withered"] & (data["growth_stage"] >= MAX_GROWTH_STAGE)
+
+    def advance_days(self, days: int = 1, rainy: bool = False) -> None:
+        """``days`` gün dönümünü tek seferde uygula (maliyet gün sayısından bağımsız)
+
+        Her gün dönümünde o gün sulanmış bitkiler bir aşama büyür, sulama
+        sıfırlanır ve sulanmayan günler sayılır. Arada oyuncu sulama
+        yapamadığından N günün etkisi kapalı biçimde hesaplanır: kuru havada
+        yalnızca ilk gün sulanmış olanlar büyür, yağmurda ise her gün büyürler.
+        """
+        if days <= 0 or not self._count:
+            return
+        data = self.data
+        alive = data["alive"]
+        active = alive & ~data["withered"]
+        stage = data["growth_stage"]
+        dry_days = data["days_since_watered"]
+        grown_days = np.full(len(data), days, dtype=np.int64)
+
+        if rainy:
+            # Yağmur her gün sular: her gün bir aşama büyüme, kuruma yok
+            stage[active] = np.minimum(stage[active] + days, MAX_GROWTH_STAGE)
+            dry_days[alive] = 0
+            data["watered"][alive] = True
+        else:
+            watered = alive & data["watered"]
+            dry = alive & ~data["watered"]
+
+            # Kuruyacakları gün: sulanmışlar ilk gün dönümünden sonra kurumaya başlar
+            wither_day = np.where(data["watered"], WITHER_DAYS + 1,
+                                  WITHER_DAYS - dry_days.astype(np.int64))
+
+            stage[watered & active] = np.minimum(stage[watered & active] + 1, MAX_GROWTH_STAGE)
+            dry_days[watered] = _saturate(days - 1, dry_days.dtype)
+            dry_days[dry] = _saturate(dry_days[dry].astype(np.int64) + days, dry_days.dtype)
+            data["watered"][alive] = False
+
+            # Uzun süre sulanmayan, henüz olgunlaşmamış bitkiler kurur ve büyümeyi bırakır
+            withering = active & (dry_days >= WITHER_DAYS) & (stage < MAX_GROWTH_STAGE)
+            data["withered"] |= withering
+            grown_days[withering] = np.clip(wither_day[withering], 1, days)
+
+        growing = data["days_growing"]
+        growing[active] = _saturate(growing[active].astype(np.int64) + grown_days[active], growing.dtype)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[CropView]:
+        for row in np.flatnonzero(self.data["alive"]).tolist():
+            yield CropView(self, row)
@@ -0,0 +1,133 @@
+"""
+Tohumlu prosedürel harita üreteci - gürültü katmanlarıyla vektörel üretim.
+"""
+from typing import List, Optional, Tuple
+import numpy as np
+from verdes.world.map_format import MapData
+from verdes.world.tile_grid import DEFAULT_PALETTE, TileGrid
+
+# Çiftlik dışına yerleştirilen nesneler
+OBJECT_TYPES = ["tree", "rock", "bush", "stump"]
+
+# Gürültü değerlerinin yaklaşık %80'inin altında kaldığı eşik
+NOISE_THRESHOLD = 0.64
+
+# Her katman için ayrı gürültü tuzu
+_SALT_TERRAIN = 1
+_SALT_DETAIL = 2
+_SALT_OBJECT = 3
+_SALT_OBJECT_TYPE = 4
+
+
+def _hash2(ix: np.ndarray, iy: np.ndarray, seed: int, salt: int) -> np.ndarray:
+    """Tamsayı koordinatlarını [0, 1) aralığında sözde rastgele sayılara çevir"""
+    h = (ix.astype(np.int64).astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15))
+    h ^= (iy.astype(np.int64).astype(np.uint64) * np.uint64(0xC2B2AE3D27D4EB4F))
+    h ^= np.uint64((seed * 0x165667B19E3779F9 + salt * 0x27D4EB2F165667C5) & 0xFFFFFFFFFFFFFFFF)
+    # splitmix64 karıştırması
+    h ^= h >> np.uint64(30)
+    h *= np.uint64(0xBF58476D1CE4E5B9)
+    h ^= h >> np.uint64(27)
+    h *= np.uint64(0x94D049BB133111EB)
+    h ^= h >> np.uint64(31)
+    return (h >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+class MapGenerator:
+    """Tohumdan belirlenimci harita üreten vektörel üreteç
+
+    Her tile'ın değeri yalnızca tohuma ve kendi dünya koordinatına bağlıdır
+    (değer gürültüsü + çiftlik merkezine uzaklık), bu yüzden harita tek seferde
+    ya da parça parça üretilse de aynı sonucu verir. Aynı tohum her zaman aynı
+    haritayı üretir.
+    """
+
+    def __init__(self, width: int, height: int, seed: int = 0,
+                 farm_radius: Optional[float] = None, object_density: float = 0.05):
+        self.width = width
+        self.height = height
+        self.seed = int(seed)
+        self.farm_radius = farm_radius if farm_radius is not None else min(width, height) / 3
+        self.object_density = object_density
+        self.palette: List[str] = list(DEFAULT_PALETTE)
+        self._grass = self.palette.index("grass")
+        self._dirt = self.palette.index("dirt")
+
+    def _value_noise(self, xs: np.ndarray, ys: np.ndarray, scale: float, salt: int) -> np.ndarray:
+        """Izgara köşelerindeki hash değerleri arasında yumuşak enterpolasyon"""
+        fx = xs / scale
+        fy = ys / scale
+        x0 = np.floor(fx)
+        y0 = np.floor(fy)
+        tx = fx - x0
+        ty = fy - y0
+        tx = tx * tx * (3 - 2 * tx)
+        ty = ty * ty * (3 - 2 * ty)
+        x0 = x0.astype(np.int64)
+        y0 = y0.astype(np.int64)
+
+        v00 = _hash2(x0, y0, self.seed, salt)
+        v10 = _hash2(x0 + 1, y0, self.seed, salt)
+        v01 = _hash2(x0, y0 + 1, self.seed, salt)
+        v11 = _hash2(x0 + 1, y0 + 1, self.seed, salt)
+        top = v00 + (v10 - v00) * tx
+        bottom = v01 + (v11 - v01) * tx
+        return top + (bottom - top) * ty
+
+    def _coords(self, x1: int, y1: int, x2: int, y2: int) -> Tuple[np.ndarray, np.ndarray]:
+        ys, xs = np.mgrid[y1:y2, x1:x2]
+        return xs, ys
+
+    def terrain_types(self, x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
+        """[x1, x2) x [y1, y2) aralığının tile türü kimliklerini üret"""
+        xs, ys = self._coords(x1, y1, x2, y2)
+
+        # Gürültü katmanları: geniş toprak öbekleri + ince ayrıntı
+        noise = (0.65 * self._value_noise(xs, ys, 8.0, _SALT_TERRAIN)
+                 + 0.35 * self._value_noise(xs, ys, 2.0, _SALT_DETAIL))
+
+        # Çiftlik alanı merkeze yakın olsun (daha çok toprak)
+        distance = np.hypot(xs - self.width / 2, ys - self.height / 2)
+        in_farm = distance < self.farm_radius
+
+        # Gürültünün ~%80'i eşiğin altında: çiftlikte %80 toprak, dışarıda %80 çimen
+        dirt = np.where(in_farm, noise < NOISE_THRESHOLD, noise > NOISE_THRESHOLD)
+        return np.where(dirt, self._dirt, self._grass).astype(np.uint8)
+
+    def object_mask(self, x1: int, y1: int, x2: int, y2: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Aralıktaki (harita sınırlarına kırpılmış) nesne maskesini ve nesne türü kimliklerini üret"""
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(self.width, x2), min(self.height, y2)
+        xs, ys = self._coords(x1, y1, x2, y2)
+        distance = np.hypot(xs - self.width / 2, ys - self.height / 2)
+
+        # Nesneler yalnızca çiftlik alanının dışında
+        mask = (distance > self.farm_radius) & (_hash2(xs, ys, self.seed, _SALT_OBJECT) < self.object_density)
+        kinds = (_hash2(xs, ys, self.seed, _SALT_OBJECT_TYPE) * len(OBJECT_TYPES)).astype(np.uint8)
+        return mask, kinds
+
+    def generate_region(self, x1: int, y1: int, x2: int, y2: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Parçalı dünyalar için kaynak: aralığın (türler, yürünebilirlik) dizileri"""
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(self.width, x2), min(self.height, y2)
+        types = self.terrain_types(x1, y1, x2, y2)
+        mask, _ = self.object_mask(x1, y1, x2, y2)
+        return types, ~mask
+
+    def objects_in_region(self, x1: int, y1: int, x2: int, y2: int) -> list:
+        """Aralıktaki (harita sınırlarına kırpılmış) nesneleri sözlük listesi olarak üret"""
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(self.width, x2), min(self.height, y2)
+        mask, kinds = self.object_mask(x1, y1, x2, y2)
+        ys, xs = np.nonzero(mask)
+        return [
+            {"type": OBJECT_TYPES[kind], "x": x1 + x, "y": y1 + y, "walkable": False}
+            for x, y, kind in zip(xs.tolist(), ys.tolist(), kinds[ys, xs].tolist())
+        ]
+
+    def generate(self) -> MapData:
+        """Tüm haritayı üret"""
+        tiles = TileGrid(self.width, self.height, palette=self.palette)
+        tiles.types[:], tiles.walkable[:] = self.generate_region(0, 0, self.width, self.height)
+        objects = self.objects_in_region(0, 0, self.width, self.height)
+        return MapData(self.width, self.height, tiles, objects, [], {"seed": self.seed})
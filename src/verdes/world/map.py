@@ -1,11 +1,55 @@
 """
 Oyun dünyası harita yönetimi.
 """
-import random
 from pathlib import Path
-import yaml
 import math
+import os
+import threading
+import numpy as np
+from verdes.engine.batch import RenderBatch, circle_sprite
 from verdes.engine.camera import Camera
+from verdes.engine.particles import ParticleSystem, ScreenFlash, make_rain_sprites
+from verdes.engine.sprites import sprites
+from verdes.systems.rng import rng
+from verdes.world.chunks import ChunkedObjectIndex, ChunkedTileGrid
+from verdes.world.collision import CollisionGrid
+from verdes.world.crops import MAX_GROWTH_STAGE, CropStore
+from verdes.world.generator import MapGenerator
+from verdes.world.map_format import MapData, MapFile, read_yaml_map, write_map
+from verdes.world.map_journal import MapJournal
+from verdes.world.pathfinding import Pathfinder
+from verdes.world.spatial_index import SpatialIndex
+from verdes.world.tile_grid import TileGrid
+from verdes.world.tile_renderer import TileLayerCache
+
+# Bu alandan (tile sayısı) büyük haritalar varsayılan olarak parça parça yüklenir
+STREAMING_THRESHOLD = 1024 * 1024
+
+# Bitkilerin ekilebildiği mevsimler (listede olmayanlar kış hariç her mevsim)
+CROP_SEASONS = {
+    "turnip": ["spring"],
+    "potato": ["spring"],
+    "tomato": ["summer"],
+    "pumpkin": ["fall"],
+    # Daha fazla bitki eklenebilir
+}
+DEFAULT_CROP_SEASONS = ["spring", "summer", "fall"]
+
+# Hasat edilen bitkinin envantere eklenen ürünü (eşya kimliği)
+HARVEST_ITEMS = {
+    "turnip": "crop_turnip",
+    "potato": "crop_potato",
+    "tomato": "crop_tomato",
+    "pumpkin": "crop_pumpkin",
+}
+
+# Sprite'ı olmayan nesnelerin yedek şekilleri: tür -> (renk, yarıçap)
+OBJECT_FALLBACKS = {
+    "tree": ((0, 100, 0), 15),  # Koyu yeşil
+    "rock": ((128, 128, 128), 10),  # Gri
+    "bush": ((0, 150, 0), 8),  # Yeşil
+}
+DEFAULT_OBJECT_FALLBACK = ((100, 100, 100), 8)
 
 class World:
     """Oyun dünyası sınıfı"""
@@ -13,14 +57,44 @@ class World:
     def __init__(self, name, config):
         self.name = name
         self.config = config
-        self.width = 40  # Tile sayısı
-        self.height = 30  # Tile sayısı
+        world_config = config.get("world", {})
+        self.width = world_config.get("width", 40)  # Tile sayısı (yeni üretilen haritalar için)
+        self.height = world_config.get("height", 30)  # Tile sayısı
+        self.seed = world_config.get("seed")  # Harita üreteci tohumu (None ise rastgele)
         self.tile_size = 32  # Piksel
-        self.tiles = []  # 2D tile dizisi
-        self.objects = []  # Dünya nesneleri (ağaçlar, kayalar vs.)
-        self.crops = []  # Ekilmiş bitkiler
+        self.tiles = TileGrid(self.width, self.height)  # Tile türü ve yürünebilirlik dizileri
+        self.object_index = SpatialIndex()  # Dünya nesneleri (ağaçlar, kayalar vs.)
+        self.crop_store = CropStore()  # Ekilmiş bitkilerin verileri
+        self.crop_index = SpatialIndex()  # Tile -> bitki görünümü
+        self.warps = []  # Diğer haritalara geçiş noktaları (harita meta verisinde saklanır)
         self.weather = "sunny"  # Hava durumu (sunny, rainy, cloudy, stormy)
         self.current_season = "spring"  # Mevsim (spring, summer, fall, winter)
+        self._ground_layer = None  # Zemin katmanı önbelleği (ilk çizimde oluşturulur)
+        self._collision = None  # Çarpışma ızgarası (ilk hareketle oluşturulur)
+        self._pathfinder = None  # Yol bulma servisi (ilk aramada oluşturulur)
+        
+        # Parçalı dünya akışı ayarları
+        self.streaming_mode = world_config.get("streaming", "auto")  # True, False veya "auto"
+        self.chunk_size = world_config.get("chunk_size", 64)
+        self.max_chunks = world_config.get("max_chunks", 256)
+        self.streaming = False  # Tile'lar parça parça mı yükleniyor?
+        self._map_file = None  # Akış sırasında açık tutulan .vmap dosyası
+        self._map_lock = threading.Lock()  # Parça okumaları ile arka plan yazımındaki dosya değişimi
+        
+        # Artımlı kayıt: değişiklik günlüğü bu kadar kayda ulaşınca temel dosyaya işlenir
+        self.journal = None  # Harita yüklendikten sonra açılır
+        self.map_generation = 0  # Temel dosyanın içerdiği günlük nesli
+        self.journal_compact_entries = world_config.get("journal_compact_entries", 5000)
+        
+        # Hava efektleri (parçacık sayıları yapılandırılabilir)
+        weather_config = config.get("weather", {})
+        self.rain_particles = weather_config.get("rain_particles", 100)
+        self.storm_particles = weather_config.get("storm_particles", 200)
+        self.effect_scale = 1.0  # Parçacık sayısı çarpanı (kalite yöneticisi düşürebilir)
+        self.show_water_overlay = True  # Sulanmış bitki göstergesi
+        self._rain = None  # Yağmur parçacıkları (ilk yağmurda oluşturulur)
+        self._batch = RenderBatch()  # Zemin, bitki ve nesne katmanlarının toplu çizimi
+        self._flash = ScreenFlash(seed=rng.generator("lightning"))  # Fırtına şimşekleri
         
         # Kamera
         screen_width = config["display"]["width"]
@@ -35,92 +109,254 @@ class World:
     
     def _load_map(self):
         """Harita dosyasını yükle veya yeni bir harita oluştur"""
-        map_path = Path(f"data/maps/{self.name}.yaml")
-        
-        if map_path.exists():
-            # Haritayı dosyadan yükle
-            with open(map_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                self.width = data.get("width", self.width)
-                self.height = data.get("height", self.height)
-                self.tiles = data.get("tiles", [])
-                self.objects = data.get("objects", [])
-                self.crops = data.get("crops", [])
+        binary_path = Path(f"data/maps/{self.name}.vmap")
+        yaml_path = Path(f"data/maps/{self.name}.yaml")
+        
+        journal = MapJournal(binary_path.with_name(binary_path.name + ".journal"))
+        
+        # YAML elle düzenlenmişse (ikili dosyadan yeniyse) onu tercih et
+        binary_is_fresh = binary_path.exists() and (
+            not yaml_path.exists() or binary_path.stat().st_mtime >= yaml_path.stat().st_mtime
+        )
+        
+        if binary_is_fresh:
+            # İkili haritayı mmap ile aç
+            map_file = MapFile(binary_path)
+            if self._should_stream(map_file.width, map_file.height):
+                # Tile'lar ve nesneler kamera çevresinde parça parça yüklenecek
+                self._apply_map_data(map_file.read(include_tiles=False, include_objects=False))
+                self.tiles = ChunkedTileGrid(map_file.width, map_file.height,
+                                             map_file.meta["tile_palette"], self._read_base_region,
+                                             self.chunk_size, self.max_chunks)
+                self.object_index = ChunkedObjectIndex(self.tiles, self._read_base_objects)
+                self._map_file = map_file
+                self.streaming = True
+            else:
+                self._apply_map_data(map_file.read())
+                map_file.close()
+            
+            # Temel dosyadan sonra kaydedilen değişiklikleri uygula (başka tohumun günlüğü kenara alınır)
+            if journal.matches(self.seed):
+                self._replay_journal(journal)
+            else:
+                journal.archive()
+        elif yaml_path.exists():
+            # Haritayı YAML'dan yükle ve sonraki açılışlar için ikili kopyasını yaz
+            self._apply_map_data(read_yaml_map(yaml_path))
+            self._save_map(binary_path)
+            journal.reset(self.map_generation)
         else:
-            # Yeni bir harita oluştur
+            # Yeni bir harita oluştur (parçalı haritanın tohumu günlük başlığında saklanır)
+            journal_seed = journal.stored_seed()
+            if self.seed is None:
+                self.seed = journal_seed
             self._generate_map()
+            journal.seed = self.seed
             
-            # Haritayı dosyaya kaydet
-            self._save_map(map_path)
+            # Haritayı dosyaya kaydet (parçalı üretilen harita tohumdan yeniden üretilebilir,
+            # değişiklikleri yalnızca günlükte tutulur)
+            if self.streaming:
+                # Günlük yalnızca aynı tohumdan üretilmiş haritaya uygulanır
+                if journal_seed is not None and journal_seed == self.seed:
+                    self._replay_journal(journal)
+                else:
+                    journal.archive()
+                journal.write_header()
+            else:
+                self._save_map(binary_path)
+                journal.reset(self.map_generation)
+        
+        # Bundan sonraki tile değişiklikleri günlüğe yazılır
+        journal.seed = self.seed
+        self.journal = journal
+        self.tiles.add_listener(self._journal_tile)
+    
+    def _should_stream(self, width, height):
+        """Bu boyuttaki harita parça parça mı yüklenmeli?"""
+        if self.streaming_mode == "auto":
+            return width * height > STREAMING_THRESHOLD
+        return bool(self.streaming_mode)
+    
+    def _apply_map_data(self, data):
+        """Okunan harita verisini dünyaya uygula"""
+        self.width = data.width
+        self.height = data.height
+        self.tiles = data.tiles
+        self.object_index.rebuild(data.objects)
+        self.crop_index.rebuild(self.crop_store.load(data.crops))
+        if data.extra.get("seed") is not None:
+            self.seed = data.extra["seed"]
+        self.map_generation = data.extra.get("generation", 0)
+        self.warps = [dict(warp) for warp in data.extra.get("warps", [])]
+    
+    @property
+    def objects(self):
+        """Tüm dünya nesneleri (salt okunur liste)"""
+        return self.object_index.values()
+    
+    @property
+    def crops(self):
+        """Tüm ekili bitkiler (salt okunur liste)"""
+        return self.crop_index.values()
     
     def _generate_map(self):
-        """Rastgele bir harita oluştur"""
-        self.tiles = []
-        
-        # Basit bir harita oluştur
-        for y in range(self.height):
-            row = []
-            for x in range(self.width):
-                # Çiftlik alanı merkeze yakın olsun
-                distance_from_center = ((x - self.width/2)**2 + (y - self.height/2)**2)**0.5
-                farm_radius = min(self.width, self.height) / 3
-                
-                if distance_from_center < farm_radius:
-                    # Çiftlik alanı (daha çok toprak)
-                    if random.random() < 0.8:
-                        tile_type = "dirt"
-                    else:
-                        tile_type = "grass"
-                else:
-                    # Çevreleyen alan (daha çok çimen ve ağaçlar)
-                    if random.random() < 0.8:
-                        tile_type = "grass"
-                    else:
-                        tile_type = "dirt"
-                
-                row.append({
-                    "type": tile_type,
-                    "walkable": True
-                })
-            self.tiles.append(row)
-        
-        # Rastgele nesneler ekle
-        for _ in range(50):  # 50 nesne
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            
-            # Çiftlik alanından uzakta daha fazla nesne olsun
-            distance_from_center = ((x - self.width/2)**2 + (y - self.height/2)**2)**0.5
-            farm_radius = min(self.width, self.height) / 3
-            
-            if distance_from_center > farm_radius:
-                obj_type = random.choice(["tree", "rock", "bush", "stump"])
-                self.objects.append({
-                    "type": obj_type,
-                    "x": x,
-                    "y": y,
-                    "walkable": False
-                })
-                
-                # Nesnenin olduğu tile'ı yürünemez yap
-                self.tiles[y][x]["walkable"] = False
-    
-    def _save_map(self, map_path):
-        """Haritayı dosyaya kaydet"""
-        data = {
-            "width": self.width,
-            "height": self.height,
-            "tiles": self.tiles,
-            "objects": self.objects,
-            "crops": self.crops
-        }
-        
-        # Dizini oluştur
-        map_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Dosyaya yaz
-        with open(map_path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False)
+        """Tohumdan yeni bir harita üret"""
+        if self.seed is None:
+            self.seed = rng.stream("worldgen").randrange(2 ** 32)
+        generator = MapGenerator(self.width, self.height, self.seed)
+        
+        if self._should_stream(self.width, self.height):
+            # Tile'lar ve nesneler kamera çevresinde parça parça üretilecek
+            self._apply_map_data(MapData(self.width, self.height, None, [], []))
+            self.tiles = ChunkedTileGrid(self.width, self.height, generator.palette,
+                                         generator.generate_region, self.chunk_size, self.max_chunks)
+            self.object_index = ChunkedObjectIndex(self.tiles, generator.objects_in_region)
+            self.streaming = True
+        else:
+            self._apply_map_data(generator.generate())
+    
+    def _save_map(self, map_path=None):
+        """Haritayı ikili (.vmap) dosyaya kaydet"""
+        if map_path is None:
+            map_path = Path(f"data/maps/{self.name}.vmap")
+        
+        # Parçalı haritada tüm tile'lar kayıt için tek ızgarada toplanır
+        tiles = self.tiles.materialize() if self.streaming else self.tiles
+        data = MapData(self.width, self.height, tiles, self.objects, self.crops,
+                       {"seed": self.seed, "generation": self.map_generation, "warps": self.warps})
+        write_map(map_path, data, self._replace_base)
+    
+    def _read_base_region(self, x1, y1, x2, y2):
+        """Parça kaynağı: açık .vmap dosyasından bir bölge oku"""
+        with self._map_lock:
+            return self._map_file.read_region(x1, y1, x2, y2)
+    
+    def _read_base_objects(self, x1, y1, x2, y2):
+        """Parçalı nesne kaynağı: açık .vmap dosyasından bir bölgenin nesnelerini oku"""
+        with self._map_lock:
+            return self._map_file.objects_in_region(x1, y1, x2, y2)
+    
+    def _replace_base(self, tmp_path, map_path):
+        """Yeni temel dosyayı yerine koy; akış sırasında açık dosyayı kapatıp yeniden aç"""
+        with self._map_lock:
+            map_file = self._map_file
+            if map_file is None or map_file.path.resolve() != Path(map_path).resolve():
+                os.replace(tmp_path, map_path)
+                return
+            map_file.close()
+            try:
+                os.replace(tmp_path, map_path)
+            finally:
+                # Yer değiştirme başarısız olsa da eski dosya yeniden açılır
+                self._map_file = MapFile(map_path)
+    
+    def _record(self, op, **fields):
+        """Değişikliği günlüğe ekle (yükleme ve günlük oynatma sırasında günlük yoktur)"""
+        if self.journal is not None:
+            self.journal.record(op, **fields)
+    
+    def _journal_tile(self, x, y):
+        """Tile dinleyicisi: değişen tile'ın son durumunu günlüğe yaz"""
+        self._record("tile", x=x, y=y, type=self.tiles.type_at(x, y), walkable=self.tiles.is_walkable(x, y))
+    
+    def _replay_journal(self, journal):
+        """Temel dosyanın neslinden sonraki günlük kayıtlarını uygula"""
+        for entry in journal.entries(self.map_generation):
+            op = entry["op"]
+            if op == "tile":
+                self.tiles.set_type(entry["x"], entry["y"], entry["type"])
+                self.tiles.set_walkable(entry["x"], entry["y"], entry["walkable"])
+            elif op == "object_add":
+                self.add_object(entry["type"], entry["x"], entry["y"], entry["walkable"])
+            elif op == "object_remove":
+                self.remove_object_at(entry["x"], entry["y"])
+            elif op == "crop_plant":
+                self.crop_index.insert(entry["x"], entry["y"], self.crop_store.add_dict(entry))
+            elif op == "crop_water":
+                crop = self.crop_index.get(entry["x"], entry["y"])
+                if crop:
+                    crop["watered"] = True
+                    crop["days_since_watered"] = 0
+            elif op == "crop_remove":
+                self.remove_crop_at(entry["x"], entry["y"])
+            elif op == "crop_plant_tiles":
+                for x, y in entry["tiles"]:
+                    self.crop_index.insert(x, y, self.crop_store.add(entry["type"], x, y))
+            elif op == "crop_water_tiles":
+                for x, y in entry["tiles"]:
+                    crop = self.crop_index.get(x, y)
+                    if crop:
+                        crop["watered"] = True
+                        crop["days_since_watered"] = 0
+            elif op == "crop_remove_tiles":
+                for x, y in entry["tiles"]:
+                    self.remove_crop_at(x, y)
+            elif op == "advance_days":
+                self.crop_store.advance_days(entry["days"], entry["rainy"])
+    
+    def _snapshot(self):
+        """Haritanın arka planda yazılabilecek bir kopyası"""
+        tiles = self.tiles.materialize() if self.streaming else self.tiles.copy()
+        objects = [dict(obj) for obj in self.objects]
+        crops = [crop.to_dict() for crop in self.crops]
+        warps = [dict(warp) for warp in self.warps]
+        return MapData(self.width, self.height, tiles, objects, crops, {"seed": self.seed, "warps": warps})
+    
+    def save(self):
+        """Değişiklikleri günlüğe yaz; günlük büyüdüyse temel dosyaya arka planda işle"""
+        self.journal.flush()
+        if self.journal.entries_since_compaction >= self.journal_compact_entries:
+            self.compact_map()
+    
+    def compact_map(self, background=True):
+        """Günlüğü temel .vmap dosyasına işle (yazma arka plan iş parçacığında)"""
+        data = self._snapshot()
+        map_path = Path(f"data/maps/{self.name}.vmap")
+        
+        def write_base(generation):
+            data.extra["generation"] = generation
+            write_map(map_path, data, self._replace_base)
+            self.map_generation = generation
+        
+        return self.journal.compact(write_base, background)
+    
+    def _get_ground_layer(self):
+        """Geçerli tile ızgarası için zemin katmanı önbelleğini döndür"""
+        if self._ground_layer is None or self._ground_layer.tiles is not self.tiles:
+            # Harita yeniden yüklendiyse eski önbelleği bırak
+            if self._ground_layer is not None:
+                self._ground_layer.close()
+            self._ground_layer = TileLayerCache(self.tiles, self.tile_size)
+        return self._ground_layer
+    
+    @property
+    def collision(self):
+        """Geçerli tile ızgarası için çarpışma ızgarası"""
+        if self._collision is None or self._collision.tiles is not self.tiles:
+            self._collision = CollisionGrid(self.tiles, self.tile_size)
+        return self._collision
+    
+    @property
+    def pathfinder(self):
+        """Geçerli tile ızgarası için yol bulma servisi"""
+        if self._pathfinder is None or self._pathfinder.tiles is not self.tiles:
+            # Harita yeniden yüklendiyse eski servisin dinleyicisini bırak
+            if self._pathfinder is not None:
+                self._pathfinder.close()
+            self._pathfinder = Pathfinder(self.tiles)
+        return self._pathfinder
+    
+    def pixel_to_tile(self, x, y):
+        """Piksel konumunu tile koordinatına çevir"""
+        return int(x // self.tile_size), int(y // self.tile_size)
+    
+    def tile_center(self, tile_x, tile_y):
+        """Tile'ın merkezinin piksel konumu"""
+        return (tile_x + 0.5) * self.tile_size, (tile_y + 0.5) * self.tile_size
+    
+    def move_box(self, x, y, half_w, half_h, dx, dy):
+        """Kutuyu tile'lara ve nesnelere çarparak hareket ettir, (x, y, hit_x, hit_y) döndür"""
+        return self.collision.move(x, y, half_w, half_h, dx, dy)
     
     def set_weather(self, weather):
         """Hava durumunu ayarla"""
@@ -145,7 +381,7 @@ class World:
             return False
         
         # Tile yürünebilir mi?
-        return self.tiles[tile_y][tile_x]["walkable"]
+        return self.tiles.is_walkable(tile_x, tile_y)
     
     def get_tile(self, x, y):
         """Belirtilen konumdaki tile'ı döndür"""
@@ -165,11 +401,41 @@ class World:
         tile_x = int(x / self.tile_size)
         tile_y = int(y / self.tile_size)
         
-        # Nesneleri kontrol et
-        for obj in self.objects:
-            if obj["x"] == tile_x and obj["y"] == tile_y:
-                return obj
-        
+        return self.object_index.get(tile_x, tile_y)
+    
+    def add_object(self, obj_type, tile_x, tile_y, walkable=False):
+        """Tile'a nesne yerleştir (varsa mevcut nesnenin türünü değiştirir)"""
+        obj = self.object_index.get(tile_x, tile_y)
+        if obj:
+            obj["type"] = obj_type
+            obj["walkable"] = walkable
+        else:
+            obj = {"type": obj_type, "x": tile_x, "y": tile_y, "walkable": walkable}
+            self.object_index.insert(tile_x, tile_y, obj)
+        self._record("object_add", type=obj_type, x=tile_x, y=tile_y, walkable=walkable)
+        
+        # Nesnenin olduğu tile'ı yürünemez yap
+        if not walkable:
+            self.tiles.set_walkable(tile_x, tile_y, False)
+        return obj
+    
+    def remove_object_at(self, tile_x, tile_y):
+        """Tile'daki nesneyi kaldır ve tile'ı yürünebilir yap"""
+        obj = self.object_index.remove(tile_x, tile_y)
+        if obj is not None:
+            self._record("object_remove", x=tile_x, y=tile_y)
+        if self.tiles.in_bounds(tile_x, tile_y):
+            self.tiles.set_walkable(tile_x, tile_y, True)
+        return obj
+    
+    def warp_at(self, tile_x, tile_y):
+        """Tile'daki geçiş noktası (yoksa None)
+
+        Geçiş: {"x", "y", "target", "target_x", "target_y"} (tile koordinatları).
+        """
+        for warp in self.warps:
+            if warp["x"] == tile_x and warp["y"] == tile_y:
+                return warp
         return None
     
     def get_crop_at(self, x, y):
@@ -178,12 +444,7 @@ class World:
         tile_x = int(x / self.tile_size)
         tile_y = int(y / self.tile_size)
         
-        # Mahsulleri kontrol et
-        for crop in self.crops:
-            if crop["x"] == tile_x and crop["y"] == tile_y:
-                return crop
-        
-        return None
+        return self.crop_index.get(tile_x, tile_y)
     
     def plant_crop(self, crop_type, x, y, player):
         """Belirtilen konuma bitki ek"""
@@ -196,39 +457,21 @@ class World:
             return False
         
         # Tile uygun mu? (toprak olmalı)
-        tile = self.tiles[tile_y][tile_x]
-        if tile["type"] != "dirt":
+        if self.tiles.type_at(tile_x, tile_y) != "dirt":
             return False
         
         # Bitki zaten var mı?
-        for crop in self.crops:
-            if crop["x"] == tile_x and crop["y"] == tile_y:
-                return False
-        
-        # Mevsim kontrolü (örnek olarak)
-        seasons_for_crop = {
-            "turnip": ["spring"],
-            "potato": ["spring"],
-            "tomato": ["summer"],
-            "pumpkin": ["fall"],
-            # Daha fazla bitki eklenebilir
-        }
-        
-        # Varsayılan olarak tüm mevsimlerde ekilebilir
-        valid_seasons = seasons_for_crop.get(crop_type, ["spring", "summer", "fall"])
-        if self.current_season not in valid_seasons:
+        if (tile_x, tile_y) in self.crop_index:
+            return False
+        
+        # Mevsim kontrolü
+        if not self.can_plant_in_season(crop_type):
             return False
         
-        # Yeni bitki oluştur
-        self.crops.append({
-            "type": crop_type,
-            "x": tile_x,
-            "y": tile_y,
-            "growth_stage": 0,  # 0-5 arası (olgun için 5)
-            "watered": False,
-            "days_since_watered": 0,
-            "days_growing": 0
-        })
+        # Yeni bitki oluştur (büyüme aşaması 0-5 arası, olgun için 5)
+        crop = self.crop_store.add(crop_type, tile_x, tile_y)
+        self.crop_index.insert(tile_x, tile_y, crop)
+        self._record("crop_plant", **crop.to_dict())
         
         return True
     
@@ -239,13 +482,14 @@ class World:
         tile_y = int(y / self.tile_size)
         
         # Bitki bul
-        for crop in self.crops:
-            if crop["x"] == tile_x and crop["y"] == tile_y:
-                # Enerji tüket
-                if player.use_energy(1.0):
-                    crop["watered"] = True
-                    crop["days_since_watered"] = 0
-                    return True
+        crop = self.crop_index.get(tile_x, tile_y)
+        if crop:
+            # Enerji tüket
+            if player.use_energy(1.0):
+                crop["watered"] = True
+                crop["days_since_watered"] = 0
+                self._record("crop_water", x=tile_x, y=tile_y)
+                return True
         
         return False
     
@@ -256,160 +500,254 @@ class World:
         tile_y = int(y / self.tile_size)
         
         # Bitki bul
-        for i, crop in enumerate(self.crops):
-            if crop["x"] == tile_x and crop["y"] == tile_y and crop["growth_stage"] >= 5:
-                # Enerji tüket
-                if player.use_energy(0.5):
-                    # Bitkiyi kaldır
-                    self.crops.pop(i)
-                    
-                    # Ürün ekle
-                    harvested_item = None
-                    if crop["type"] == "turnip":
-                        harvested_item = "turnip"
-                    elif crop["type"] == "potato":
-                        harvested_item = "potato"
-                    elif crop["type"] == "tomato":
-                        harvested_item = "tomato"
-                    elif crop["type"] == "pumpkin":
-                        harvested_item = "pumpkin"
-                    
-                    if harvested_item:
-                        player.add_to_inventory(harvested_item, 1)
-                    
-                    return True
+        crop = self.crop_index.get(tile_x, tile_y)
+        if crop and crop["growth_stage"] >= MAX_GROWTH_STAGE and not crop["withered"]:
+            # Enerji tüket
+            if player.use_energy(0.5):
+                crop_type = crop["type"]
+                
+                # Bitkiyi kaldır
+                self.remove_crop_at(tile_x, tile_y)
+                
+                # Ürün ekle
+                harvested_item = HARVEST_ITEMS.get(crop_type)
+                if harvested_item:
+                    player.add_to_inventory(harvested_item, 1)
+                
+                return True
         
         return False
     
-    def update(self, dt):
-        """Dünyayı güncelle"""
+    def remove_crop_at(self, tile_x, tile_y):
+        """Tile'daki bitkiyi kaldır"""
+        crop = self.crop_index.remove(tile_x, tile_y)
+        if crop is not None:
+            self.crop_store.remove(crop)
+            self._record("crop_remove", x=tile_x, y=tile_y)
+        return crop
+    
+    def can_plant_in_season(self, crop_type):
+        """Bitki şu anki mevsimde ekilebilir mi?"""
+        return self.current_season in CROP_SEASONS.get(crop_type, DEFAULT_CROP_SEASONS)
+    
+    # Alan işlemleri: [x1, x2) x [y1, y2) tile dikdörtgeni ve isteğe bağlı
+    # (y2 - y1, x2 - x1) boyutlu maske; dikdörtgen harita sınırına kırpılır
+    
+    def _clip_area(self, x1, y1, x2, y2, mask):
+        """Alanı haritaya kırp, (x1, y1, x2, y2, maske) döndür (alan boşsa None)"""
+        cx1, cy1 = max(0, x1), max(0, y1)
+        cx2, cy2 = min(self.width, x2), min(self.height, y2)
+        if cx1 >= cx2 or cy1 >= cy2:
+            return None
+        if mask is None:
+            mask = np.ones((cy2 - cy1, cx2 - cx1), dtype=bool)
+        else:
+            mask = np.asarray(mask, dtype=bool)[cy1 - y1:cy2 - y1, cx1 - x1:cx2 - x1]
+        return cx1, cy1, cx2, cy2, mask
+    
+    def _crop_rows_in_area(self, x1, y1, x2, y2, mask):
+        """Alandaki bitkilerin depo satırları"""
+        crops = self.crop_index.query_rect(x1, y1, x2 - 1, y2 - 1)
+        rows = np.array([crop.row for crop in crops], dtype=np.int64)
+        if not len(rows):
+            return rows
+        data = self.crop_store.data
+        return rows[mask[data["y"][rows] - y1, data["x"][rows] - x1]]
+    
+    def _crop_tiles(self, rows):
+        """Satırlardaki bitkilerin tile koordinatları ([[x, y], ...])"""
+        data = self.crop_store.data
+        return np.stack([data["x"][rows], data["y"][rows]], axis=1).tolist()
+    
+    def water_area(self, x1, y1, x2, y2, mask=None):
+        """Alandaki tüm bitkileri tek seferde sula, sulanan bitki sayısını döndür"""
+        area = self._clip_area(x1, y1, x2, y2, mask)
+        if area is None:
+            return 0
+        rows = self._crop_rows_in_area(*area)
+        if not len(rows):
+            return 0
+        self.crop_store.water_rows(rows)
+        self._record("crop_water_tiles", tiles=self._crop_tiles(rows))
+        return len(rows)
+    
+    def hoe_area(self, x1, y1, x2, y2, mask=None):
+        """Alandaki yürünebilir çim tile'larını toprağa çevir, çevrilen sayıyı döndür"""
+        area = self._clip_area(x1, y1, x2, y2, mask)
+        if area is None or "grass" not in self.tiles.palette:
+            return 0
+        x1, y1, x2, y2, mask = area
+        types, walkable = self.tiles.region(x1, y1, x2, y2)
+        # Nesneler tile'ı yürünemez yaptığından üzerlerindeki çim atlanır
+        target = mask & walkable & (types == self.tiles.palette.index("grass"))
+        # Tile dinleyicileri değişiklikleri günlüğe ve önbelleklere iletir
+        return self.tiles.fill_type(x1, y1, x2, y2, "dirt", target)
+    
+    def plant_area(self, crop_type, x1, y1, x2, y2, mask=None, limit=None):
+        """Alandaki boş toprak tile'larına bitki ek, ekilen sayıyı döndür
+
+        ``limit`` verilirse en fazla o kadar tile (satır satır) ekilir.
+        """
+        area = self._clip_area(x1, y1, x2, y2, mask)
+        if area is None or not self.can_plant_in_season(crop_type) or "dirt" not in self.tiles.palette:
+            return 0
+        x1, y1, x2, y2, mask = area
+        types, _ = self.tiles.region(x1, y1, x2, y2)
+        target = mask & (types == self.tiles.palette.index("dirt"))
+        
+        # Bitkisi olan tile'ları çıkar
+        occupied = self._crop_rows_in_area(x1, y1, x2, y2, target)
+        if len(occupied):
+            data = self.crop_store.data
+            target[data["y"][occupied] - y1, data["x"][occupied] - x1] = False
+        
+        ys, xs = np.nonzero(target)
+        if limit is not None:
+            ys, xs = ys[:limit], xs[:limit]
+        if not len(xs):
+            return 0
+        xs += x1
+        ys += y1
+        rows = self.crop_store.add_many(crop_type, xs, ys)
+        for row, x, y in zip(rows.tolist(), xs.tolist(), ys.tolist()):
+            self.crop_index.insert(x, y, self.crop_store.view(row))
+        self._record("crop_plant_tiles", type=crop_type, tiles=np.stack([xs, ys], axis=1).tolist())
+        return len(rows)
+    
+    def harvest_area(self, x1, y1, x2, y2, mask=None):
+        """Alandaki olgun bitkileri hasat et, {bitki türü: adet} döndür"""
+        area = self._clip_area(x1, y1, x2, y2, mask)
+        if area is None:
+            return {}
+        rows = self._crop_rows_in_area(*area)
+        if not len(rows):
+            return {}
+        store = self.crop_store
+        rows = rows[store.mature_mask()[rows]]
+        if not len(rows):
+            return {}
+        
+        type_ids, counts = np.unique(store.data["type"][rows], return_counts=True)
+        harvested = {store.palette[type_id]: int(count) for type_id, count in zip(type_ids, counts)}
+        
+        tiles = self._crop_tiles(rows)
+        for x, y in tiles:
+            self.crop_index.remove(x, y)
+        store.remove_rows(rows)
+        self._record("crop_remove_tiles", tiles=tiles)
+        return harvested
+    
+    def update(self, dt, effects=True):
+        """Dünyayı güncelle (``effects`` False ise hava efektleri ayrıca ``update_effects`` ile)"""
         # Kamerayı güncelle
         self.camera.update(dt)
         
-        # Bitkileri güncelle
-        for crop in self.crops:
-            if crop["watered"]:
-                # Büyüme ilerlemesi (gerçek oyunda gün sonunda olabilir)
-                # Burada sadece basit bir örnek
-                crop["growth_stage"] += dt * 0.1
-                if crop["growth_stage"] > 5:
-                    crop["growth_stage"] = 5
-    
-    def draw(self):
-        """Dünyayı çiz"""
-        # Kamera hesaplama (kameranın görüş alanına göre)
+        # Parçalı haritada kameranın çevresini yüklü tut
+        if self.streaming:
+            x1, y1, x2, y2 = self.get_visible_tile_range()
+            self.tiles.update_working_set(x1, y1, x2, y2)
+        
+        # Hava efektleri
+        if effects:
+            self.update_effects(dt)
+    
+    def advance_days(self, days=1):
+        """Gün dönümü: bitkilerin büyümesini, sulamasını ve kurumasını işle"""
+        # Yağmurlu havada bitkiler kendiliğinden sulanır
+        rainy = self.weather in ("rainy", "stormy")
+        self.crop_store.advance_days(days, rainy)
+        self._record("advance_days", days=days, rainy=rainy)
+    
+    def get_visible_tile_range(self):
+        """Kameranın gördüğü tile aralığını (x1, y1, x2, y2) döndür"""
         camera_x = self.camera.x - self.camera.width / 2
         camera_y = self.camera.y - self.camera.height / 2
         
-        # Görünür tile aralığını hesapla
         visible_x1 = max(0, int(camera_x / self.tile_size))
         visible_y1 = max(0, int(camera_y / self.tile_size))
         visible_x2 = min(self.width, int((camera_x + self.camera.width) / self.tile_size) + 1)
         visible_y2 = min(self.height, int((camera_y + self.camera.height) / self.tile_size) + 1)
-        
-        # Sadece görünür tile'ları çiz
-        for y in range(visible_y1, visible_y2):
-            for x in range(visible_x1, visible_x2):
-                tile = self.tiles[y][x]
-                
-                # Ekran koordinatlarını hesapla
-                screen_x, screen_y = self.camera.world_to_screen(x * self.tile_size, y * self.tile_size)
-                
-                # Tile'ı çiz
-                tile_image = f"assets/images/tiles/{tile['type']}_{self.current_season}.png"
-                try:
-                    tile_actor = Actor(tile_image)
-                    tile_actor.x = screen_x + self.tile_size/2
-                    tile_actor.y = screen_y + self.tile_size/2
-                    tile_actor.draw()
-                except:
-                    # Alternatif tile sprite
-                    alt_tile_image = f"assets/images/tiles/{tile['type']}.png"
-                    try:
-                        tile_actor = Actor(alt_tile_image)
-                        tile_actor.x = screen_x + self.tile_size/2
-                        tile_actor.y = screen_y + self.tile_size/2
-                        tile_actor.draw()
-                    except:
-                        # Sprite yoksa basit renk kullan
-                        color = (100, 200, 100) if tile["type"] == "grass" else (139, 69, 19)
-                        rect = Rect((screen_x, screen_y), (self.tile_size, self.tile_size))
-                        screen.draw.filled_rect(rect, color)
-        
-        # Bitkileri çiz
-        for crop in self.crops:
-            # Görünür aralıkta mı kontrol et
-            if visible_x1 <= crop["x"] <= visible_x2 and visible_y1 <= crop["y"] <= visible_y2:
-                # Ekran koordinatlarını hesapla
-                screen_x, screen_y = self.camera.world_to_screen(crop["x"] * self.tile_size, crop["y"] * self.tile_size)
-                
-                # Büyüme aşamasına göre sprite
-                growth = int(crop["growth_stage"])
-                crop_image = f"assets/images/crops/{crop['type']}_{growth}.png"
+        return visible_x1, visible_y1, visible_x2, visible_y2
+    
+    def close(self):
+        """Açık harita dosyasını ve parça önbelleklerini bırak (kaydetmez)"""
+        if self.journal is not None:
+            # Süren arka plan sıkıştırmasının bitmesini bekle
+            self.journal.wait()
+        if self._ground_layer is not None:
+            self._ground_layer.close()
+            self._ground_layer = None
+        if self._pathfinder is not None:
+            self._pathfinder.close()
+            self._pathfinder = None
+        if self.streaming:
+            self.object_index.close()
+            self.tiles.close()
+        with self._map_lock:
+            if self._map_file is not None:
+                self._map_file.close()
+                self._map_file = None
+    
+    def draw(self, batch=None):
+        """Dünyayı çiz
+
+        Zemin, bitki ve nesne katmanları ``batch``'te (verilmezse dünyanın
+        kendi toplu çizicisinde) toplanır ve hava efektlerinden önce tek
+        ``blits`` çağrısıyla çizilir.
+        """
+        if batch is None:
+            batch = self._batch
+        target = screen.surface
+        
+        # Görünür tile aralığını hesapla (kameranın görüş alanına göre)
+        visible_x1, visible_y1, visible_x2, visible_y2 = self.get_visible_tile_range()
+        
+        # Tile (x, y) merkezinin ekran konumu = origin + tile * tile_size
+        ts = self.tile_size
+        origin_x, origin_y = self.camera.world_to_screen(ts / 2, ts / 2)
+        
+        # Zemin katmanı: önceden çizilmiş parçalar
+        self._get_ground_layer().draw(target, self.camera, self.current_season, batch)
+        
+        # Bitkiler (sadece görünür aralıktakiler); alanlar depo dizilerinden topluca okunur
+        crops = self.crop_index.query_rect(visible_x1, visible_y1, visible_x2, visible_y2)
+        if crops:
+            data = self.crop_store.data
+            palette = self.crop_store.palette
+            rows = [crop.row for crop in crops]
+            water_image = sprites.get(("overlay", "water_overlay"))
+            for x, y, type_id, stage, watered, withered in zip(
+                    data["x"][rows].tolist(), data["y"][rows].tolist(), data["type"][rows].tolist(),
+                    data["growth_stage"][rows].tolist(), data["watered"][rows].tolist(),
+                    data["withered"][rows].tolist()):
+                center_x = origin_x + x * ts
+                center_y = origin_y + y * ts
                 
-                try:
-                    crop_actor = Actor(crop_image)
-                    crop_actor.x = screen_x + self.tile_size/2
-                    crop_actor.y = screen_y + self.tile_size/2
-                    crop_actor.draw()
-                except:
-                    # Sprite yoksa basit şekil çiz
-                    radius = 5 + growth * 2
-                    color = (0, 255, 0)  # Yeşil
-                    screen.draw.filled_circle((screen_x + self.tile_size/2, screen_y + self.tile_size/2), radius, color)
+                # Büyüme aşamasına göre sprite, yoksa önceden çizilmiş daire
+                growth = int(stage)
+                radius = 5 + growth * 2
+                crop_image = sprites.get(("crop", palette[type_id], growth))
+                if crop_image is None:
+                    color = (139, 115, 85) if withered else (0, 255, 0)  # Kuru kahverengi / yeşil
+                    crop_image = circle_sprite(radius, color)
+                batch.add_centered(crop_image, center_x, center_y)
                 
                 # Sulama durumu göstergesi
-                if crop["watered"]:
-                    try:
-                        water_actor = Actor("assets/images/tiles/water_overlay.png")
-                        water_actor.x = screen_x + self.tile_size/2
-                        water_actor.y = screen_y + self.tile_size/2
-                        water_actor.draw()
-                    except:
-                        # Sprite yoksa basit gösterge
-                        screen.draw.circle((screen_x + self.tile_size/2, screen_y + self.tile_size/2), 
-                                          radius + 2, (0, 0, 255))
-        
-        # Nesneleri çiz
-        for obj in self.objects:
-            # Görünür aralıkta mı kontrol et
-            if visible_x1 <= obj["x"] <= visible_x2 and visible_y1 <= obj["y"] <= visible_y2:
-                # Ekran koordinatlarını hesapla
-                screen_x, screen_y = self.camera.world_to_screen(obj["x"] * self.tile_size, obj["y"] * self.tile_size)
-                
-                # Mevsime ve türe göre nesne sprite
-                obj_season = "" if obj["type"] in ["rock", "stump"] else f"_{self.current_season}"
-                obj_image = f"assets/images/objects/{obj['type']}{obj_season}.png"
-                
-                try:
-                    obj_actor = Actor(obj_image)
-                    obj_actor.x = screen_x + self.tile_size/2
-                    obj_actor.y = screen_y + self.tile_size/2
-                    obj_actor.draw()
-                except:
-                    # Alternatif nesne sprite
-                    alt_obj_image = f"assets/images/objects/{obj['type']}.png"
-                    try:
-                        obj_actor = Actor(alt_obj_image)
-                        obj_actor.x = screen_x + self.tile_size/2
-                        obj_actor.y = screen_y + self.tile_size/2
-                        obj_actor.draw()
-                    except:
-                        # Sprite yoksa basit şekil çiz
-                        if obj["type"] == "tree":
-                            color = (0, 100, 0)  # Koyu yeşil
-                            radius = 15
-                        elif obj["type"] == "rock":
-                            color = (128, 128, 128)  # Gri
-                            radius = 10
-                        elif obj["type"] == "bush":
-                            color = (0, 150, 0)  # Yeşil
-                            radius = 8
-                        else:
-                            color = (100, 100, 100)  # Gri
-                            radius = 8
-                        
-                        screen.draw.filled_circle((screen_x + self.tile_size/2, screen_y + self.tile_size/2), radius, color)
+                if watered and self.show_water_overlay:
+                    batch.add_centered(water_image or circle_sprite(radius + 2, (0, 0, 255), 1),
+                                       center_x, center_y)
+        
+        # Nesneler (sadece görünür aralıktakiler)
+        season = self.current_season
+        for obj in self.object_index.query_rect(visible_x1, visible_y1, visible_x2, visible_y2):
+            # Mevsime ve türe göre nesne sprite (yoksa mevsimsiz sürüm, o da yoksa şekil)
+            obj_image = sprites.get(("object", obj["type"], season))
+            if obj_image is None:
+                color, radius = OBJECT_FALLBACKS.get(obj["type"], DEFAULT_OBJECT_FALLBACK)
+                obj_image = circle_sprite(radius, color)
+            batch.add_centered(obj_image, origin_x + obj["x"] * ts, origin_y + obj["y"] * ts)
+        
+        batch.flush(target)
         
         # Hava durumu efektleri
         if self.weather == "rainy":
@@ -417,36 +755,35 @@ class World:
         elif self.weather == "stormy":
             self._draw_storm()
     
+    def _get_rain(self):
+        """Yağmur parçacık sistemini döndür (gerekirse oluştur)"""
+        if self._rain is None:
+            capacity = max(self.rain_particles, self.storm_particles)
+            self._rain = ParticleSystem(capacity, self.camera.width, self.camera.height, make_rain_sprites(),
+                                        seed=rng.generator("rain"))
+        return self._rain
+    
+    def update_effects(self, dt):
+        """Yağmur damlalarını ve şimşekleri ilerlet"""
+        if self.weather not in ("rainy", "stormy"):
+            return
+        
+        rain = self._get_rain()
+        count = self.storm_particles if self.weather == "stormy" else self.rain_particles
+        rain.set_count(count * self.effect_scale)
+        rain.update(dt)
+        
+        if self.weather == "stormy":
+            self._flash.update(dt)
+    
     def _draw_rain(self):
         """Yağmur efekti çiz"""
-        rain_count = 100
-        screen_width = self.camera.width
-        screen_height = self.camera.height
-        
-        for _ in range(rain_count):
-            x = random.randint(0, screen_width)
-            y = random.randint(0, screen_height)
-            length = random.randint(5, 10)
-            
-            # Yağmur damlası
-            color = (100, 100, 255, 150)  # Açık mavi, yarı saydam
-            end_x = x + length // 2
-            end_y = y + length
-            
-            screen.draw.line((x, y), (end_x, end_y), color)
+        self._get_rain().draw(screen.surface)
     
     def _draw_storm(self):
         """Fırtına efekti çiz (yağmur + şimşek)"""
         # Yağmur çiz
         self._draw_rain()
         
-        # Rastgele şimşek
-        if random.random() < 0.02:  # %2 ihtimalle
-            flash_alpha = random.randint(20, 80)  # Parlaklık
-            flash_color = (255, 255, 200, flash_alpha)
-            
-            # Tüm ekranı kaplayan yarı saydam beyaz katman
-            screen.draw.filled_rect(
-                Rect(0, 0, self.camera.width, self.camera.height),
-                flash_color
-            )
\ No newline at end of file
+        # Şimşek (önceden oluşturulmuş katmanın saydamlığı değişir)
+        self._flash.draw(screen.surface)
@@ -0,0 +1,342 @@
+"""
+İkili harita biçimi (.vmap) - mmap ile açılabilen sürümlü harita dosyaları.
+
+Dosya düzeni (little-endian, bölümler 8 bayta hizalı):
+
+    başlık      : HEADER yapısı (sihirli sayı, sürüm, boyutlar, bölüm ofsetleri)
+    meta        : UTF-8 JSON (paletler ve ek alanlar)
+    tile türleri: width * height adet uint8 (palet kimliği, satır öncelikli)
+    yürünebilir : np.packbits ile sıkıştırılmış bit haritası
+    nesneler    : OBJECT_DTYPE kayıtları
+    bitkiler    : CROP_DTYPE kayıtları
+"""
+import json
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Callable, List, Optional
+import numpy as np
+import yaml
+from verdes.world.tile_grid import TileGrid
+
+MAGIC = b"VMAP"
+FORMAT_VERSION = 1
+
+# magic, sürüm, bayraklar, genişlik, yükseklik,
+# meta (ofset, boyut), türler, yürünebilirlik, nesneler (ofset, sayı), bitkiler (ofset, sayı)
+HEADER = struct.Struct("<4sHHIIQQQQQIQI")
+
+OBJECT_DTYPE = np.dtype([
+    ("type", "<u2"),
+    ("walkable", "u1"),
+    ("reserved", "u1"),
+    ("x", "<i4"),
+    ("y", "<i4"),
+])
+
+CROP_DTYPE = np.dtype([
+    ("type", "<u2"),
+    ("flags", "u1"),  # bit 0: sulandı, bit 1: kurudu
+    ("reserved", "u1"),
+    ("x", "<i4"),
+    ("y", "<i4"),
+    ("growth_stage", "<f4"),
+    ("days_since_watered", "<u2"),
+    ("days_growing", "<u2"),
+])
+
+CROP_WATERED = 0x01
+CROP_WITHERED = 0x02
+
+
+class MapFormatError(ValueError):
+    """Geçersiz veya desteklenmeyen harita dosyası"""
+
+
+class MapData:
+    """Bellekteki harita içeriği (okuyucu ve yazıcı arasında ortak biçim)"""
+
+    def __init__(self, width: int, height: int, tiles: TileGrid,
+                 objects: Optional[list] = None, crops: Optional[list] = None,
+                 extra: Optional[dict] = None):
+        self.width = width
+        self.height = height
+        self.tiles = tiles
+        self.objects = objects if objects is not None else []
+        self.crops = crops if crops is not None else []
+        self.extra = extra if extra is not None else {}
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+class MapFile:
+    """mmap ile açılmış bir .vmap dosyası
+
+    Tile katmanları dosyanın üzerinde sıfır kopyalı NumPy görünümleri olarak
+    sunulur; yalnızca gerçekten okunan sayfalar diskten yüklenir.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise MapFormatError(f"Boş harita dosyası: {self.path}")
+
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise MapFormatError(f"Harita başlığı eksik: {self.path}")
+
+        (magic, version, self.flags, self.width, self.height,
+         meta_offset, meta_size, self._types_offset, self._walk_offset,
+         self._objects_offset, self.object_count,
+         self._crops_offset, self.crop_count) = HEADER.unpack_from(self._mmap, 0)
+
+        if magic != MAGIC:
+            self.close()
+            raise MapFormatError(f"Geçersiz harita dosyası: {self.path}")
+        if version > FORMAT_VERSION:
+            self.close()
+            raise MapFormatError(f"Desteklenmeyen harita sürümü {version}: {self.path}")
+        self.version = version
+
+        self.meta = json.loads(bytes(self._mmap[meta_offset:meta_offset + meta_size]).decode("utf-8"))
+
+    @property
+    def types(self) -> np.ndarray:
+        """Tile türü katmanı (salt okunur, mmap üzerinde görünüm)"""
+        return np.frombuffer(self._mmap, dtype=np.uint8, count=self.width * self.height,
+                             offset=self._types_offset).reshape(self.height, self.width)
+
+    @property
+    def packed_walkable(self) -> np.ndarray:
+        """Sıkıştırılmış yürünebilirlik bit haritası (salt okunur)"""
+        count = (self.width * self.height + 7) // 8
+        return np.frombuffer(self._mmap, dtype=np.uint8, count=count, offset=self._walk_offset)
+
+    def walkable(self) -> np.ndarray:
+        """Yürünebilirlik haritasını bool dizisi olarak aç"""
+        bits = np.unpackbits(self.packed_walkable, count=self.width * self.height)
+        return bits.astype(bool).reshape(self.height, self.width)
+
+    def read_region(self, x1: int, y1: int, x2: int, y2: int):
+        """[x1, x2) x [y1, y2) aralığının tür ve yürünebilirlik kopyalarını oku
+
+        Yalnızca bölgeye denk gelen sayfalara dokunur; büyük haritaların
+        parça parça yüklenmesi için kullanılır.
+        """
+        width = self.width
+        types = np.array(self.types[y1:y2, x1:x2])
+        walkable = np.empty((y2 - y1, x2 - x1), dtype=bool)
+        packed = self.packed_walkable
+        for row, y in enumerate(range(y1, y2)):
+            start = y * width + x1
+            end = start + (x2 - x1)
+            bits = np.unpackbits(packed[start // 8:(end + 7) // 8])
+            walkable[row] = bits[start % 8:start % 8 + (x2 - x1)]
+        return types, walkable
+
+    def object_records(self) -> np.ndarray:
+        """Nesne tablosu (salt okunur kayıt dizisi)"""
+        return np.frombuffer(self._mmap, dtype=OBJECT_DTYPE, count=self.object_count,
+                             offset=self._objects_offset)
+
+    def crop_records(self) -> np.ndarray:
+        """Bitki tablosu (salt okunur kayıt dizisi)"""
+        return np.frombuffer(self._mmap, dtype=CROP_DTYPE, count=self.crop_count,
+                             offset=self._crops_offset)
+
+    def tile_grid(self) -> TileGrid:
+        """Düzenlenebilir bir TileGrid kopyası oluştur"""
+        grid = TileGrid(self.width, self.height, palette=self.meta["tile_palette"])
+        grid.types[:] = self.types
+        grid.walkable[:] = self.walkable()
+        return grid
+
+    def objects(self) -> list:
+        """Nesne tablosunu sözlük listesine çevir"""
+        return self._object_dicts(self.object_records())
+
+    def objects_in_region(self, x1: int, y1: int, x2: int, y2: int) -> list:
+        """[x1, x2) x [y1, y2) aralığındaki nesneleri sözlük listesi olarak oku"""
+        records = self.object_records()
+        xs, ys = records["x"], records["y"]
+        return self._object_dicts(records[(xs >= x1) & (xs < x2) & (ys >= y1) & (ys < y2)])
+
+    def _object_dicts(self, records: np.ndarray) -> list:
+        palette = self.meta["object_palette"]
+        return [
+            {"type": palette[t], "x": x, "y": y, "walkable": bool(w)}
+            for t, w, x, y in zip(*(records[f].tolist() for f in ("type", "walkable", "x", "y")))
+        ]
+
+    def crops(self) -> list:
+        """Bitki tablosunu sözlük listesine çevir"""
+        palette = self.meta["crop_palette"]
+        records = self.crop_records()
+        fields = ("type", "flags", "x", "y", "growth_stage", "days_since_watered", "days_growing")
+        return [
+            {
+                "type": palette[t],
+                "x": x,
+                "y": y,
+                "growth_stage": stage,
+                "watered": bool(flags & CROP_WATERED),
+                "days_since_watered": dsw,
+                "days_growing": days,
+                "withered": bool(flags & CROP_WITHERED),
+            }
+            for t, flags, x, y, stage, dsw, days in zip(*(records[f].tolist() for f in fields))
+        ]
+
+    def read(self, include_tiles: bool = True, include_objects: bool = True) -> MapData:
+        """Tüm haritayı belleğe kopyala (include_tiles/include_objects=False ise o katmanlar atlanır)"""
+        extra = {k: v for k, v in self.meta.items() if not k.endswith("_palette")}
+        tiles = self.tile_grid() if include_tiles else None
+        objects = self.objects() if include_objects else []
+        return MapData(self.width, self.height, tiles, objects, self.crops(), extra)
+
+    def close(self) -> None:
+        """Dosyayı ve mmap'i kapat"""
+        if getattr(self, "_mmap", None) is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Hâlâ dışarıda tutulan görünümler var; mmap onlarla birlikte serbest kalır
+                pass
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> "MapFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_map(path) -> MapData:
+    """Bir .vmap dosyasını oku"""
+    with MapFile(path) as map_file:
+        return map_file.read()
+
+
+def _palette_for(entries: list, key: str = "type") -> List[str]:
+    return list(dict.fromkeys(entry[key] for entry in entries))
+
+
+def write_map(path, data: MapData, replace: Callable[[Path, Path], None] = os.replace) -> None:
+    """Haritayı .vmap biçiminde yaz (geçici dosya + atomik yer değiştirme)
+
+    Geçici dosyanın adı her yazmada benzersizdir, böylece aynı haritaya
+    eşzamanlı yazmalar birbirinin dosyasını ezmez. ``replace(geçici, hedef)``
+    yer değiştirmeyi yapar; dosyayı açık tutan çağıranlar onu kapatıp yeniden
+    açmak için kendi fonksiyonlarını verebilir.
+    """
+    path = Path(path)
+    tiles = data.tiles
+
+    object_palette = _palette_for(data.objects)
+    object_ids = {name: i for i, name in enumerate(object_palette)}
+    objects = np.zeros(len(data.objects), dtype=OBJECT_DTYPE)
+    if data.objects:
+        objects["type"] = [object_ids[obj["type"]] for obj in data.objects]
+        objects["walkable"] = [bool(obj.get("walkable", False)) for obj in data.objects]
+        objects["x"] = [obj["x"] for obj in data.objects]
+        objects["y"] = [obj["y"] for obj in data.objects]
+
+    crop_palette = _palette_for(data.crops)
+    crop_ids = {name: i for i, name in enumerate(crop_palette)}
+    crops = np.zeros(len(data.crops), dtype=CROP_DTYPE)
+    if data.crops:
+        crops["type"] = [crop_ids[crop["type"]] for crop in data.crops]
+        crops["flags"] = [(CROP_WATERED if crop.get("watered") else 0) |
+                          (CROP_WITHERED if crop.get("withered") else 0) for crop in data.crops]
+        crops["x"] = [crop["x"] for crop in data.crops]
+        crops["y"] = [crop["y"] for crop in data.crops]
+        crops["growth_stage"] = [crop.get("growth_stage", 0) for crop in data.crops]
+        crops["days_since_watered"] = [crop.get("days_since_watered", 0) for crop in data.crops]
+        crops["days_growing"] = [crop.get("days_growing", 0) for crop in data.crops]
+
+    meta = dict(data.extra)
+    meta.update({
+        "tile_palette": tiles.palette,
+        "object_palette": object_palette,
+        "crop_palette": crop_palette,
+    })
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    types_bytes = np.ascontiguousarray(tiles.types, dtype=np.uint8).tobytes()
+    walk_bytes = np.packbits(tiles.walkable.ravel()).tobytes()
+
+    # Bölüm ofsetlerini hesapla
+    meta_offset = _align(HEADER.size)
+    types_offset = _align(meta_offset + len(meta_bytes))
+    walk_offset = _align(types_offset + len(types_bytes))
+    objects_offset = _align(walk_offset + len(walk_bytes))
+    crops_offset = _align(objects_offset + objects.nbytes)
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, data.width, data.height,
+                         meta_offset, len(meta_bytes), types_offset, walk_offset,
+                         objects_offset, len(objects), crops_offset, len(crops))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=path.parent, prefix=path.name + ".",
+                                     suffix=".tmp", delete=False) as f:
+        tmp_path = Path(f.name)
+        try:
+            for offset, chunk in ((0, header), (meta_offset, meta_bytes), (types_offset, types_bytes),
+                                  (walk_offset, walk_bytes), (objects_offset, objects.tobytes()),
+                                  (crops_offset, crops.tobytes())):
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(chunk)
+        except BaseException:
+            f.close()
+            tmp_path.unlink()
+            raise
+    try:
+        replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_yaml_map(path) -> MapData:
+    """Eski YAML harita dosyasını oku"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    width = data.get("width", 40)
+    height = data.get("height", 30)
+    tiles = TileGrid.from_rows(data.get("tiles", []), width, height)
+    extra = {k: v for k, v in data.items() if k not in ("width", "height", "tiles", "objects", "crops")}
+    return MapData(width, height, tiles, data.get("objects", []), data.get("crops", []), extra)
+
+
+def write_yaml_map(path, data: MapData) -> None:
+    """Haritayı YAML biçiminde yaz"""
+    out = dict(data.extra)
+    out.update({
+        "width": data.width,
+        "height": data.height,
+        "tiles": data.tiles.to_rows(),
+        "objects": data.objects,
+        "crops": data.crops,
+    })
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(out, f, default_flow_style=False)
+
+
+def yaml_to_binary(yaml_path, binary_path) -> None:
+    """YAML haritayı .vmap biçimine çevir"""
+    write_map(binary_path, read_yaml_map(yaml_path))
+
+
+def binary_to_yaml(binary_path, yaml_path) -> None:
+    """.vmap haritayı YAML biçimine çevir"""
+    write_yaml_map(yaml_path, read_map(binary_path))
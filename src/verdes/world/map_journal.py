@@ -0,0 +1,241 @@
+"""
+Harita değişiklik günlüğü - artımlı kayıt için yalnızca-ekleme JSONL dosyası.
+
+Günlük, nesil başlıklarıyla ayrılmış bölümlerden oluşur:
+
+    {"op": "generation", "generation": 3, "seed": 1234}
+    {"op": "tile", "x": 4, "y": 7, "type": "dirt", "walkable": true}
+    {"op": "object_add", ...}
+    {"op": "generation", "generation": 4}
+    ...
+
+Temel harita dosyası (.vmap) meta verisinde hangi nesli içerdiğini saklar.
+Yükleme sırasında temel dosyanın nesli ve sonrasındaki bölümler sırayla
+uygulanır; daha eski bölümler zaten temel dosyaya yazılmıştır. Başlıktaki
+``seed`` haritanın üretildiği tohumdur; yalnızca günlükte tutulan (parçalı
+üretilen) haritalar tohumu buradan geri okur.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+
+class MapJournal:
+    """Harita düzenlemelerini kaydeden yalnızca-ekleme günlük
+
+    ``record`` değişiklikleri bellekte biriktirir, ``flush`` yalnızca bunları
+    dosyanın sonuna ekler; kayıt maliyeti harita boyutuna değil değişiklik
+    sayısına bağlıdır. ``compact`` yeni bir nesil başlatır, verilen
+    fonksiyonla temel dosyayı arka planda yeniden yazar ve ardından günlükten
+    eskimiş bölümleri atar.
+    """
+
+    def __init__(self, path, generation: int = 0, seed: Optional[int] = None):
+        self.path = Path(path)
+        self.generation = generation
+        self.seed = seed  # Başlıklara yazılan harita tohumu
+        self.pending: List[dict] = []
+        self.entries_since_compaction = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.last_error: Optional[Exception] = None
+        self.repair()
+
+    def repair(self) -> bool:
+        """Çökmeden kalan yarım son satırı at (yeni kayıtlar ona eklenmesin)
+
+        Dosya, satır sonuyla biten son tam satıra kadar kısaltılır. Kısaltma
+        yapıldıysa True döndürür.
+        """
+        with self._lock:
+            if not self.path.exists():
+                return False
+            with open(self.path, "rb+") as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                if size == 0:
+                    return False
+                f.seek(size - 1)
+                if f.read(1) == b"\n":
+                    return False
+                # Son satır sonunu geriye doğru parça parça ara
+                end = size
+                keep = 0
+                while end > 0:
+                    start = max(0, end - 4096)
+                    f.seek(start)
+                    newline = f.read(end - start).rfind(b"\n")
+                    if newline >= 0:
+                        keep = start + newline + 1
+                        break
+                    end = start
+                f.truncate(keep)
+            return True
+
+    # Kayıt
+
+    def record(self, op: str, **fields) -> None:
+        """Bir değişikliği kuyruğa ekle (flush ile diske yazılır)"""
+        fields["op"] = op
+        self.pending.append(fields)
+
+    def flush(self) -> int:
+        """Bekleyen değişiklikleri günlüğün sonuna ekle, yazılan kayıt sayısını döndür"""
+        if not self.pending:
+            return 0
+        pending, self.pending = self.pending, []
+        lines = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in pending)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            is_new = not self.path.exists() or self.path.stat().st_size == 0
+            with open(self.path, "a", encoding="utf-8") as f:
+                if is_new:
+                    f.write(self._header(self.generation))
+                f.write(lines)
+        self.entries_since_compaction += len(pending)
+        return len(pending)
+
+    def _header(self, generation: int) -> str:
+        header = {"op": "generation", "generation": generation}
+        if self.seed is not None:
+            header["seed"] = self.seed
+        return json.dumps(header) + "\n"
+
+    def write_header(self) -> None:
+        """Günlük boşsa başlığı hemen yaz (kayıt olmasa da tohum saklanır)"""
+        with self._lock:
+            if self.path.exists() and self.path.stat().st_size > 0:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(self._header(self.generation))
+
+    def stored_seed(self) -> Optional[int]:
+        """Dosyadaki ilk başlığın tohumu (dosya veya tohum yoksa None)"""
+        if not self.path.exists():
+            return None
+        with open(self.path, "r", encoding="utf-8") as f:
+            line = f.readline()
+        try:
+            header = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        return header.get("seed") if header.get("op") == "generation" else None
+
+    def reset(self, generation: int = 0) -> None:
+        """Günlüğü sil ve verilen nesilden yeniden başla (temel dosya yeni yazıldığında)"""
+        self.wait()
+        with self._lock:
+            self.pending = []
+            self.generation = generation
+            self.entries_since_compaction = 0
+            if self.path.exists():
+                self.path.unlink()
+
+    def archive(self) -> Optional[Path]:
+        """Günlüğü uygulamadan kenara al (``.stale`` uzantısıyla), yeni günlük boş başlar"""
+        self.wait()
+        with self._lock:
+            self.pending = []
+            self.entries_since_compaction = 0
+            if not self.path.exists():
+                return None
+            stale_path = self.path.with_name(self.path.name + ".stale")
+            os.replace(self.path, stale_path)
+            return stale_path
+
+    def matches(self, seed: Optional[int]) -> bool:
+        """Günlük bu tohumla üretilmiş haritaya mı ait? (tohumsuz eski başlıklar kabul edilir)"""
+        stored = self.stored_seed()
+        return stored is None or stored == seed
+
+    # Okuma
+
+    def entries(self, base_generation: int) -> Iterator[dict]:
+        """Temel dosyanın neslinden itibaren uygulanacak değişiklikler"""
+        if not self.path.exists():
+            return
+        generation = None
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Yarım kalmış son satır (ör. çökme sırasında)
+                    break
+                if entry.get("op") == "generation":
+                    generation = entry["generation"]
+                    self.generation = max(self.generation, generation)
+                elif generation is not None and generation >= base_generation:
+                    yield entry
+
+    # Sıkıştırma
+
+    @property
+    def compacting(self) -> bool:
+        """Arka planda sıkıştırma sürüyor mu?"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def compact(self, write_base: Callable[[int], None], background: bool = True) -> bool:
+        """Yeni nesle geç ve temel dosyayı ``write_base(nesil)`` ile yeniden yaz
+
+        ``write_base`` çağrılmadan önce haritanın anlık görüntüsü alınmış
+        olmalıdır; bu noktadan sonraki değişiklikler yeni nesle yazılır.
+        """
+        if self.compacting:
+            return False
+        self.flush()
+        generation = self.generation + 1
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(self._header(generation))
+        self.generation = generation
+        self.entries_since_compaction = 0
+
+        if background:
+            self._thread = threading.Thread(target=self._compact_worker, args=(write_base, generation),
+                                            name="map-journal-compaction", daemon=True)
+            self._thread.start()
+        else:
+            self._compact_worker(write_base, generation)
+        return True
+
+    def _compact_worker(self, write_base: Callable[[int], None], generation: int) -> None:
+        try:
+            write_base(generation)
+            self._drop_before(generation)
+        except Exception as e:  # Günlük hâlâ tam; bir sonraki sıkıştırma yeniden dener
+            self.last_error = e
+
+    def _drop_before(self, generation: int) -> None:
+        """Temel dosyaya yazılmış eski bölümleri günlükten at"""
+        with self._lock:
+            if not self.path.exists():
+                return
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+            keep_from = len(lines)
+            for index, line in enumerate(lines):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("op") == "generation" and entry["generation"] >= generation:
+                    keep_from = index
+                    break
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(lines[keep_from:])
+            os.replace(tmp_path, self.path)
+
+    def wait(self) -> None:
+        """Süren sıkıştırmanın bitmesini bekle"""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
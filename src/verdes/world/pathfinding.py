@@ -0,0 +1,254 @@
+"""
+Yol bulma servisi - önbellekli A* ve paylaşılan akış alanları.
+"""
+import heapq
+from collections import OrderedDict, deque
+from typing import List, Optional, Tuple
+import numpy as np
+
+Tile = Tuple[int, int]
+Window = Tuple[int, int, np.ndarray]  # (x1, y1, aramadaki yürünebilirlik kopyası)
+
+# 4 yönlü komşuluk (köşegen hareket çarpışma kutusunu köşelere takar)
+_NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def _window_changed(window: Window, x: int, y: int, walkable: bool) -> bool:
+    """Tile pencerenin içinde ve yürünebilirliği arama anındakinden farklı mı?"""
+    x1, y1, snapshot = window
+    lx, ly = x - x1, y - y1
+    return 0 <= ly < snapshot.shape[0] and 0 <= lx < snapshot.shape[1] and bool(snapshot[ly, lx]) != walkable
+
+
+class FlowField:
+    """Tek bir hedefe olan adım mesafeleri; o hedefe giden tüm NPC'ler paylaşır"""
+
+    def __init__(self, goal: Tile, x1: int, y1: int, distances: np.ndarray,
+                 walkable: Optional[np.ndarray] = None):
+        self.goal = goal
+        self.x1 = x1
+        self.y1 = y1
+        self.distances = distances  # -1: ulaşılamaz
+        self.walkable = walkable  # Hesaplandığı andaki yürünebilirlik (geçersiz kılma için)
+
+    def distance(self, x: int, y: int) -> int:
+        """Tile'ın hedefe adım mesafesi (-1: ulaşılamaz veya alan dışı)"""
+        lx, ly = x - self.x1, y - self.y1
+        if 0 <= ly < self.distances.shape[0] and 0 <= lx < self.distances.shape[1]:
+            return int(self.distances[ly, lx])
+        return -1
+
+    def next_tile(self, x: int, y: int) -> Optional[Tile]:
+        """Hedefe bir adım yaklaştıran komşu tile (hedefteyse veya yol yoksa None)"""
+        best = self.distance(x, y)
+        if best <= 0:
+            return None
+        result = None
+        for dx, dy in _NEIGHBORS:
+            d = self.distance(x + dx, y + dy)
+            if 0 <= d < best:
+                best = d
+                result = (x + dx, y + dy)
+        return result
+
+
+class Pathfinder:
+    """Dünya yürünebilirlik ızgarası üzerinde önbellekli yol bulma
+
+    Yollar (başlangıç bölgesi, hedef) anahtarıyla saklanır: aynı
+    ``region_size`` x ``region_size`` bölgeden aynı hedefe giden aktörler tek
+    bir A* aramasını paylaşır, yalnızca önbellekteki yola kısa bir yerel
+    aramayla bağlanırlar. Çok sayıda aktörün gittiği hedefler (ör. dükkan) için
+    akış alanları tek bir genişlik öncelikli aramayla hesaplanır. Bir tile'ın
+    yürünebilirliği değiştiğinde (tile dinleyicisi) yalnızca arama penceresi o
+    tile'ı içeren yollar ve alanlar silinir; yalnızca türü değişen tile'lar
+    (ör. çimenin çapalanması) önbelleği etkilemez. Her silmede ``version``
+    artar; yolu saklayan aktörler bunu izleyip yeniden planlar. Yollar
+    ``cache_size``, akış alanları ``field_cache_size`` girdiyle sınırlı LRU
+    önbelleklerde tutulur.
+    """
+
+    def __init__(self, tiles, region_size: int = 8, cache_size: int = 512,
+                 search_margin: int = 16, max_margin: int = 64, flow_radius: int = 48,
+                 field_cache_size: int = 32):
+        self.tiles = tiles
+        self.region_size = region_size
+        self.cache_size = cache_size
+        self.field_cache_size = field_cache_size
+        self.search_margin = search_margin
+        self.max_margin = max_margin
+        self.flow_radius = flow_radius
+        self.version = 0  # Her geçersiz kılmada artar
+        self._paths: "OrderedDict[Tuple[int, int, Tile], Tuple[List[Tile], Window]]" = OrderedDict()
+        self._fields: "OrderedDict[Tile, FlowField]" = OrderedDict()
+        self.stats = {"searches": 0, "cache_hits": 0}
+        tiles.add_listener(self._on_tile_changed)
+
+    def close(self) -> None:
+        """Tile değişikliklerini dinlemeyi bırak"""
+        self.tiles.remove_listener(self._on_tile_changed)
+        self.invalidate()
+
+    def _on_tile_changed(self, x: int, y: int) -> None:
+        walkable = self.tiles.is_walkable(x, y)
+        stale_paths = [key for key, (_, window) in self._paths.items()
+                       if _window_changed(window, x, y, walkable)]
+        stale_fields = [goal for goal, field in self._fields.items()
+                        if _window_changed((field.x1, field.y1, field.walkable), x, y, walkable)]
+        if not stale_paths and not stale_fields:
+            return
+        for key in stale_paths:
+            del self._paths[key]
+        for goal in stale_fields:
+            del self._fields[goal]
+        self.version += 1
+
+    def invalidate(self) -> None:
+        """Tüm önbelleğe alınmış yolları ve akış alanlarını sil"""
+        self.version += 1
+        self._paths.clear()
+        self._fields.clear()
+
+    def _window(self, a: Tile, b: Tile, margin: int) -> Tuple[int, int, int, int]:
+        x1 = max(0, min(a[0], b[0]) - margin)
+        y1 = max(0, min(a[1], b[1]) - margin)
+        x2 = min(self.tiles.width, max(a[0], b[0]) + margin + 1)
+        y2 = min(self.tiles.height, max(a[1], b[1]) + margin + 1)
+        return x1, y1, x2, y2
+
+    def _search(self, start: Tile, goal: Tile, margin: int) -> Tuple[Optional[List[Tile]], Window]:
+        """Başlangıç ve hedefi içeren pencerede A* (başlangıç hariç yol ve arama penceresi)"""
+        self.stats["searches"] += 1
+        x1, y1, x2, y2 = self._window(start, goal, margin)
+        width = x2 - x1
+        _, walkable = self.tiles.region(x1, y1, x2, y2)
+        window = (x1, y1, walkable.copy())
+        passable = walkable.ravel().tolist()
+        height = len(passable) // width
+
+        s = (start[1] - y1) * width + (start[0] - x1)
+        g = (goal[1] - y1) * width + (goal[0] - x1)
+        if not passable[g]:
+            return None, window
+        gx, gy = goal[0] - x1, goal[1] - y1
+
+        came_from = {s: -1}
+        cost = {s: 0}
+        heap = [(abs(start[0] - goal[0]) + abs(start[1] - goal[1]), 0, s)]
+        while heap:
+            _, current_cost, current = heapq.heappop(heap)
+            if current == g:
+                path = []
+                while current != s:
+                    path.append((x1 + current % width, y1 + current // width))
+                    current = came_from[current]
+                path.reverse()
+                return path, window
+            if current_cost > cost[current]:
+                continue
+            cx, cy = current % width, current // width
+            next_cost = current_cost + 1
+            for dx, dy in _NEIGHBORS:
+                nx, ny = cx + dx, cy + dy
+                if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                    continue
+                neighbor = ny * width + nx
+                if not passable[neighbor] or next_cost >= cost.get(neighbor, next_cost + 1):
+                    continue
+                cost[neighbor] = next_cost
+                came_from[neighbor] = current
+                heapq.heappush(heap, (next_cost + abs(nx - gx) + abs(ny - gy), next_cost, neighbor))
+        return None, window
+
+    def _search_expanding(self, start: Tile, goal: Tile) -> Tuple[Optional[List[Tile]], Window]:
+        """Önce dar pencerede, bulunamazsa genişleyen pencerelerde ara"""
+        margin = self.search_margin
+        while True:
+            path, window = self._search(start, goal, margin)
+            if path is not None or margin >= self.max_margin:
+                return path, window
+            margin = min(self.max_margin, margin * 4)
+
+    def _join(self, start: Tile, cached: List[Tile]) -> Optional[List[Tile]]:
+        """Başlangıcı önbellekteki yola bağla"""
+        if start in cached:
+            return cached[cached.index(start) + 1:]
+
+        # Aynı bölgedeki en yakın yol düğümüne kısa yerel arama
+        region = (start[0] // self.region_size, start[1] // self.region_size)
+        best = None
+        for index, (x, y) in enumerate(cached):
+            if (x // self.region_size, y // self.region_size) != region:
+                continue
+            distance = abs(x - start[0]) + abs(y - start[1])
+            if best is None or distance < best[0]:
+                best = (distance, index)
+        if best is None:
+            return None
+        link, _ = self._search(start, cached[best[1]], 2)
+        if link is None:
+            return None
+        return link + cached[best[1] + 1:]
+
+    def find_path(self, start: Tile, goal: Tile) -> Optional[List[Tile]]:
+        """Başlangıç tile'ından hedefe tile yolu (başlangıç hariç, yol yoksa None)"""
+        if start == goal:
+            return []
+        if not self.tiles.in_bounds(*goal) or not self.tiles.in_bounds(*start):
+            return None
+
+        key = (start[0] // self.region_size, start[1] // self.region_size, goal)
+        entry = self._paths.get(key)
+        if entry is not None:
+            self._paths.move_to_end(key)
+            path = self._join(start, entry[0])
+            if path is not None:
+                self.stats["cache_hits"] += 1
+                return path
+
+        path, window = self._search_expanding(start, goal)
+        if path is None:
+            return None
+        self._paths[key] = ([start] + path, window)
+        if len(self._paths) > self.cache_size:
+            self._paths.popitem(last=False)
+        return list(path)
+
+    def flow_field(self, goal: Tile) -> FlowField:
+        """Hedef çevresindeki ``flow_radius`` alanında paylaşılan akış alanı"""
+        field = self._fields.get(goal)
+        if field is not None:
+            self._fields.move_to_end(goal)
+            return field
+
+        x1, y1, x2, y2 = self._window(goal, goal, self.flow_radius)
+        width = x2 - x1
+        _, walkable = self.tiles.region(x1, y1, x2, y2)
+        passable = walkable.ravel().tolist()
+        height = len(passable) // width
+        distances = [-1] * len(passable)
+
+        # Hedeften geriye doğru genişlik öncelikli arama
+        g = (goal[1] - y1) * width + (goal[0] - x1)
+        if passable[g]:
+            distances[g] = 0
+            queue = deque([g])
+            while queue:
+                current = queue.popleft()
+                cx, cy = current % width, current // width
+                next_distance = distances[current] + 1
+                for dx, dy in _NEIGHBORS:
+                    nx, ny = cx + dx, cy + dy
+                    if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                        continue
+                    neighbor = ny * width + nx
+                    if passable[neighbor] and distances[neighbor] < 0:
+                        distances[neighbor] = next_distance
+                        queue.append(neighbor)
+
+        field = FlowField(goal, x1, y1, np.array(distances, dtype=np.int32).reshape(height, width),
+                          walkable.copy())
+        self._fields[goal] = field
+        if len(self._fields) > self.field_cache_size:
+            self._fields.popitem(last=False)
+        return field
@@ -0,0 +1,101 @@
+"""
+Tile anahtarlı uzamsal indeks - dünya nesneleri ve bitkiler için.
+"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+TileKey = Tuple[int, int]
+
+
+class SpatialIndex:
+    """Tile koordinatına göre kayıt tutan uzamsal hash
+
+    Her tile'da en fazla bir kayıt bulunur. Kayıtlar ayrıca ``cell_size`` x
+    ``cell_size`` tile'lık hücrelere dağıtılır; böylece dikdörtgen ve yarıçap
+    sorguları tüm kayıtları değil yalnızca ilgili hücreleri dolaşır.
+    """
+
+    def __init__(self, cell_size: int = 16):
+        self.cell_size = cell_size
+        self._entries: Dict[TileKey, Any] = {}
+        self._cells: Dict[TileKey, Dict[TileKey, Any]] = {}
+
+    def _cell_of(self, x: int, y: int) -> TileKey:
+        return x // self.cell_size, y // self.cell_size
+
+    def insert(self, x: int, y: int, value: Any) -> None:
+        """Tile'a kayıt ekle (varsa eskisinin yerine geçer)"""
+        key = (x, y)
+        self._entries[key] = value
+        self._cells.setdefault(self._cell_of(x, y), {})[key] = value
+
+    def remove(self, x: int, y: int) -> Optional[Any]:
+        """Tile'daki kaydı sil ve döndür"""
+        key = (x, y)
+        value = self._entries.pop(key, None)
+        if value is not None:
+            cell_key = self._cell_of(x, y)
+            cell = self._cells[cell_key]
+            del cell[key]
+            if not cell:
+                del self._cells[cell_key]
+        return value
+
+    def get(self, x: int, y: int, default: Any = None) -> Any:
+        """Tile'daki kaydı döndür"""
+        return self._entries.get((x, y), default)
+
+    def clear(self) -> None:
+        """Tüm kayıtları sil"""
+        self._entries.clear()
+        self._cells.clear()
+
+    def rebuild(self, entries: list) -> None:
+        """İndeksi ``x``/``y`` alanları olan kayıt listesinden yeniden kur"""
+        self.clear()
+        for entry in entries:
+            self.insert(entry["x"], entry["y"], entry)
+
+    def values(self) -> List[Any]:
+        """Tüm kayıtlar (ekleme sırasına göre)"""
+        return list(self._entries.values())
+
+    def _iter_rect(self, x1: int, y1: int, x2: int, y2: int) -> Iterator[Tuple[TileKey, Any]]:
+        cx1, cy1 = self._cell_of(x1, y1)
+        cx2, cy2 = self._cell_of(x2, y2)
+
+        # Dikdörtgen hücre sayısından büyükse hücreleri tek tek dolaşmak daha pahalı
+        if (cx2 - cx1 + 1) * (cy2 - cy1 + 1) > len(self._cells):
+            cells = self._cells.values()
+        else:
+            cells = (self._cells.get((cx, cy)) for cy in range(cy1, cy2 + 1)
+                     for cx in range(cx1, cx2 + 1))
+
+        for cell in cells:
+            if not cell:
+                continue
+            for key, value in cell.items():
+                x, y = key
+                if x1 <= x <= x2 and y1 <= y <= y2:
+                    yield key, value
+
+    def query_rect(self, x1: int, y1: int, x2: int, y2: int) -> List[Any]:
+        """[x1, x2] x [y1, y2] (dahil) dikdörtgenindeki kayıtları döndür"""
+        return [value for _, value in self._iter_rect(x1, y1, x2, y2)]
+
+    def query_radius(self, cx: int, cy: int, radius: float) -> List[Any]:
+        """(cx, cy) merkezli ``radius`` tile yarıçapındaki kayıtları döndür"""
+        r = int(radius)
+        limit = radius * radius
+        return [
+            value for (x, y), value in self._iter_rect(cx - r, cy - r, cx + r, cy + r)
+            if (x - cx) * (x - cx) + (y - cy) * (y - cy) <= limit
+        ]
+
+    def __contains__(self, key: TileKey) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._entries.values()))
@@ -0,0 +1,201 @@
+"""
+Dizi tabanlı tile ızgarası - tile türleri ve yürünebilirlik haritası.
+"""
+from typing import Callable, Iterator, List, Optional, Tuple
+import numpy as np
+
+# Varsayılan tile paleti (id -> tür adı)
+DEFAULT_PALETTE = ["grass", "dirt"]
+
+
+class TileRef:
+    """Tek bir tile'a sözlük benzeri erişim (tiles[y][x]["type"] uyumluluğu için)"""
+
+    __slots__ = ("grid", "x", "y")
+
+    def __init__(self, grid: "TileGrid", x: int, y: int):
+        self.grid = grid
+        self.x = x
+        self.y = y
+
+    def __getitem__(self, key: str):
+        if key == "type":
+            return self.grid.type_at(self.x, self.y)
+        if key == "walkable":
+            return self.grid.is_walkable(self.x, self.y)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key == "type":
+            self.grid.set_type(self.x, self.y, value)
+        elif key == "walkable":
+            self.grid.set_walkable(self.x, self.y, value)
+        else:
+            raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        """dict.get benzeri erişim"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict:
+        """Tile'ı eski sözlük biçimine çevir"""
+        return {"type": self["type"], "walkable": self["walkable"]}
+
+
+class TileRow:
+    """Izgaradaki tek bir satır (tiles[y] uyumluluğu için)"""
+
+    __slots__ = ("grid", "y")
+
+    def __init__(self, grid: "TileGrid", y: int):
+        self.grid = grid
+        self.y = y
+
+    def __getitem__(self, x: int) -> TileRef:
+        if x < 0 or x >= self.grid.width:
+            raise IndexError(x)
+        return TileRef(self.grid, x, self.y)
+
+    def __len__(self) -> int:
+        return self.grid.width
+
+    def __iter__(self) -> Iterator[TileRef]:
+        for x in range(self.grid.width):
+            yield TileRef(self.grid, x, self.y)
+
+
+class TileGrid:
+    """NumPy dizileriyle saklanan tile ızgarası
+
+    Tile türleri bir palet üzerinden ``uint8`` kimlikleri olarak, yürünebilirlik
+    ise ayrı bir ``bool`` haritası olarak tutulur. ``grid[y][x]["type"]`` biçimindeki
+    eski erişim hâlâ çalışır ama sıcak yollar ``type_at``/``is_walkable`` kullanmalı.
+    """
+
+    def __init__(self, width: int, height: int, palette: Optional[List[str]] = None,
+                 default_type: str = "grass"):
+        self.width = width
+        self.height = height
+        self.palette: List[str] = list(palette or DEFAULT_PALETTE)
+        self._palette_ids = {name: i for i, name in enumerate(self.palette)}
+        self.types = np.full((height, width), self.type_id(default_type), dtype=np.uint8)
+        self.walkable = np.ones((height, width), dtype=bool)
+        self._listeners: List[Callable[[int, int], None]] = []
+
+    def add_listener(self, callback: Callable[[int, int], None]) -> None:
+        """Tile değiştiğinde çağrılacak fonksiyonu kaydet (callback(x, y))"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[int, int], None]) -> None:
+        """Kayıtlı değişiklik dinleyicisini kaldır"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, x: int, y: int) -> None:
+        for callback in self._listeners:
+            callback(x, y)
+
+    @classmethod
+    def from_rows(cls, rows: list, width: int, height: int) -> "TileGrid":
+        """Eski liste-sözlük biçiminden ızgara oluştur"""
+        grid = cls(width, height)
+        for y, row in enumerate(rows[:height]):
+            for x, tile in enumerate(row[:width]):
+                grid.types[y, x] = grid.type_id(tile.get("type", "grass"))
+                grid.walkable[y, x] = bool(tile.get("walkable", True))
+        return grid
+
+    def to_rows(self) -> list:
+        """Izgarayı eski liste-sözlük biçimine çevir (YAML kaydı için)"""
+        palette = self.palette
+        return [
+            [{"type": palette[t], "walkable": bool(w)} for t, w in zip(type_row, walk_row)]
+            for type_row, walk_row in zip(self.types.tolist(), self.walkable.tolist())
+        ]
+
+    def type_id(self, name: str) -> int:
+        """Tür adının palet kimliğini döndür, yoksa palete ekle"""
+        type_id = self._palette_ids.get(name)
+        if type_id is None:
+            if len(self.palette) >= 256:
+                raise ValueError("Tile paleti dolu (en fazla 256 tür)")
+            type_id = len(self.palette)
+            self.palette.append(name)
+            self._palette_ids[name] = type_id
+        return type_id
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Tile koordinatı harita içinde mi?"""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def type_at(self, x: int, y: int) -> str:
+        """Belirtilen tile'ın türünü döndür"""
+        return self.palette[self.types[y, x]]
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Belirtilen tile yürünebilir mi?"""
+        return bool(self.walkable[y, x])
+
+    def set_type(self, x: int, y: int, name: str) -> None:
+        """Belirtilen tile'ın türünü değiştir"""
+        type_id = self.type_id(name)
+        if self.types[y, x] != type_id:
+            self.types[y, x] = type_id
+            self._notify(x, y)
+
+    def set_walkable(self, x: int, y: int, walkable: bool) -> None:
+        """Belirtilen tile'ın yürünebilirliğini değiştir"""
+        walkable = bool(walkable)
+        if self.walkable[y, x] != walkable:
+            self.walkable[y, x] = walkable
+            self._notify(x, y)
+
+    def fill_type(self, x1: int, y1: int, x2: int, y2: int, name: str,
+                  mask: Optional[np.ndarray] = None) -> int:
+        """[x1, x2) x [y1, y2) aralığını (maske varsa yalnızca seçili tile'ları) türe boya
+
+        Değişen tile sayısını döndürür; dinleyiciler yalnızca değişen tile'lar için çağrılır.
+        """
+        type_id = self.type_id(name)
+        view = self.types[y1:y2, x1:x2]
+        changed = view != type_id
+        if mask is not None:
+            changed &= mask
+        view[changed] = type_id
+        if self._listeners:
+            for y, x in zip(*np.nonzero(changed)):
+                self._notify(x1 + int(x), y1 + int(y))
+        return int(np.count_nonzero(changed))
+
+    def region(self, x1: int, y1: int, x2: int, y2: int) -> Tuple[np.ndarray, np.ndarray]:
+        """[x1, x2) x [y1, y2) aralığındaki tür ve yürünebilirlik görünümlerini döndür"""
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(self.width, x2), min(self.height, y2)
+        return self.types[y1:y2, x1:x2], self.walkable[y1:y2, x1:x2]
+
+    def copy(self) -> "TileGrid":
+        """Dinleyicileri olmayan bağımsız kopya"""
+        grid = TileGrid(self.width, self.height, palette=self.palette)
+        grid.types[:] = self.types
+        grid.walkable[:] = self.walkable
+        return grid
+
+    @property
+    def nbytes(self) -> int:
+        """Izgaranın bellekte kapladığı bayt sayısı"""
+        return self.types.nbytes + self.walkable.nbytes
+
+    def __getitem__(self, y: int) -> TileRow:
+        if y < 0 or y >= self.height:
+            raise IndexError(y)
+        return TileRow(self, y)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __iter__(self) -> Iterator[TileRow]:
+        for y in range(self.height):
+            yield TileRow(self, y)
@@ -0,0 +1,118 @@
+"""
+Zemin katmanı önbelleği - tile'ları parça (chunk) yüzeylerine bir kez çizer.
+"""
+from collections import OrderedDict
+from typing import Dict, Set, Tuple
+import pygame
+from verdes.engine.sprites import sprites
+
+# Sprite bulunamazsa kullanılacak tile renkleri
+TILE_COLORS = {
+    "grass": (100, 200, 100),
+}
+DEFAULT_TILE_COLOR = (139, 69, 19)
+
+
+class TileLayerCache:
+    """Statik zemin katmanını mevsim başına parça yüzeylerinde saklar
+
+    Her parça ``chunk_tiles`` x ``chunk_tiles`` tile'lık tek bir yüzeydir ve
+    yalnızca ilk görüldüğünde çizilir. Bir tile değiştiğinde sadece onun
+    parçası (parça konumuna göre tutulan dizin sayesinde tüm önbelleği
+    taramadan) geçersiz kılınır. Bellek, en son kullanılan ``max_chunks`` parça ile
+    sınırlıdır.
+    """
+
+    def __init__(self, tiles, tile_size: int = 32, chunk_tiles: int = 8, max_chunks: int = 128):
+        self.tiles = tiles
+        self.tile_size = tile_size
+        self.chunk_tiles = chunk_tiles
+        self.chunk_pixels = tile_size * chunk_tiles
+        self.max_chunks = max_chunks
+        self._chunks: "OrderedDict[Tuple[str, int, int], pygame.Surface]" = OrderedDict()
+        self._seasons: Dict[Tuple[int, int], Set[str]] = {}  # (cx, cy) -> önbellekteki mevsimler
+        tiles.add_listener(self.invalidate_tile)
+
+    def close(self) -> None:
+        """Tile değişikliklerini dinlemeyi bırak"""
+        self.tiles.remove_listener(self.invalidate_tile)
+        self.invalidate_all()
+
+    def invalidate_tile(self, x: int, y: int) -> None:
+        """Tile'ı içeren parçayı tüm mevsimler için geçersiz kıl"""
+        cx, cy = x // self.chunk_tiles, y // self.chunk_tiles
+        for season in self._seasons.pop((cx, cy), ()):
+            del self._chunks[(season, cx, cy)]
+
+    def invalidate_all(self) -> None:
+        """Tüm parçaları geçersiz kıl"""
+        self._chunks.clear()
+        self._seasons.clear()
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def _render_chunk(self, cx: int, cy: int, season: str) -> pygame.Surface:
+        """Bir parçayı yüzeye çiz"""
+        x1, y1 = cx * self.chunk_tiles, cy * self.chunk_tiles
+        x2 = min(self.tiles.width, x1 + self.chunk_tiles)
+        y2 = min(self.tiles.height, y1 + self.chunk_tiles)
+        ts = self.tile_size
+
+        surface = pygame.Surface(((x2 - x1) * ts, (y2 - y1) * ts))
+        if pygame.display.get_surface():
+            surface = surface.convert()
+
+        palette = self.tiles.palette
+        types, _ = self.tiles.region(x1, y1, x2, y2)
+        for row, type_row in enumerate(types.tolist()):
+            for col, type_id in enumerate(type_row):
+                tile_type = palette[type_id]
+                image = sprites.get(("tile", tile_type, season))
+                dest = (col * ts, row * ts)
+                if image:
+                    surface.blit(image, dest)
+                else:
+                    # Sprite yoksa basit renk kullan
+                    surface.fill(TILE_COLORS.get(tile_type, DEFAULT_TILE_COLOR), (dest, (ts, ts)))
+        return surface
+
+    def get_chunk(self, cx: int, cy: int, season: str) -> pygame.Surface:
+        """Parça yüzeyini döndür (gerekirse çiz)"""
+        key = (season, cx, cy)
+        surface = self._chunks.get(key)
+        if surface is None:
+            surface = self._render_chunk(cx, cy, season)
+            self._chunks[key] = surface
+            self._seasons.setdefault((cx, cy), set()).add(season)
+            if len(self._chunks) > self.max_chunks:
+                (old_season, old_cx, old_cy), _ = self._chunks.popitem(last=False)
+                seasons = self._seasons[(old_cx, old_cy)]
+                seasons.discard(old_season)
+                if not seasons:
+                    del self._seasons[(old_cx, old_cy)]
+        else:
+            self._chunks.move_to_end(key)
+        return surface
+
+    def draw(self, surface: pygame.Surface, camera, season: str, batch=None) -> None:
+        """Kameranın gördüğü parçaları hedef yüzeye (``batch`` verilirse topluya) çiz"""
+        left = camera.x - camera.width / 2
+        top = camera.y - camera.height / 2
+        cp = self.chunk_pixels
+
+        chunks_x = (self.tiles.width + self.chunk_tiles - 1) // self.chunk_tiles
+        chunks_y = (self.tiles.height + self.chunk_tiles - 1) // self.chunk_tiles
+        cx1 = max(0, int(left // cp))
+        cy1 = max(0, int(top // cp))
+        cx2 = min(chunks_x - 1, int((left + camera.width) // cp))
+        cy2 = min(chunks_y - 1, int((top + camera.height) // cp))
+
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                screen_x, screen_y = camera.world_to_screen(cx * cp, cy * cp)
+                chunk = self.get_chunk(cx, cy, season)
+                if batch is not None:
+                    batch.add(chunk, (round(screen_x), round(screen_y)))
+                else:
+                    surface.blit(chunk, (round(screen_x), round(screen_y)))
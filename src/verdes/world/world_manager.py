@@ -0,0 +1,146 @@
+"""
+Dünya yöneticisi - birden çok haritayı LRU ile bellekte tutar ve komşu haritaları önceden yükler.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from verdes.world.map import World
+
+# Harita klasöründe harita sayılan dosya uzantıları
+MAP_SUFFIXES = (".yaml", ".vmap")
+
+
+class WorldManager:
+    """``data/maps`` altındaki haritaları yöneten LRU önbellek
+
+    En fazla ``max_loaded`` dünya bellekte tutulur; sınır aşılınca en uzun
+    süredir kullanılmayan dünya kaydedilip kapatılır (etkin dünya hiçbir zaman
+    atılmaz). Oyuncu bir geçiş noktasına ``preload_distance`` tile kadar
+    yaklaştığında hedef harita arka plan iş parçacığında yüklenmeye başlar;
+    geçiş anında ``get`` yalnızca hazır dünyayı alır. Bellekte olmayan
+    haritaların kaçırdığı gün dönümleri biriktirilir ve yeniden yüklendiklerinde
+    tek seferde uygulanır.
+    """
+
+    def __init__(self, config, maps_dir="data/maps"):
+        self.config = config
+        self.maps_dir = Path(maps_dir)
+        world_config = config.get("world", {})
+        self.max_loaded = max(1, world_config.get("max_loaded_maps", 3))
+        self.preload_distance = world_config.get("preload_distance", 8)
+        self.active: Optional[World] = None
+        self._worlds: "OrderedDict[str, World]" = OrderedDict()
+        self._loading: Dict[str, Future] = {}
+        self._pending_days: Dict[str, int] = {}
+        self._last_tile: Optional[Tuple[int, int]] = None  # Geçişe yeni basıldı mı kontrolü için
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="world-preload")
+
+    def available_maps(self) -> List[str]:
+        """Harita klasöründeki tüm harita adları"""
+        if not self.maps_dir.exists():
+            return []
+        return sorted({path.stem for path in self.maps_dir.iterdir() if path.suffix in MAP_SUFFIXES})
+
+    def is_loaded(self, name: str) -> bool:
+        """Dünya bellekte mi?"""
+        return name in self._worlds
+
+    # Yükleme
+
+    def _load(self, name: str) -> World:
+        return World(name, self.config)
+
+    def preload(self, name: str) -> None:
+        """Dünyayı arka planda yüklemeye başla (zaten yüklüyse bir şey yapmaz)"""
+        with self._lock:
+            if name in self._worlds or name in self._loading:
+                return
+            self._loading[name] = self._executor.submit(self._load, name)
+
+    def get(self, name: str) -> World:
+        """Dünyayı döndür; önceden yükleniyorsa bitmesini bekle, yoksa hemen yükle"""
+        world = self._worlds.get(name)
+        if world is not None:
+            self._worlds.move_to_end(name)
+            return world
+
+        with self._lock:
+            future = self._loading.pop(name, None)
+        world = future.result() if future is not None else self._load(name)
+
+        # Bellekte değilken kaçırılan günleri tek seferde uygula
+        days = self._pending_days.pop(name, 0)
+        if days:
+            world.advance_days(days)
+        self._worlds[name] = world
+        self._evict()
+        return world
+
+    def set_active(self, name: str) -> World:
+        """Etkin dünyayı değiştir"""
+        self.active = self.get(name)
+        self._last_tile = None  # Varış noktasındaki geçiş hemen geri götürmesin
+        return self.active
+
+    def _evict(self) -> None:
+        """Sınırı aşan en eski dünyaları kaydet ve kapat"""
+        for name in list(self._worlds):
+            if len(self._worlds) <= self.max_loaded:
+                break
+            world = self._worlds[name]
+            if world is self.active:
+                continue
+            del self._worlds[name]
+            world.save()
+            world.close()
+
+    # Geçişler
+
+    def update(self, tile_x: int, tile_y: int) -> Optional[dict]:
+        """Oyuncunun tile konumuna göre yakın geçişlerin hedeflerini önceden yükle
+
+        Oyuncu bir geçiş noktasına yeni bastıysa o geçişi döndürür.
+        """
+        if self.active is None:
+            return None
+        for warp in self.active.warps:
+            distance = max(abs(warp["x"] - tile_x), abs(warp["y"] - tile_y))
+            if distance <= self.preload_distance:
+                self.preload(warp["target"])
+
+        entered = self._last_tile is not None and self._last_tile != (tile_x, tile_y)
+        self._last_tile = (tile_x, tile_y)
+        return self.active.warp_at(tile_x, tile_y) if entered else None
+
+    # Tüm dünyalar
+
+    def advance_days(self, days: int = 1) -> None:
+        """Gün dönümü: bellektekileri ilerlet, diğerleri için günleri biriktir"""
+        for world in self._worlds.values():
+            world.advance_days(days)
+        for name in self.available_maps():
+            if name not in self._worlds:
+                self._pending_days[name] = self._pending_days.get(name, 0) + days
+
+    def save(self) -> None:
+        """Bellekteki tüm dünyaları kaydet"""
+        for world in self._worlds.values():
+            world.save()
+
+    def close(self, save: bool = True) -> None:
+        """Önceden yüklemeleri bekle, tüm dünyaları (``save`` ise kaydedip) kapat"""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            loading, self._loading = self._loading, {}
+        for future in loading.values():
+            if future.exception() is None:
+                future.result().close()
+        for world in self._worlds.values():
+            if save:
+                world.save()
+            world.close()
+        self._worlds.clear()
+        self.active = None
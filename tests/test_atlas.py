@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.engine.atlas`."""
+
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygame
+
+from verdes.engine.atlas import build_atlas, pack_rects
+from verdes.engine.sprites import SpriteRegistry
+
+
+class TestPackRects(unittest.TestCase):
+    """Tests for the shelf packer."""
+
+    def test_no_overlap_and_overflow(self):
+        """Rects stay inside their sheet, never overlap, and spill onto new sheets."""
+        sizes = [(32, 32)] * 40 + [(64, 16), (16, 64), (300, 10)]
+        placements = pack_rects(sizes, sheet_size=128, padding=1)
+        self.assertGreater(max(sheet for sheet, _, _ in placements), 0)
+        boxes = {}
+        for (w, h), (sheet, x, y) in zip(sizes, placements):
+            if w <= 128:
+                self.assertLessEqual(x + w, 128)
+                self.assertLessEqual(y + h, 128)
+            for (ox, oy, ow, oh) in boxes.get(sheet, []):
+                self.assertTrue(x + w <= ox or ox + ow <= x or y + h <= oy or oy + oh <= y)
+            boxes.setdefault(sheet, []).append((x, y, w, h))
+
+
+class TestAtlasRegistry(unittest.TestCase):
+    """Tests for atlas-backed sprite lookups."""
+
+    def setUp(self):
+        """Write a few coloured sprites and pack them."""
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.images = root / "images"
+        colors = {"tiles/grass.png": (0, 200, 0, 255), "crops/turnip_5.png": (200, 0, 0, 255),
+                  "objects/rock.png": (90, 90, 90, 255)}
+        for name, color in colors.items():
+            path = self.images / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            surface = pygame.Surface((32, 32), pygame.SRCALPHA)
+            surface.fill(color)
+            pygame.image.save(surface, str(path))
+        self.colors = colors
+        self.index = build_atlas(self.images, root / "atlas", sheet_size=64)
+
+    def tearDown(self):
+        """Remove the scratch assets."""
+        self._tmp.cleanup()
+
+    def test_registry_reads_from_atlas(self):
+        """Sprites resolve to sub-rects of the packed sheets, even without the source files."""
+        self.assertEqual(len(self.index["sprites"]), 3)
+        for name in self.colors:
+            (self.images / name).unlink()
+
+        registry = SpriteRegistry(str(self.images), str(Path(self._tmp.name) / "atlas" / "atlas.json"))
+        grass = registry.get(("tile", "grass", "spring"))
+        self.assertEqual(grass.get_size(), (32, 32))
+        self.assertIsNotNone(grass.get_parent())
+        self.assertEqual(tuple(grass.get_at((5, 5))), self.colors["tiles/grass.png"])
+        self.assertEqual(tuple(registry.get(("crop", "turnip", 5)).get_at((0, 0))),
+                         self.colors["crops/turnip_5.png"])
+        self.assertIsNone(registry.get(("crop", "turnip", 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.engine.batch`."""
+
+
+import unittest
+
+import pygame
+
+from verdes.engine.batch import RenderBatch, circle_sprite
+
+
+class TestRenderBatch(unittest.TestCase):
+    """Tests for the batched blit layer."""
+
+    def test_flush_draws_everything_once(self):
+        """Queued surfaces land at their destinations and the queue empties."""
+        target = pygame.Surface((64, 64))
+        red = pygame.Surface((4, 4))
+        red.fill((255, 0, 0))
+        batch = RenderBatch()
+        batch.add(red, (0, 0))
+        batch.add_centered(red, 32, 32)
+        self.assertEqual(batch.flush(target), 2)
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(tuple(target.get_at((1, 1)))[:3], (255, 0, 0))
+        self.assertEqual(tuple(target.get_at((31, 31)))[:3], (255, 0, 0))
+        self.assertEqual(tuple(target.get_at((20, 20)))[:3], (0, 0, 0))
+        self.assertEqual(batch.flush(target), 0)
+
+    def test_fallback_shapes_are_cached(self):
+        """Fallback shapes are drawn once per radius and colour."""
+        self.assertIs(circle_sprite(7, (0, 255, 0)), circle_sprite(7, (0, 255, 0)))
+        self.assertEqual(circle_sprite(7, (0, 255, 0)).get_size(), (15, 15))
+
+
+if __name__ == "__main__":
+    unittest.main()
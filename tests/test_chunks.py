@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.chunks`."""
+
+
+import unittest
+
+import numpy as np
+
+from verdes.world.chunks import ChunkedObjectIndex, ChunkedTileGrid
+
+
+def checker_source(x1, y1, x2, y2):
+    """Chunk source producing a deterministic checkerboard."""
+    ys, xs = np.mgrid[y1:y2, x1:x2]
+    return ((xs + ys) % 2).astype(np.uint8), np.ones((y2 - y1, x2 - x1), dtype=bool)
+
+
+class TestChunkedTileGrid(unittest.TestCase):
+    """Tests for the streaming tile grid."""
+
+    def setUp(self):
+        """Build a 100x100 grid of 16x16 chunks with room for four."""
+        self.grid = ChunkedTileGrid(100, 100, ["grass", "dirt"], checker_source,
+                                    chunk_size=16, max_chunks=4)
+
+    def tearDown(self):
+        """Drop the swap directory."""
+        self.grid.close()
+
+    def test_lookup_loads_on_demand(self):
+        """Chunks are loaded lazily from the source."""
+        self.assertEqual(self.grid.resident_chunks, 0)
+        self.assertEqual(self.grid.type_at(0, 0), "grass")
+        self.assertEqual(self.grid.type_at(99, 98), "dirt")
+        self.assertEqual(self.grid.resident_chunks, 2)
+
+    def test_lru_eviction_keeps_edits(self):
+        """Dirty chunks survive eviction through the swap directory."""
+        self.grid.set_type(5, 5, "water")
+        self.grid.set_walkable(5, 6, False)
+        for x in range(0, 100, 16):
+            self.grid.type_at(x, 50)
+        self.assertLessEqual(self.grid.resident_chunks, 4)
+        self.assertEqual(self.grid.type_at(5, 5), "water")
+        self.assertFalse(self.grid.is_walkable(5, 6))
+
+    def test_region_spans_chunks(self):
+        """Regions crossing chunk borders match the source."""
+        types, walkable = self.grid.region(10, 10, 40, 20)
+        expected, _ = checker_source(10, 10, 40, 20)
+        np.testing.assert_array_equal(types, expected)
+        self.assertTrue(walkable.all())
+
+
+def diagonal_objects(x1, y1, x2, y2):
+    """Entry source with a rock on every diagonal tile of the range."""
+    return [{"type": "rock", "x": i, "y": i} for i in range(max(x1, y1), min(x2, y2))]
+
+
+class TestChunkedObjectIndex(unittest.TestCase):
+    """Tests for objects paged together with their tile chunks."""
+
+    def setUp(self):
+        """Index the diagonal rocks of the streaming grid."""
+        self.grid = ChunkedTileGrid(100, 100, ["grass", "dirt"], checker_source,
+                                    chunk_size=16, max_chunks=4)
+        self.index = ChunkedObjectIndex(self.grid, diagonal_objects)
+
+    def tearDown(self):
+        """Stop listening and drop the swap directory."""
+        self.index.close()
+        self.grid.close()
+
+    def test_objects_follow_resident_chunks(self):
+        """Only the objects of loaded chunks stay in memory."""
+        self.assertEqual(self.index.resident_entries, 0)
+        self.assertEqual(self.index.get(3, 3)["type"], "rock")
+        self.assertIsNone(self.index.get(3, 4))
+        self.assertEqual(self.index.resident_entries, 16)
+        for i in range(16, 100, 16):
+            self.index.get(i, i)
+        self.assertLessEqual(self.index.resident_entries, 4 * 16)
+        self.assertEqual(len(self.index.query_rect(0, 0, 99, 99)), 100)
+        self.assertEqual(len(self.index), 100)
+        self.assertIsNone(self.index.get(-1, 200))
+
+    def test_edits_survive_eviction(self):
+        """Inserted and removed objects are kept when their chunk is dropped."""
+        self.index.insert(5, 6, {"type": "tree", "x": 5, "y": 6})
+        self.assertEqual(self.index.remove(5, 5)["type"], "rock")
+        for i in range(16, 100, 16):
+            self.index.get(i, i)
+        self.assertNotIn((5, 6), self.index._index)
+        self.assertEqual(self.index.get(5, 6)["type"], "tree")
+        self.assertIsNone(self.index.get(5, 5))
+        self.assertEqual(len(self.index.query_radius(5, 5, 1.5)), 3)  # (4, 4), (5, 6), (6, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.collision`."""
+
+
+import unittest
+
+from verdes.world.collision import CollisionGrid
+from verdes.world.tile_grid import TileGrid
+
+
+class TestCollisionGrid(unittest.TestCase):
+    """Tests for swept box movement against the walkability map."""
+
+    def setUp(self):
+        """Build a 10x10 map with a wall along column 5."""
+        self.tiles = TileGrid(10, 10)
+        for y in range(10):
+            self.tiles.set_walkable(5, y, False)
+        self.grid = CollisionGrid(self.tiles, tile_size=32)
+
+    def test_stops_at_wall_edge(self):
+        """A box moving into the wall stops flush against it."""
+        x, y, hit_x, hit_y = self.grid.move(100, 100, 10, 10, 200, 0)
+        self.assertEqual((x, y), (160 - 10, 100))
+        self.assertTrue(hit_x)
+        self.assertFalse(hit_y)
+
+    def test_fast_move_cannot_tunnel(self):
+        """Large steps are swept and still stop at the first wall."""
+        x, _, hit_x, _ = self.grid.move(300, 100, 10, 10, -250, 0)
+        self.assertEqual(x, 192 + 10)
+        self.assertTrue(hit_x)
+
+    def test_slides_along_wall(self):
+        """Blocked on one axis, the box keeps moving on the other."""
+        x, y, hit_x, hit_y = self.grid.move(150, 100, 10, 10, 20, 40)
+        self.assertEqual((x, y), (150, 140))
+        self.assertTrue(hit_x)
+        self.assertFalse(hit_y)
+
+    def test_map_edges_block(self):
+        """The outside of the map counts as solid."""
+        x, y, _, _ = self.grid.move(20, 20, 10, 10, -100, -100)
+        self.assertEqual((x, y), (10, 10))
+        self.assertTrue(self.grid.is_box_free(x, y, 10, 10))
+        self.assertFalse(self.grid.is_box_free(165, 100, 10, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
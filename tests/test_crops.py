@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.crops`."""
+
+
+import unittest
+
+import numpy as np
+
+from verdes.world.crops import MAX_GROWTH_STAGE, WITHER_DAYS, CropStore
+
+
+class TestCropStore(unittest.TestCase):
+    """Tests for the array-backed crop store."""
+
+    def setUp(self):
+        """Plant a small row of crops in a store that must grow."""
+        self.store = CropStore(capacity=2)
+        self.crops = [self.store.add("turnip", x, 0) for x in range(5)]
+
+    def test_dict_style_access(self):
+        """Views read and write fields like the old crop dicts."""
+        crop = self.crops[3]
+        self.assertEqual(crop["type"], "turnip")
+        self.assertEqual((crop["x"], crop["y"]), (3, 0))
+        crop["watered"] = True
+        crop["type"] = "potato"
+        self.assertTrue(crop["watered"])
+        self.assertEqual(crop.to_dict()["type"], "potato")
+        self.assertEqual(len(self.store), 5)
+
+    def test_rows_are_reused(self):
+        """Removed rows are handed out again without moving other crops."""
+        self.store.remove(self.crops[1])
+        self.assertEqual(len(self.store), 4)
+        replacement = self.store.add("tomato", 9, 9)
+        self.assertEqual(replacement.row, self.crops[1].row)
+        self.assertEqual(self.crops[2]["x"], 2)
+
+    def test_new_day_grows_watered_crops(self):
+        """Only crops watered that day grow, and watering resets."""
+        self.crops[0]["watered"] = True
+        self.store.advance_days(1)
+        self.assertEqual(self.crops[0]["growth_stage"], 1.0)
+        self.assertEqual(self.crops[1]["growth_stage"], 0.0)
+        self.assertFalse(self.crops[0]["watered"])
+        self.assertEqual(self.crops[0]["days_since_watered"], 0)
+        self.assertEqual(self.crops[1]["days_since_watered"], 1)
+
+    def test_multi_day_catch_up_matches_single_days(self):
+        """Advancing N days at once equals N single-day ticks."""
+        other = CropStore()
+        twins = [other.add("turnip", x, 0) for x in range(5)]
+        for store, crops in ((self.store, self.crops), (other, twins)):
+            crops[0]["watered"] = True
+            crops[1]["growth_stage"] = MAX_GROWTH_STAGE
+        self.store.advance_days(6)
+        for _ in range(6):
+            other.advance_days(1)
+        self.assertEqual([c.to_dict() for c in self.crops], [c.to_dict() for c in twins])
+
+    def test_rain_waters_every_day(self):
+        """Rainy days grow every crop up to maturity without withering."""
+        self.store.advance_days(7, rainy=True)
+        self.assertTrue(self.store.mature_mask()[[c.row for c in self.crops]].all())
+        self.assertEqual(self.crops[0]["days_growing"], 7)
+
+    def test_neglected_crops_wither(self):
+        """Crops left dry for too long wither and stop growing."""
+        crop = self.crops[2]
+        self.store.advance_days(WITHER_DAYS)
+        self.assertTrue(crop["withered"])
+        crop["watered"] = True
+        self.store.advance_days(1, rainy=True)
+        self.assertEqual(crop["growth_stage"], 0.0)
+
+
+class TestCropStoreBatch(unittest.TestCase):
+    """Tests for the batch operations used by area farming."""
+
+    def test_add_water_remove_many(self):
+        """Batch calls touch every given row and keep the free list valid."""
+        store = CropStore(capacity=2)
+        rows = store.add_many("potato", np.arange(6), np.full(6, 4))
+        self.assertEqual(len(store), 6)
+        self.assertEqual([store.view(row)["x"] for row in rows], list(range(6)))
+
+        store.water_rows(rows[:3])
+        self.assertEqual(int(store.data["watered"][rows].sum()), 3)
+
+        store.remove_rows(rows[::2])
+        self.assertEqual(len(store), 3)
+        again = store.add_many("tomato", np.arange(3), np.zeros(3))
+        self.assertEqual(sorted(again.tolist()), sorted(rows[::2].tolist()))
+        self.assertEqual(len(store), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
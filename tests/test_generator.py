@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.generator`."""
+
+
+import unittest
+
+import numpy as np
+
+from verdes.world.generator import MapGenerator
+
+
+class TestMapGenerator(unittest.TestCase):
+    """Tests for the seeded map generator."""
+
+    def setUp(self):
+        """Generate a small map from a fixed seed."""
+        self.generator = MapGenerator(96, 64, seed=42)
+        self.data = self.generator.generate()
+
+    def test_same_seed_same_map(self):
+        """Equal seeds produce identical maps, different seeds do not."""
+        again = MapGenerator(96, 64, seed=42).generate()
+        np.testing.assert_array_equal(again.tiles.types, self.data.tiles.types)
+        self.assertEqual(again.objects, self.data.objects)
+        other = MapGenerator(96, 64, seed=43).generate()
+        self.assertFalse((other.tiles.types == self.data.tiles.types).all())
+
+    def test_regions_match_full_map(self):
+        """Generating a region gives the same tiles as the whole map."""
+        types, walkable = self.generator.generate_region(30, 20, 70, 50)
+        np.testing.assert_array_equal(types, self.data.tiles.types[20:50, 30:70])
+        np.testing.assert_array_equal(walkable, self.data.tiles.walkable[20:50, 30:70])
+
+    def test_objects_block_tiles_outside_farm(self):
+        """Objects stay out of the farm and make their tiles unwalkable."""
+        self.assertTrue(self.data.objects)
+        for obj in self.data.objects:
+            self.assertFalse(self.data.tiles.is_walkable(obj["x"], obj["y"]))
+            distance = np.hypot(obj["x"] - 48, obj["y"] - 32)
+            self.assertGreater(distance, self.generator.farm_radius)
+
+
+if __name__ == "__main__":
+    unittest.main()
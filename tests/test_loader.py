@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.engine.loader`."""
+
+
+import threading
+import unittest
+
+from verdes.engine.loader import Loader
+
+
+class TestLoader(unittest.TestCase):
+    """Tests for the background startup loader."""
+
+    def test_jobs_run_concurrently_with_progress(self):
+        """Independent jobs overlap and progress follows their weights."""
+        gate = threading.Event()
+        loader = Loader(max_workers=2)
+        loader.add("slow", gate.wait, 5, weight=3)
+        loader.add("fast", lambda value: value * 2, 21)
+        loader.start()
+        try:
+            self.assertEqual(loader.result("fast"), 42)
+            self.assertEqual(loader.pending, ["slow"])
+            self.assertAlmostEqual(loader.progress, 0.25)
+            self.assertFalse(loader.done)
+            gate.set()
+            self.assertTrue(loader.result("slow"))
+            self.assertTrue(loader.done)
+            self.assertEqual(loader.progress, 1.0)
+        finally:
+            gate.set()
+            loader.close()
+
+    def test_errors_surface_in_result(self):
+        """A failing job re-raises on the caller's thread."""
+        loader = Loader()
+        loader.add("broken", lambda: 1 / 0)
+        loader.start()
+        with self.assertRaises(ZeroDivisionError):
+            loader.result("broken")
+        loader.close()
+        self.assertTrue(loader.done)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.map_format`."""
+
+
+import os
+import tempfile
+import unittest
+
+from verdes.world.map_format import (
+    MapData, MapFile, MapFormatError, read_map, write_map, yaml_to_binary, write_yaml_map,
+)
+from verdes.world.tile_grid import TileGrid
+
+
+class TestMapFormat(unittest.TestCase):
+    """Tests for the binary map format."""
+
+    def setUp(self):
+        """Build a small map in a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "test.vmap")
+
+        tiles = TileGrid(5, 3)
+        tiles.set_type(2, 1, "dirt")
+        tiles.set_walkable(4, 2, False)
+        objects = [{"type": "rock", "x": 4, "y": 2, "walkable": False}]
+        crops = [{"type": "turnip", "x": 2, "y": 1, "growth_stage": 2.5, "watered": True,
+                  "days_since_watered": 0, "days_growing": 3, "withered": False}]
+        self.data = MapData(5, 3, tiles, objects, crops, {"seed": 7})
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """Written maps read back identically."""
+        write_map(self.path, self.data)
+        data = read_map(self.path)
+        self.assertEqual((data.width, data.height), (5, 3))
+        self.assertEqual(data.tiles.to_rows(), self.data.tiles.to_rows())
+        self.assertEqual(data.objects, self.data.objects)
+        self.assertEqual(data.crops, self.data.crops)
+        self.assertEqual(data.extra, {"seed": 7})
+
+    def test_temp_files_are_unique_and_cleaned_up(self):
+        """Each write stages through its own temp file, also when the replace fails."""
+        staged = []
+
+        def record(tmp_path, path):
+            staged.append(tmp_path)
+            os.replace(tmp_path, path)
+
+        write_map(self.path, self.data, record)
+        write_map(self.path, self.data, record)
+        self.assertNotEqual(staged[0], staged[1])
+
+        def fail(tmp_path, path):
+            raise OSError("locked")
+
+        with self.assertRaises(OSError):
+            write_map(self.path, self.data, fail)
+        self.assertEqual(os.listdir(self.tmp.name), ["test.vmap"])
+
+    def test_mmap_views(self):
+        """Tile layers are exposed without copying the file."""
+        write_map(self.path, self.data)
+        with MapFile(self.path) as map_file:
+            self.assertEqual(map_file.meta["tile_palette"][map_file.types[1, 2]], "dirt")
+            self.assertFalse(map_file.walkable()[2, 4])
+            self.assertEqual(map_file.crop_count, 1)
+
+    def test_yaml_conversion(self):
+        """YAML maps convert to the binary format."""
+        yaml_path = os.path.join(self.tmp.name, "test.yaml")
+        write_yaml_map(yaml_path, self.data)
+        yaml_to_binary(yaml_path, self.path)
+        self.assertEqual(read_map(self.path).objects, self.data.objects)
+
+    def test_rejects_garbage(self):
+        """Files without the magic header are rejected."""
+        with open(self.path, "wb") as f:
+            f.write(b"not a map" * 20)
+        with self.assertRaises(MapFormatError):
+            MapFile(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.map_journal`."""
+
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from verdes.world.map_journal import MapJournal
+
+
+class TestMapJournal(unittest.TestCase):
+    """Tests for the append-only map change journal."""
+
+    def setUp(self):
+        """Open a journal in a temporary directory."""
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.path = self.tmpdir / "farm.vmap.journal"
+        self.journal = MapJournal(self.path)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.tmpdir)
+
+    def test_flush_appends_only_pending(self):
+        """Each flush writes just the new entries."""
+        self.journal.record("tile", x=1, y=2, type="dirt", walkable=True)
+        self.assertEqual(self.journal.flush(), 1)
+        size = self.path.stat().st_size
+        self.journal.record("object_remove", x=3, y=3)
+        self.assertEqual(self.journal.flush(), 1)
+        self.assertEqual(self.journal.flush(), 0)
+        self.assertGreater(self.path.stat().st_size, size)
+        ops = [entry["op"] for entry in MapJournal(self.path).entries(0)]
+        self.assertEqual(ops, ["tile", "object_remove"])
+
+    def test_compaction_starts_new_generation(self):
+        """Entries after compaction survive; compacted ones are dropped."""
+        written = []
+        self.journal.record("tile", x=0, y=0, type="dirt", walkable=True)
+        self.journal.compact(written.append, background=False)
+        self.journal.record("object_remove", x=1, y=1)
+        self.journal.flush()
+        self.assertEqual(written, [1])
+        reopened = MapJournal(self.path)
+        self.assertEqual([e["op"] for e in reopened.entries(1)], ["object_remove"])
+        self.assertEqual(reopened.generation, 1)
+
+    def test_old_base_replays_both_generations(self):
+        """If the base was never rewritten, older segments are replayed too."""
+        self.journal.record("tile", x=0, y=0, type="dirt", walkable=True)
+        self.journal.flush()
+        self.journal.compact(lambda generation: 1 / 0, background=False)
+        self.assertIsInstance(self.journal.last_error, ZeroDivisionError)
+        self.journal.record("object_remove", x=1, y=1)
+        self.journal.flush()
+        self.assertEqual([e["op"] for e in MapJournal(self.path).entries(0)], ["tile", "object_remove"])
+
+    def test_truncated_last_line_is_ignored(self):
+        """A partial line from a crash does not break loading."""
+        self.journal.record("tile", x=0, y=0, type="dirt", walkable=True)
+        self.journal.flush()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"op": "ti')
+        self.assertEqual(len(list(MapJournal(self.path).entries(0))), 1)
+
+    def test_flush_after_truncated_tail_replays(self):
+        """Reopening drops the partial line so later entries still parse."""
+        self.journal.record("tile", x=0, y=0, type="dirt", walkable=True)
+        self.journal.flush()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"op": "ti')
+        reopened = MapJournal(self.path)
+        reopened.record("tile", x=1, y=0, type="dirt", walkable=True)
+        reopened.record("object_remove", x=2, y=2)
+        reopened.flush()
+        self.assertTrue(self.path.read_text(encoding="utf-8").endswith("\n"))
+        entries = list(MapJournal(self.path).entries(0))
+        self.assertEqual([(e["op"], e.get("x")) for e in entries],
+                         [("tile", 0), ("tile", 1), ("object_remove", 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.ui.menu_background`."""
+
+
+import unittest
+
+import pygame
+
+from verdes.systems.rng import RNGService
+from verdes.ui.menu_background import MenuBackground
+
+
+class TestMenuBackground(unittest.TestCase):
+    """Tests for the cached menu backdrop."""
+
+    def test_static_layer_built_once_per_size(self):
+        """The backdrop is reused between frames and rebuilt on resize."""
+        background = MenuBackground(particles=0, stream=RNGService(1).stream("menu"))
+        target = pygame.Surface((160, 120))
+        background.draw(target)
+        cached = background._surface
+        background.update(0.5)
+        background.draw(target)
+        self.assertIs(background._surface, cached)
+        self.assertEqual(tuple(target.get_at((0, 0)))[:3], (20, 180, 20))
+
+        background.draw(pygame.Surface((200, 100)))
+        self.assertEqual(background.size, (200, 100))
+        self.assertIsNot(background._surface, cached)
+
+    def test_frames_do_not_flicker(self):
+        """Without the animated layer two frames are pixel-identical."""
+        background = MenuBackground(particles=0, stream=RNGService(2).stream("menu"))
+        first, second = pygame.Surface((80, 60)), pygame.Surface((80, 60))
+        background.draw(first)
+        background.draw(second)
+        self.assertEqual(pygame.image.tobytes(first, "RGB"), pygame.image.tobytes(second, "RGB"))
+
+    def test_particles_move(self):
+        """The animated layer changes over time on top of the cached backdrop."""
+        background = MenuBackground(stream=RNGService(3).stream("menu"))
+        first, second = pygame.Surface((80, 60)), pygame.Surface((80, 60))
+        background.draw(first)
+        background.update(2.0)
+        background.draw(second)
+        self.assertNotEqual(pygame.image.tobytes(first, "RGB"), pygame.image.tobytes(second, "RGB"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.engine.particles`."""
+
+
+import unittest
+
+import numpy as np
+import pygame
+
+from verdes.engine.particles import ParticleSystem, ScreenFlash, make_rain_sprites
+
+
+class TestParticleSystem(unittest.TestCase):
+    """Tests for the preallocated rain particles."""
+
+    def setUp(self):
+        """Create a rain system on a small screen."""
+        self.rain = ParticleSystem(64, 200, 100, make_rain_sprites(), seed=3)
+        self.rain.set_count(50)
+
+    def test_drops_persist_between_frames(self):
+        """Drops move along their velocity instead of respawning."""
+        before = self.rain.positions[:50].copy()
+        velocities = self.rain.velocities[:50].copy()
+        lifetimes = self.rain.lifetimes[:50].copy()
+        self.rain.update(0.01)
+        expected = before + velocities * 0.01
+        stayed = (lifetimes > 0.01) & (expected[:, 0] <= 200) & (expected[:, 1] <= 100)
+        self.assertGreater(stayed.sum(), 40)
+        np.testing.assert_allclose(self.rain.positions[:50][stayed], expected[stayed], rtol=1e-4)
+
+    def test_count_is_capped(self):
+        """The active count never exceeds the preallocated capacity."""
+        self.rain.set_count(1000)
+        self.assertEqual(self.rain.count, 64)
+        self.rain.set_count(10)
+        self.assertEqual(self.rain.count, 10)
+
+    def test_expired_drops_respawn_on_screen(self):
+        """Drops leaving the screen are respawned above it."""
+        for _ in range(200):
+            self.rain.update(1 / 30)
+        positions = self.rain.positions[:50]
+        self.assertTrue((positions[:, 1] <= 100).all())
+        surface = pygame.Surface((200, 100))
+        self.rain.draw(surface)
+
+    def test_flash_fades(self):
+        """A triggered flash fades out over its duration."""
+        flash = ScreenFlash(rate=0, duration=0.2)
+        flash.trigger(80)
+        flash.update(0.1)
+        self.assertAlmostEqual(flash.alpha, 40)
+        flash.update(0.2)
+        self.assertEqual(flash.alpha, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
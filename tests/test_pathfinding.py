@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.pathfinding`."""
+
+
+import unittest
+
+from verdes.world.pathfinding import Pathfinder
+from verdes.world.tile_grid import TileGrid
+
+
+class TestPathfinder(unittest.TestCase):
+    """Tests for cached A* and shared flow fields."""
+
+    def setUp(self):
+        """Build a 20x20 map split by a wall with a gap at y=15."""
+        self.tiles = TileGrid(20, 20)
+        for y in range(20):
+            if y != 15:
+                self.tiles.set_walkable(10, y, False)
+        self.pathfinder = Pathfinder(self.tiles, region_size=4)
+
+    def assertValidPath(self, start, goal, path):
+        """Path steps are adjacent, walkable and end at the goal."""
+        self.assertEqual(path[-1], goal)
+        previous = start
+        for x, y in path:
+            self.assertEqual(abs(x - previous[0]) + abs(y - previous[1]), 1)
+            self.assertTrue(self.tiles.is_walkable(x, y))
+            previous = (x, y)
+
+    def test_path_goes_around_wall(self):
+        """The shortest path uses the gap in the wall."""
+        path = self.pathfinder.find_path((5, 5), (15, 5))
+        self.assertValidPath((5, 5), (15, 5), path)
+        self.assertIn((10, 15), path)
+        self.assertEqual(len(path), 10 + 2 * 10)
+
+    def test_cache_shared_within_region(self):
+        """Starts in the same region reuse the cached search."""
+        self.pathfinder.find_path((5, 5), (15, 5))
+        searches = self.pathfinder.stats["searches"]
+        path = self.pathfinder.find_path((6, 6), (15, 5))
+        self.assertValidPath((6, 6), (15, 5), path)
+        self.assertEqual(self.pathfinder.stats["cache_hits"], 1)
+        self.assertLessEqual(self.pathfinder.stats["searches"] - searches, 1)
+
+    def test_tile_change_invalidates(self):
+        """Closing the gap invalidates cached paths."""
+        self.pathfinder.find_path((5, 5), (15, 5))
+        version = self.pathfinder.version
+        self.tiles.set_walkable(10, 15, False)
+        self.assertGreater(self.pathfinder.version, version)
+        self.assertIsNone(self.pathfinder.find_path((5, 5), (15, 5)))
+
+    def test_type_change_keeps_cache(self):
+        """Changing only the tile type leaves cached paths and fields alone."""
+        path = self.pathfinder.find_path((5, 5), (15, 5))
+        field = self.pathfinder.flow_field((15, 5))
+        version = self.pathfinder.version
+        self.tiles.set_type(12, 5, "dirt")
+        self.assertEqual(self.pathfinder.version, version)
+        self.assertEqual(self.pathfinder.find_path((5, 5), (15, 5)), path)
+        self.assertEqual(self.pathfinder.stats["cache_hits"], 1)
+        self.assertIs(self.pathfinder.flow_field((15, 5)), field)
+
+    def test_change_outside_window_keeps_cache(self):
+        """Walkability changes outside a search window keep that entry."""
+        tiles = TileGrid(200, 20)
+        pathfinder = Pathfinder(tiles, region_size=4, search_margin=4, flow_radius=8)
+        pathfinder.find_path((5, 5), (10, 5))
+        field = pathfinder.flow_field((10, 5))
+        tiles.set_walkable(150, 5, False)
+        self.assertEqual(pathfinder.version, 0)
+        self.assertIs(pathfinder.flow_field((10, 5)), field)
+
+        tiles.set_walkable(8, 8, False)
+        self.assertEqual(pathfinder.version, 1)
+        self.assertIsNot(pathfinder.flow_field((10, 5)), field)
+        pathfinder.find_path((5, 5), (10, 5))
+        self.assertEqual(pathfinder.stats["cache_hits"], 0)
+
+    def test_flow_field(self):
+        """Flow fields lead any reachable tile to the goal."""
+        field = self.pathfinder.flow_field((15, 5))
+        self.assertIs(self.pathfinder.flow_field((15, 5)), field)
+        tile = (2, 2)
+        for _ in range(100):
+            step = field.next_tile(*tile)
+            if step is None:
+                break
+            tile = step
+        self.assertEqual(tile, (15, 5))
+        self.assertEqual(field.distance(10, 0), -1)
+
+    def test_flow_field_cache_is_bounded(self):
+        """Flow fields for many goals are evicted least recently used first."""
+        pathfinder = Pathfinder(self.tiles, field_cache_size=2)
+        first = pathfinder.flow_field((15, 5))
+        pathfinder.flow_field((15, 6))
+        pathfinder.flow_field((15, 5))
+        pathfinder.flow_field((15, 7))
+        self.assertEqual(len(pathfinder._fields), 2)
+        self.assertIs(pathfinder.flow_field((15, 5)), first)
+        self.assertNotIn((15, 6), pathfinder._fields)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.engine.profiler`."""
+
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygame
+
+from verdes.engine.profiler import FrameProfiler
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Tests for section timing, percentiles and trace export."""
+
+    def test_percentiles_over_rolling_window(self):
+        """Only the last `window` samples count towards the percentiles."""
+        profiler = FrameProfiler(window=100)
+        for _ in range(50):
+            profiler.record("world.draw", 0, 50_000_000)  # 50 ms, pushed out below
+        for i in range(100):
+            profiler.record("world.draw", 0, (i + 1) * 1_000_000)
+        p50, p95, p99 = profiler.percentiles("world.draw")
+        self.assertAlmostEqual(p50, 50.5, places=3)
+        self.assertAlmostEqual(p95, 95.05, places=3)
+        self.assertLessEqual(p99, 100.0)
+        self.assertEqual(profiler.stats()[0][0], "world.draw")
+
+    def test_sections_and_trace_export(self):
+        """Sections record durations and become complete events in the trace."""
+        profiler = FrameProfiler()
+        profiler.start_trace()
+        profiler.begin_frame()
+        with profiler.section("time"):
+            pass
+        with profiler.section("time"):
+            pass
+        profiler.end_frame()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = profiler.export_trace(Path(tmp) / "trace.json")
+            with open(path, encoding="utf-8") as f:
+                events = json.load(f)["traceEvents"]
+        self.assertFalse(profiler.tracing)
+        self.assertEqual(profiler.last_trace, path)
+        self.assertEqual([e["name"] for e in events], ["time", "time", "frame"])
+        self.assertTrue(all(e["ph"] == "X" and e["dur"] >= 0 for e in events))
+
+    def test_disabled_profiler_records_nothing(self):
+        """A disabled profiler hands out a no-op section."""
+        profiler = FrameProfiler(enabled=False)
+        with profiler.section("hud.draw"):
+            pass
+        self.assertEqual(profiler.stats(), [])
+
+    def test_overlay_draws(self):
+        """The overlay renders onto a plain surface."""
+        pygame.font.init()
+        profiler = FrameProfiler()
+        profiler.record("frame", 0, 16_000_000)
+        surface = pygame.Surface((300, 200))
+        surface.fill((255, 255, 255))
+        profiler.draw(surface)
+        self.assertNotEqual(tuple(surface.get_at((12, 32)))[:3], (255, 255, 255))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.engine.quality`."""
+
+
+import unittest
+
+from verdes.engine.quality import QUALITY_TIERS, QualityGovernor
+
+
+def feed(governor, frame_ms, frames, dt=1 / 60):
+    """Feed the same frame time for a number of frames, return level changes."""
+    return sum(governor.update(frame_ms, dt) for _ in range(frames))
+
+
+class TestQualityGovernor(unittest.TestCase):
+    """Tests for the frame-budget quality governor."""
+
+    def test_downgrades_when_over_budget(self):
+        """Sustained slow frames step the tier down one level at a time."""
+        governor = QualityGovernor(target_fps=60, window=30)
+        self.assertEqual(feed(governor, 30.0, 59), 0)  # Waits for the downgrade delay
+        self.assertEqual(feed(governor, 30.0, 1), 1)
+        self.assertEqual(governor.level, 1)
+        feed(governor, 30.0, 600)
+        self.assertEqual(governor.level, len(QUALITY_TIERS) - 1)
+
+    def test_upgrades_only_with_headroom(self):
+        """Frames inside the hysteresis band hold the tier; fast frames raise it."""
+        governor = QualityGovernor(target_fps=60, window=30, level=2)
+        self.assertEqual(feed(governor, 14.0, 600), 0)
+        self.assertEqual(governor.level, 2)
+        feed(governor, 5.0, 300)
+        self.assertEqual(governor.level, 1)
+
+    def test_failed_upgrade_backs_off(self):
+        """Dropping right after an upgrade doubles the wait before retrying it."""
+        governor = QualityGovernor(target_fps=60, window=30, level=1,
+                                   downgrade_delay=0.5, upgrade_delay=1.0)
+        feed(governor, 5.0, 61)
+        self.assertEqual(governor.level, 0)
+        feed(governor, 30.0, 40)
+        self.assertEqual(governor.level, 1)
+        self.assertEqual(governor._upgrade_delays[1], 2.0)
+
+    def test_listener_and_disabled(self):
+        """Listeners receive the new tier; a disabled governor never moves."""
+        tiers = []
+        governor = QualityGovernor(window=10, downgrade_delay=0)
+        governor.add_listener(tiers.append)
+        feed(governor, 50.0, 10)
+        self.assertEqual(tiers, [QUALITY_TIERS[1]])
+
+        governor = QualityGovernor(window=10, downgrade_delay=0, enabled=False)
+        self.assertEqual(feed(governor, 50.0, 100), 0)
+        self.assertFalse(governor.update(None, 1 / 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
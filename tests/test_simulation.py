@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.simulation`."""
+
+
+import os
+import tempfile
+import unittest
+
+from verdes.simulation import Simulation
+
+
+CONFIG = {
+    "display": {"width": 320, "height": 240},
+    "world": {"width": 24, "height": 18, "seed": 3},
+}
+
+
+class TestSimulation(unittest.TestCase):
+    """Tests for the headless fixed-step loop."""
+
+    def setUp(self):
+        """Run inside a scratch directory so generated maps stay out of the tree."""
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        """Leave the scratch directory."""
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_days_grow_crops_without_display(self):
+        """Stepping past day rollovers grows crops and moves NPCs."""
+        simulation = Simulation(CONFIG, seed=7)
+        try:
+            world = simulation.world
+            planted = world.plant_area("turnip", 0, 0, world.width, world.height, limit=4)
+            self.assertEqual(planted, 4)
+            world.water_area(0, 0, world.width, world.height)
+            start = [(npc.x, npc.y) for npc in simulation.npcs]
+
+            summary = simulation.run_days(1)
+            self.assertEqual(summary["days"], 1)
+            self.assertEqual(summary["crops"], 4)
+            self.assertTrue(all(crop["growth_stage"] == 1 for crop in world.crops))
+            self.assertNotEqual([(npc.x, npc.y) for npc in simulation.npcs], start)
+        finally:
+            simulation.close()
+        self.assertFalse(os.path.exists("data/maps/farm.vmap.journal"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.spatial_index`."""
+
+
+import unittest
+
+from verdes.world.spatial_index import SpatialIndex
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """Tests for the tile-keyed spatial hash."""
+
+    def setUp(self):
+        """Fill an index with a diagonal of entries."""
+        self.index = SpatialIndex(cell_size=4)
+        for i in range(20):
+            self.index.insert(i, i, {"x": i, "y": i})
+
+    def test_point_lookup(self):
+        """Entries are found by tile and replaced on reinsert."""
+        self.assertEqual(self.index.get(3, 3), {"x": 3, "y": 3})
+        self.assertIsNone(self.index.get(3, 4))
+        self.index.insert(3, 3, {"x": 3, "y": 3, "tag": 1})
+        self.assertEqual(len(self.index), 20)
+        self.assertEqual(self.index.get(3, 3)["tag"], 1)
+
+    def test_remove(self):
+        """Removed entries disappear from point and area queries."""
+        self.assertIsNotNone(self.index.remove(5, 5))
+        self.assertIsNone(self.index.remove(5, 5))
+        self.assertNotIn((5, 5), self.index)
+        self.assertEqual([e["x"] for e in self.index.query_rect(4, 4, 6, 6)], [4, 6])
+
+    def test_rect_query(self):
+        """Rectangle queries are inclusive on both corners."""
+        found = sorted(e["x"] for e in self.index.query_rect(2, 0, 9, 7))
+        self.assertEqual(found, [2, 3, 4, 5, 6, 7])
+        self.assertEqual(len(self.index.query_rect(-100, -100, 100, 100)), 20)
+
+    def test_radius_query(self):
+        """Radius queries use euclidean distance in tiles."""
+        found = sorted(e["x"] for e in self.index.query_radius(10, 10, 1.5))
+        self.assertEqual(found, [9, 10, 11])
+
+
+if __name__ == "__main__":
+    unittest.main()
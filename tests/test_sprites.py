@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.engine.sprites`."""
+
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygame
+
+from verdes.engine.sprites import SpriteRegistry
+
+
+class TestSpriteRegistry(unittest.TestCase):
+    """Tests for sprite key resolution and caching."""
+
+    def setUp(self):
+        """Write a seasonless grass tile, a spring tree and a default character."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name) / "images"
+        for name, color in {"tiles/grass.png": (0, 200, 0), "objects/tree_spring.png": (0, 90, 0),
+                            "objects/tree.png": (0, 60, 0),
+                            "characters/default_down.png": (0, 0, 200)}.items():
+            path = self.base / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            surface = pygame.Surface((8, 8))
+            surface.fill(color)
+            pygame.image.save(surface, str(path))
+        self.registry = SpriteRegistry(self.base, atlas_path=Path(self._tmp.name) / "no_atlas.json")
+
+    def tearDown(self):
+        """Remove the scratch assets."""
+        self._tmp.cleanup()
+
+    def color(self, key):
+        """RGB of the resolved sprite's top-left pixel."""
+        return tuple(self.registry.get(key).get_at((0, 0)))[:3]
+
+    def test_candidate_fallback_chain(self):
+        """Specific files win; missing ones fall back along the candidate list."""
+        self.assertEqual(self.color(("object", "tree", "spring")), (0, 90, 0))
+        self.assertEqual(self.color(("object", "tree", "winter")), (0, 60, 0))
+        self.assertEqual(self.color(("tile", "grass", "fall")), (0, 200, 0))
+        self.assertEqual(self.color(("character", "farmer", "down")), (0, 0, 200))
+        self.assertEqual(self.registry.candidates(("object", "rock", "spring")),
+                         [self.base / "objects" / "rock.png"])
+        with self.assertRaises(KeyError):
+            self.registry.candidates(("sound", "x"))
+
+    def test_missing_sprites_are_cached(self):
+        """A missing sprite is resolved once, cached as None and reported by is_missing."""
+        key = ("crop", "turnip", 3)
+        self.assertFalse(self.registry.is_missing(key))
+        self.assertIsNone(self.registry.get(key))
+        self.assertTrue(self.registry.is_missing(key))
+
+        # The miss is remembered: a file appearing later is not looked up again
+        path = self.base / "crops" / "turnip_3.png"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pygame.image.save(pygame.Surface((8, 8)), str(path))
+        self.assertIsNone(self.registry.get(key))
+        self.registry.clear()
+        self.assertIsNotNone(self.registry.get(key))
+        self.assertFalse(self.registry.is_missing(("tile", "grass", "spring")))
+
+    def test_preload_without_convert(self):
+        """preload(convert=False) decodes into the cache without converting."""
+        keys = [("tile", "grass", "spring"), ("crop", "turnip", 0)]
+        self.assertEqual(self.registry.preload(keys, convert=False), 1)
+        self.assertFalse(self.registry._converted[keys[0]])
+        self.assertTrue(self.registry.is_missing(keys[1]))
+        surface = self.registry._cache[keys[0]]
+        self.assertIs(self.registry.get(keys[0]), surface)  # No display: stays unconverted
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.ui.text_cache`."""
+
+
+import unittest
+
+import pygame
+
+from verdes.ui.text_cache import TextCache
+from verdes.ui.ui_manager import Label
+
+
+class TestTextCache(unittest.TestCase):
+    """Tests for the rendered-text surface cache."""
+
+    def test_same_key_reuses_surface(self):
+        """Rendering the same text twice returns the cached surface."""
+        cache = TextCache()
+        first = cache.render("Gün 1", 20, "white")
+        second = cache.render("Gün 1", 20, (255, 255, 255))
+        self.assertIs(first, second)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIsNot(cache.render("Gün 1", 20, "red"), first)
+        self.assertIsNot(cache.render("Gün 1", 16, "white"), first)
+
+    def test_lru_eviction(self):
+        """The least recently used entry is dropped once the bound is hit."""
+        cache = TextCache(max_entries=2)
+        a = cache.render("a")
+        cache.render("b")
+        cache.render("a")
+        cache.render("c")
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.render("a"), a)
+        misses = cache.misses
+        cache.render("b")
+        self.assertEqual(cache.misses, misses + 1)
+
+    def test_shadow_and_draw(self):
+        """Shadowed text grows by the offset and draw honours the anchor."""
+        cache = TextCache()
+        plain = cache.render("Para", 16, "white")
+        shadowed = cache.render("Para", 16, "white", shadow=(1, 1))
+        self.assertEqual(shadowed.get_width(), plain.get_width() + 1)
+        self.assertEqual(shadowed.get_height(), plain.get_height() + 1)
+        target = pygame.Surface((200, 50))
+        rect = cache.draw(target, "Para", 16, "white", topright=(190, 10))
+        self.assertEqual(rect.topright, (190, 10))
+
+    def test_label_renders_through_cache(self):
+        """Labels size themselves and draw without re-rendering unchanged text."""
+        label = Label(0, 0, "Merhaba", font_size=18)
+        size = (label.width, label.height)
+        self.assertGreater(size[0], 0)
+        label.set_text("Merhaba")
+        self.assertEqual((label.width, label.height), size)
+        self.assertIs(label._render(), label._render())
+
+
+if __name__ == "__main__":
+    unittest.main()
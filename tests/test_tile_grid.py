@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.tile_grid`."""
+
+
+import unittest
+
+from verdes.world.tile_grid import TileGrid
+
+
+class TestTileGrid(unittest.TestCase):
+    """Tests for the array-backed tile grid."""
+
+    def setUp(self):
+        """Set up a small grid."""
+        self.grid = TileGrid(4, 3)
+
+    def test_defaults(self):
+        """New grids are walkable grass."""
+        self.assertEqual(self.grid.type_at(3, 2), "grass")
+        self.assertTrue(self.grid.is_walkable(0, 0))
+        self.assertEqual(self.grid.types.shape, (3, 4))
+
+    def test_set_type_extends_palette(self):
+        """Unknown tile types are added to the palette."""
+        self.grid.set_type(1, 2, "water")
+        self.assertEqual(self.grid.type_at(1, 2), "water")
+        self.assertIn("water", self.grid.palette)
+
+    def test_dict_style_access(self):
+        """`grid[y][x]["type"]` keeps working for old callers."""
+        self.grid[1][2]["type"] = "dirt"
+        self.grid[1][2]["walkable"] = False
+        self.assertEqual(self.grid.type_at(2, 1), "dirt")
+        self.assertFalse(self.grid[1][2]["walkable"])
+        with self.assertRaises(IndexError):
+            self.grid[3]
+
+    def test_rows_round_trip(self):
+        """Conversion to and from the YAML row format is lossless."""
+        self.grid.set_type(0, 0, "dirt")
+        self.grid.set_walkable(3, 2, False)
+        rows = self.grid.to_rows()
+        copy = TileGrid.from_rows(rows, 4, 3)
+        self.assertEqual(copy.to_rows(), rows)
+        self.assertEqual(rows[0][0], {"type": "dirt", "walkable": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
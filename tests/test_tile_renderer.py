@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.tile_renderer`."""
+
+
+import unittest
+
+import pygame
+
+from verdes.world.tile_grid import TileGrid
+from verdes.world.tile_renderer import DEFAULT_TILE_COLOR, TILE_COLORS, TileLayerCache
+
+
+GRASS = TILE_COLORS["grass"]
+
+
+class TestTileLayerCache(unittest.TestCase):
+    """Tests for the per-season chunk surface cache."""
+
+    def setUp(self):
+        """Build a 20x12 grass grid drawn as 4x4-pixel tiles in 8x8-tile chunks."""
+        self.tiles = TileGrid(20, 12, ["grass", "stone"])
+        self.cache = TileLayerCache(self.tiles, tile_size=4, chunk_tiles=8, max_chunks=4)
+
+    def tearDown(self):
+        """Stop listening to the grid."""
+        self.cache.close()
+
+    def color(self, surface, tile_x, tile_y):
+        """RGB at the centre of a tile inside a chunk surface."""
+        return tuple(surface.get_at((tile_x * 4 + 2, tile_y * 4 + 2)))[:3]
+
+    def test_chunk_surface_contents(self):
+        """Chunks cover their tiles, edge chunks are clipped to the map."""
+        self.tiles.set_type(9, 1, "stone")
+        chunk = self.cache.get_chunk(1, 0, "spring")
+        self.assertEqual(chunk.get_size(), (8 * 4, 8 * 4))
+        self.assertEqual(self.color(chunk, 1, 1), DEFAULT_TILE_COLOR)
+        self.assertEqual(self.color(chunk, 0, 0), GRASS)
+
+        edge = self.cache.get_chunk(2, 1, "spring")
+        self.assertEqual(edge.get_size(), (4 * 4, 4 * 4))
+        self.assertIs(self.cache.get_chunk(2, 1, "spring"), edge)
+
+    def test_tile_change_invalidates_all_seasons(self):
+        """A tile edit drops its chunk in every season and leaves other chunks cached."""
+        spring = self.cache.get_chunk(0, 0, "spring")
+        winter = self.cache.get_chunk(0, 0, "winter")
+        neighbour = self.cache.get_chunk(1, 0, "spring")
+
+        self.tiles.set_type(3, 3, "stone")
+        self.assertEqual(len(self.cache), 1)
+        self.assertIs(self.cache.get_chunk(1, 0, "spring"), neighbour)
+        for season, old in (("spring", spring), ("winter", winter)):
+            chunk = self.cache.get_chunk(0, 0, season)
+            self.assertIsNot(chunk, old)
+            self.assertEqual(self.color(chunk, 3, 3), DEFAULT_TILE_COLOR)
+
+    def test_lru_bound(self):
+        """Only the most recently used chunks are kept and evicted ones are re-rendered."""
+        first = self.cache.get_chunk(0, 0, "spring")
+        for season in ("summer", "autumn", "winter"):
+            self.cache.get_chunk(0, 0, season)
+        self.cache.get_chunk(0, 0, "spring")  # Refresh: summer is now the oldest
+        self.cache.get_chunk(1, 0, "spring")
+        self.assertEqual(len(self.cache), 4)
+        self.assertIs(self.cache.get_chunk(0, 0, "spring"), first)
+
+        self.tiles.set_type(0, 0, "stone")  # Evicted summer must not break invalidation
+        self.assertEqual(len(self.cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
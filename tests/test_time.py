@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.systems.time`."""
+
+
+import unittest
+
+from verdes.systems.time import TimeSystem
+
+
+class TestTimeSystem(unittest.TestCase):
+    """Tests for day rollover events."""
+
+    def setUp(self):
+        """Record every day tick the time system reports."""
+        self.time = TimeSystem()
+        self.ticks = []
+        self.time.add_day_listener(self.ticks.append)
+
+    def test_rollover_notifies_listeners(self):
+        """Running past midnight reports a single new day."""
+        self.time.update(15)  # 18 in-game hours
+        self.assertEqual(self.time.day, 2)
+        self.assertEqual(self.ticks, [1])
+
+    def test_skip_days_is_one_call(self):
+        """Skipping days reports them in one call and rolls seasons over."""
+        self.time.skip_days(60)
+        self.assertEqual(self.ticks, [60])
+        self.assertEqual((self.time.day, self.time.season, self.time.hour), (5, 2, 6))
+
+    def test_sleep_after_midnight(self):
+        """Sleeping after midnight does not skip an extra day."""
+        self.time.hour = 2
+        self.time.sleep()
+        self.assertEqual((self.time.day, self.time.hour), (1, 6))
+        self.assertEqual(self.ticks, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.engine.timestep`."""
+
+
+import unittest
+
+from verdes.engine.camera import Camera
+from verdes.engine.timestep import FixedTimestep
+from verdes.entities.actor import Actor
+
+
+class TestFixedTimestep(unittest.TestCase):
+    """Tests for the fixed-step accumulator."""
+
+    def test_steps_independent_of_frame_rate(self):
+        """One simulated second yields the same tick count at 144 Hz and 20 Hz."""
+        fast, slow = FixedTimestep(30), FixedTimestep(30)
+        fast_steps = sum(fast.advance(1 / 144) for _ in range(144))
+        slow_steps = sum(slow.advance(1 / 20) for _ in range(20))
+        self.assertIn(fast_steps, (29, 30))
+        self.assertIn(slow_steps, (29, 30))
+        self.assertGreaterEqual(fast.alpha, 0.0)
+        self.assertLessEqual(fast.alpha, 1.0)
+
+    def test_alpha_is_leftover_fraction(self):
+        """Leftover time below one tick is exposed as the interpolation factor."""
+        timestep = FixedTimestep(10)
+        self.assertEqual(timestep.advance(0.25), 2)
+        self.assertAlmostEqual(timestep.alpha, 0.5)
+
+    def test_max_steps_guard(self):
+        """A long hitch runs at most max_steps and drops the rest."""
+        timestep = FixedTimestep(30, max_steps=5)
+        self.assertEqual(timestep.advance(2.0), 5)
+        self.assertLess(timestep.accumulator, timestep.dt)
+        self.assertGreater(timestep.dropped, 1.5)
+        self.assertEqual(timestep.advance(0.0), 0)
+
+
+class TestInterpolation(unittest.TestCase):
+    """Tests for render interpolation between ticks."""
+
+    def test_actor_render_position(self):
+        """Actors are drawn between their previous and current tick positions."""
+        actor = Actor("test", 10, 20)
+        actor.store_previous()
+        actor.x, actor.y = 30, 40
+        self.assertEqual(actor.render_position(0.5), (20, 30))
+        self.assertEqual(actor.render_position(1.0), (30, 40))
+
+    def test_camera_interpolated_restores(self):
+        """The camera is moved only for the duration of the block."""
+        camera = Camera(100, 100)
+        camera.set_position(0, 0)
+        camera.x, camera.y = 10, 20
+        with camera.interpolated(0.25):
+            self.assertEqual((camera.x, camera.y), (2.5, 5.0))
+        self.assertEqual((camera.x, camera.y), (10, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.map`."""
+
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from verdes.entities.npc import NPC
+from verdes.entities.player import Player
+from verdes.world.crops import MAX_GROWTH_STAGE
+from verdes.world.generator import MapGenerator
+from verdes.world.map import World
+from verdes.world.map_format import MapData, write_map
+from verdes.world.tile_grid import TileGrid
+
+
+STREAMED_CONFIG = {
+    "display": {"width": 320, "height": 240},
+    "world": {"width": 64, "height": 48, "seed": None, "streaming": True, "chunk_size": 16},
+}
+
+
+class TestStreamedWorld(unittest.TestCase):
+    """Tests for streamed maps, their journal and their base file."""
+
+    def setUp(self):
+        """Work inside a scratch data/maps directory."""
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        """Leave the scratch directory."""
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def open_world(self, config=STREAMED_CONFIG):
+        """Open the streamed farm map."""
+        world = World("farm", config)
+        self.addCleanup(world.close)
+        return world
+
+    def test_random_seed_is_kept_between_launches(self):
+        """A map generated without a configured seed is rebuilt from the stored seed."""
+        first = self.open_world()
+        self.assertTrue(first.streaming)
+        seed = first.seed
+        objects = sorted((obj["x"], obj["y"]) for obj in first.objects)
+        first.close()
+
+        second = self.open_world()
+        self.assertEqual(second.seed, seed)
+        self.assertEqual(sorted((obj["x"], obj["y"]) for obj in second.objects), objects)
+
+
+    def test_objects_stay_inside_partial_last_band(self):
+        """Objects of a map whose height is not a chunk multiple stay on the map."""
+        world = self.open_world(dict(STREAMED_CONFIG, world=dict(STREAMED_CONFIG["world"],
+                                                                 width=100, height=70, seed=3)))
+        self.assertTrue(world.objects)
+        self.assertTrue(all(0 <= obj["x"] < world.width and 0 <= obj["y"] < world.height
+                            for obj in world.objects))
+
+    def test_objects_are_paged_with_chunks(self):
+        """Streamed worlds hold only resident chunks' objects, yet list the whole map's."""
+        config = dict(STREAMED_CONFIG, world=dict(STREAMED_CONFIG["world"], seed=4, max_chunks=2))
+        world = self.open_world(config)
+        expected = MapGenerator(64, 48, 4).generate().objects
+        self.assertEqual(world.object_index.resident_entries, 0)
+        self.assertEqual(sorted((o["x"], o["y"]) for o in world.objects),
+                         sorted((o["x"], o["y"]) for o in expected))
+        obj = expected[0]
+        self.assertEqual(world.object_index.get(obj["x"], obj["y"])["type"], obj["type"])
+        self.assertLess(world.object_index.resident_entries, len(expected))
+
+    def test_journal_from_other_seed_is_archived(self):
+        """Edits recorded against another seed are set aside instead of replayed."""
+        first = self.open_world(dict(STREAMED_CONFIG, world=dict(STREAMED_CONFIG["world"], seed=5)))
+        first.add_object("rock", 3, 3, False)
+        first.save()
+        first.close()
+
+        same = self.open_world(dict(STREAMED_CONFIG, world=dict(STREAMED_CONFIG["world"], seed=5)))
+        self.assertEqual(same.object_index.get(3, 3)["type"], "rock")
+        same.close()
+
+        other = self.open_world(dict(STREAMED_CONFIG, world=dict(STREAMED_CONFIG["world"], seed=6)))
+        self.assertTrue(os.path.exists("data/maps/farm.vmap.journal.stale"))
+        self.assertEqual(other.journal.stored_seed(), 6)
+        self.assertEqual(list(other.journal.entries(0)), [])
+
+    def test_compaction_reopens_streamed_base(self):
+        """Compacting a streamed binary map swaps in a freshly opened base file."""
+        tiles = TileGrid(64, 48, ["grass", "dirt"])
+        os.makedirs("data/maps")
+        write_map("data/maps/farm.vmap", MapData(64, 48, tiles, extra={"seed": 1}))
+        world = self.open_world(dict(STREAMED_CONFIG, world=dict(STREAMED_CONFIG["world"], seed=1)))
+        self.assertTrue(world.streaming)
+        old_file = world._map_file
+        world.tiles.set_type(40, 40, "dirt")
+
+        self.assertTrue(world.compact_map(background=False))
+        self.assertIsNot(world._map_file, old_file)
+        self.assertEqual(sorted(os.listdir("data/maps")), ["farm.vmap", "farm.vmap.journal"])
+        self.assertEqual(world._map_file.meta["tile_palette"][world._map_file.types[40, 40]], "dirt")
+        self.assertEqual(world.tiles.type_at(0, 0), "grass")
+
+
+AREA_CONFIG = {
+    "display": {"width": 320, "height": 240},
+    "world": {"width": 10, "height": 8, "seed": 1},
+}
+
+
+class TestAreaFarming(unittest.TestCase):
+    """Tests for the rectangle operations behind tool areas."""
+
+    def setUp(self):
+        """Open a 10x8 grass map with a rock at (2, 2)."""
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        os.makedirs("data/maps")
+        write_map("data/maps/farm.vmap", MapData(10, 8, TileGrid(10, 8, ["grass", "dirt"])))
+        self.world = World("farm", AREA_CONFIG)
+        self.world.add_object("rock", 2, 2, False)
+        self.journal = self.world.journal.pending
+        self.journal.clear()
+
+    def tearDown(self):
+        """Close the world and leave the scratch directory."""
+        self.world.close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def dirt_tiles(self):
+        """Set of tiles currently of type dirt."""
+        return {(x, y) for y in range(self.world.height) for x in range(self.world.width)
+                if self.world.tiles.type_at(x, y) == "dirt"}
+
+    def test_hoe_clips_masks_and_skips_blocked(self):
+        """Only in-map, masked, walkable grass is hoed, one journal entry per tile."""
+        mask = np.indices((5, 5)).sum(axis=0) % 2 == 0  # Checkerboard over (-2, -2)..(3, 3)
+        changed = self.world.hoe_area(-2, -2, 3, 3, mask)
+        expected = {(0, 0), (2, 0), (1, 1), (0, 2)}  # (2, 2) holds the rock
+        self.assertEqual(self.dirt_tiles(), expected)
+        self.assertEqual(changed, len(expected))
+        self.assertEqual(sorted((e["x"], e["y"]) for e in self.journal if e["op"] == "tile"),
+                         sorted(expected))
+        self.assertEqual(self.world.hoe_area(20, 20, 30, 30), 0)
+
+    def test_plant_water_harvest(self):
+        """Plant skips occupied and grass tiles; water and harvest journal their tiles."""
+        self.world.hoe_area(0, 0, 4, 1)
+        self.journal.clear()
+        self.assertEqual(self.world.plant_area("turnip", 0, 0, 6, 1), 4)
+        self.assertEqual(self.journal[-1]["op"], "crop_plant_tiles")
+        self.assertEqual(sorted(map(tuple, self.journal[-1]["tiles"])), [(x, 0) for x in range(4)])
+        self.assertEqual(self.world.plant_area("turnip", 0, 0, 6, 1), 0)
+
+        self.assertEqual(self.world.water_area(-5, -5, 2, 5), 2)
+        self.assertEqual(self.journal[-1]["op"], "crop_water_tiles")
+        self.assertEqual(sorted(map(tuple, self.journal[-1]["tiles"])), [(0, 0), (1, 0)])
+
+        self.world.crop_index.get(3, 0)["growth_stage"] = MAX_GROWTH_STAGE
+        self.assertEqual(self.world.harvest_area(0, 0, 10, 1), {"turnip": 1})
+        self.assertEqual(self.journal[-1], {"op": "crop_remove_tiles", "tiles": [[3, 0]]})
+        self.assertNotIn((3, 0), self.world.crop_index)
+
+    def test_tools_cost_energy(self):
+        """Each tool use charges the tool's energy cost once, whatever the area."""
+        player = Player(*self.world.tile_center(4, 2))
+        player.world = self.world
+        player.direction = "down"
+        inventory = player.inventory
+        slots = {slot.item.id: index for index, slot in enumerate(inventory.slots) if slot.item}
+
+        inventory.select_slot(slots["tool_hoe"])
+        cost = inventory.get_selected_slot().item.energy_cost
+        self.assertTrue(player.use_tool("tool_hoe"))
+        self.assertEqual(player.energy, player.max_energy - cost)
+        self.assertEqual(self.dirt_tiles(), {(4, 3)})
+
+        self.world.plant_area("turnip", 4, 3, 5, 4)
+        self.world.crop_index.get(4, 3)["growth_stage"] = MAX_GROWTH_STAGE
+        inventory.select_slot(slots["tool_scythe"])
+        energy = player.energy
+        self.assertTrue(player.use_tool("tool_scythe"))
+        self.assertEqual(player.energy, energy - inventory.get_selected_slot().item.energy_cost)
+        self.assertNotIn((4, 3), self.world.crop_index)
+        self.assertIn("crop_turnip", [slot.item.id for slot in inventory.slots if slot.item])
+
+        player.energy = 0
+        self.assertFalse(player.use_tool("tool_scythe"))
+
+
+class TestNPCReplanning(unittest.TestCase):
+    """Tests for NPCs following paths across map edits."""
+
+    def setUp(self):
+        """Open an empty 10x8 grass map."""
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        os.makedirs("data/maps")
+        write_map("data/maps/farm.vmap", MapData(10, 8, TileGrid(10, 8, ["grass"])))
+        self.world = World("farm", AREA_CONFIG)
+
+    def tearDown(self):
+        """Close the world and leave the scratch directory."""
+        self.world.close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_blocked_path_is_replanned(self):
+        """An obstacle dropped on the planned path makes the NPC plan around it."""
+        npc = NPC("Ayşe", *self.world.tile_center(0, 4))
+        npc.world = self.world
+        self.assertTrue(npc.set_destination(*self.world.tile_center(9, 4)))
+        self.assertIn((5, 4), npc.path)
+
+        self.world.add_object("rock", 5, 4, False)
+        self.assertNotEqual(npc.path_version, self.world.pathfinder.version)
+        npc._move_to_target(0.01)
+        self.assertEqual(npc.path_version, self.world.pathfinder.version)
+        self.assertNotIn((5, 4), npc.path)
+        self.assertEqual(npc.path[-1], (9, 4))
+
+        # Hoeing only changes the tile type and keeps the plan
+        self.world.tiles.set_type(0, 0, "dirt")
+        self.assertEqual(npc.path_version, self.world.pathfinder.version)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+"""Tests for `verdes.world.world_manager`."""
+
+
+import os
+import tempfile
+import unittest
+
+from verdes.world.map_format import MapData, write_map
+from verdes.world.generator import MapGenerator
+from verdes.world.world_manager import WorldManager
+
+
+CONFIG = {
+    "display": {"width": 320, "height": 240},
+    "world": {"width": 16, "height": 12, "seed": 1, "max_loaded_maps": 2, "preload_distance": 3},
+}
+
+
+class TestWorldManager(unittest.TestCase):
+    """Tests for LRU residency and warp preloading."""
+
+    def setUp(self):
+        """Write three small maps into a scratch data/maps directory."""
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        os.makedirs("data/maps")
+        for index, name in enumerate(("farm", "town", "mine")):
+            data = MapGenerator(16, 12, seed=index).generate()
+            if name == "farm":
+                data.extra["warps"] = [{"x": 15, "y": 6, "target": "town", "target_x": 0, "target_y": 6}]
+            write_map(f"data/maps/{name}.vmap", data)
+        self.manager = WorldManager(CONFIG)
+
+    def tearDown(self):
+        """Close every world and leave the scratch directory."""
+        self.manager.close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_discovers_maps(self):
+        """Every map file under data/maps is listed once."""
+        self.assertEqual(self.manager.available_maps(), ["farm", "mine", "town"])
+
+    def test_lru_keeps_active_world(self):
+        """Loading past the limit evicts the oldest non-active world."""
+        farm = self.manager.set_active("farm")
+        self.manager.get("town")
+        self.manager.get("mine")
+        self.assertTrue(self.manager.is_loaded("farm"))
+        self.assertFalse(self.manager.is_loaded("town"))
+        self.assertIs(self.manager.get("farm"), farm)
+
+    def test_warp_preloads_target(self):
+        """Nearing a warp loads its target; stepping onto it returns the warp."""
+        self.manager.set_active("farm")
+        self.assertIsNone(self.manager.update(2, 6))
+        self.assertNotIn("town", self.manager._loading)
+        self.assertIsNone(self.manager.update(13, 6))
+        self.assertIn("town", self.manager._loading)
+        warp = self.manager.update(15, 6)
+        self.assertEqual(warp["target"], "town")
+        town = self.manager.set_active("town")
+        self.assertIs(self.manager.active, town)
+        self.assertIsNone(self.manager.update(0, 6))
+
+    def test_missed_days_applied_on_load(self):
+        """Days that pass while a map is unloaded are applied when it loads."""
+        self.manager.set_active("farm")
+        self.manager.advance_days(2)
+        self.assertEqual(self.manager._pending_days["town"], 2)
+        self.manager.get("town")
+        self.assertNotIn("town", self.manager._pending_days)
+
+
+if __name__ == "__main__":
+    unittest.main()
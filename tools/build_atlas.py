@@ -0,0 +1,33 @@
+"""
+Atlas oluşturucu - assets/images altındaki sprite'ları doku atlası sayfalarına paketler.
+
+Kullanım:
+    python tools/build_atlas.py
+    python tools/build_atlas.py --source assets/images --output assets/atlas --size 2048
+"""
+import sys
+import os
+import argparse
+
+# src klasörünü Python yoluna ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from verdes.engine.atlas import ATLAS_DIRECTORIES, build_atlas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verde doku atlası oluşturucu")
+    parser.add_argument("--source", default="assets/images", help="Sprite klasörü")
+    parser.add_argument("--output", default="assets/atlas", help="Atlas sayfalarının yazılacağı klasör")
+    parser.add_argument("--size", type=int, default=1024, help="Sayfa kenar uzunluğu (piksel)")
+    parser.add_argument("--padding", type=int, default=1, help="Sprite'lar arası boşluk (piksel)")
+    parser.add_argument("--dirs", nargs="+", default=list(ATLAS_DIRECTORIES),
+                        help="Paketlenecek alt klasörler")
+    args = parser.parse_args()
+    
+    index = build_atlas(args.source, args.output, args.dirs, args.size, args.padding)
+    print(f"{len(index['sprites'])} sprite -> {len(index['sheets'])} sayfa ({args.output})")
+
+
+if __name__ == "__main__":
+    main()
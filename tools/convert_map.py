@@ -0,0 +1,39 @@
+"""
+Harita dönüştürücü - YAML ve ikili (.vmap) harita biçimleri arasında çeviri.
+
+Kullanım:
+    python tools/convert_map.py data/maps/farm.yaml data/maps/farm.vmap
+    python tools/convert_map.py data/maps/farm.vmap data/maps/farm.yaml
+"""
+import sys
+import os
+import argparse
+from pathlib import Path
+
+# src klasörünü Python yoluna ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from verdes.world.map_format import binary_to_yaml, yaml_to_binary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verde harita biçimi dönüştürücü")
+    parser.add_argument("source", help="Kaynak harita (.yaml veya .vmap)")
+    parser.add_argument("target", help="Hedef harita (.vmap veya .yaml)")
+    args = parser.parse_args()
+    
+    source = Path(args.source)
+    target = Path(args.target)
+    
+    if source.suffix in (".yaml", ".yml") and target.suffix == ".vmap":
+        yaml_to_binary(source, target)
+    elif source.suffix == ".vmap" and target.suffix in (".yaml", ".yml"):
+        binary_to_yaml(source, target)
+    else:
+        parser.error("Desteklenen dönüşümler: .yaml -> .vmap ve .vmap -> .yaml")
+    
+    print(f"{source} -> {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,6 @@ Dünya editörü aracı - haritaları düzenlemek için.
 import sys
 import os
 import pygame
-import yaml
 from pathlib import Path
 
 # src klasörünü Python yoluna ekle
@@ -36,9 +35,9 @@ BROWN = (139, 69, 19)
 class WorldEditor:
     """Dünya editörü sınıfı"""
     
-    def __init__(self):
+    def __init__(self, map_name="farm"):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Verde World Editor")
+        pygame.display.set_caption(f"Verde World Editor - {map_name}")
         self.clock = pygame.time.Clock()
         self.running = True
         
@@ -56,7 +55,7 @@ class WorldEditor:
         self.config = {"display": {"width": SCREEN_WIDTH, "height": SCREEN_HEIGHT}}
         
         # Dünya yükle veya oluştur
-        self.world = World("farm", self.config)
+        self.world = World(map_name, self.config)
         
         # Yazı tipi
         self.font = pygame.font.Font(None, 24)
@@ -84,6 +83,9 @@ class WorldEditor:
             
             # Ekranı güncelle
             pygame.display.flip()
+        
+        # Süren arka plan kaydının bitmesini bekle
+        self.world.close()
     
     def handle_events(self):
         """Kullanıcı girişlerini işle"""
@@ -181,41 +183,23 @@ class WorldEditor:
         if 0 <= tile_x < self.world.width and 0 <= tile_y < self.world.height:
             if self.current_tool == "tile":
                 # Tile türünü değiştir
-                self.world.tiles[tile_y][tile_x]["type"] = self.current_tile_type
-                self.world.tiles[tile_y][tile_x]["walkable"] = True  # Varsayılan olarak yürünebilir
+                self.world.tiles.set_type(tile_x, tile_y, self.current_tile_type)
+                self.world.tiles.set_walkable(tile_x, tile_y, True)  # Varsayılan olarak yürünebilir
             
             elif self.current_tool == "object":
-                # Objeler için walkable değerini güncelleme
-                self.world.tiles[tile_y][tile_x]["walkable"] = False
-                
-                # Mevcut bir nesne var mı kontrol et
-                for i, obj in enumerate(self.world.objects):
-                    if obj["x"] == tile_x and obj["y"] == tile_y:
-                        # Varsa, türünü değiştir
-                        self.world.objects[i]["type"] = self.current_object_type
-                        return
-                
-                # Yoksa, yeni nesne ekle
-                self.world.objects.append({
-                    "type": self.current_object_type,
-                    "x": tile_x,
-                    "y": tile_y,
-                    "walkable": False
-                })
+                # Nesne yerleştir (varsa türünü değiştir, tile yürünemez olur)
+                self.world.add_object(self.current_object_type, tile_x, tile_y)
             
             elif self.current_tool == "erase":
-                # Nesneleri sil
-                self.world.objects = [obj for obj in self.world.objects if obj["x"] != tile_x or obj["y"] != tile_y]
-                
-                # Tile'ı yürünebilir yap
-                self.world.tiles[tile_y][tile_x]["walkable"] = True
+                # Nesneyi sil ve tile'ı yürünebilir yap
+                self.world.remove_object_at(tile_x, tile_y)
     
     def draw_map(self):
         """Haritayı çiz"""
         # Tile'ları çiz
         for y in range(self.world.height):
             for x in range(self.world.width):
-                tile = self.world.tiles[y][x]
+                tile_type = self.world.tiles.type_at(x, y)
                 
                 # Ekran koordinatlarını hesapla
                 screen_x = x * TILE_SIZE - self.camera_x
@@ -225,7 +209,7 @@ class WorldEditor:
                 if (-TILE_SIZE <= screen_x <= SCREEN_WIDTH and 
                     -TILE_SIZE <= screen_y <= SCREEN_HEIGHT):
                     # Tile arka planı
-                    if tile["type"] == "grass":
+                    if tile_type == "grass":
                         color = (100, 200, 100)  # Yeşil
                     else:
                         color = (139, 69, 19)  # Kahverengi
@@ -236,7 +220,7 @@ class WorldEditor:
                     pygame.draw.rect(self.screen, (50, 50, 50), (screen_x, screen_y, TILE_SIZE, TILE_SIZE), 1)
                     
                     # Yürünebilirlik göstergesi (kırmızı çarpı işareti)
-                    if not tile["walkable"]:
+                    if not self.world.tiles.is_walkable(x, y):
                         pygame.draw.line(self.screen, RED, (screen_x, screen_y), (screen_x + TILE_SIZE, screen_y + TILE_SIZE), 2)
                         pygame.draw.line(self.screen, RED, (screen_x + TILE_SIZE, screen_y), (screen_x, screen_y + TILE_SIZE), 2)
         
@@ -339,30 +323,14 @@ class WorldEditor:
         self.screen.blit(text, text_rect)
     
     def save_map(self):
-        """Haritayı kaydet"""
+        """Haritayı kaydet (yalnızca değişiklikler günlüğe eklenir)"""
         try:
-            # Haritayı YAML formatında kaydet
-            map_path = Path(f"data/maps/{self.world.name}.yaml")
-            
-            # Dizini oluştur
-            map_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Verileri hazırla
-            data = {
-                "width": self.world.width,
-                "height": self.world.height,
-                "tiles": self.world.tiles,
-                "objects": self.world.objects
-            }
-            
-            # Dosyaya yaz
-            with open(map_path, "w", encoding="utf-8") as f:
-                yaml.dump(data, f, default_flow_style=False)
-            
-            print(f"Map saved to {map_path}")
+            self.world.save()
+            print(f"Map saved to data/maps/{self.world.name}.vmap")
         except Exception as e:
             print(f"Error saving map: {e}")
 
 if __name__ == "__main__":
-    editor = WorldEditor()
+    # Kullanım: python tools/world_editor.py [harita_adı]
+    editor = WorldEditor(sys.argv[1] if len(sys.argv) > 1 else "farm")
     editor.run()
\ No newline at end of file